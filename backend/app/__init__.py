@@ -38,6 +38,10 @@ def create_app():
     from config.settings import Config
     app.config.from_object(Config)
 
+    # JSON 직렬화 (orjson이 있으면 사용, jsonify/get_json 모두 적용)
+    from utils.json_provider import init_json
+    init_json(app)
+
     # ─────────────────────────────────────────────────
     # 5) CORS 설정
     origins = os.getenv('CORS_ORIGINS', '').split(',')
@@ -53,6 +57,14 @@ def create_app():
     # 6) DB 초기화
     init_db(app)
 
+    # 채팅 기록 지연 저장 (CHAT_WRITE_BEHIND일 때만 저장 스레드 시작, 남은 spill 파일 복구)
+    from utils.chat_writer import init_chat_writer
+    init_chat_writer(app)
+
+    # 채팅 보관 정책 (설정돼 있을 때만 주기적으로 오래된 채팅을 아카이브)
+    from utils.chat_archive import init_chat_archive
+    init_chat_archive(app)
+
     # ─────────────────────────────────────────────────
     # 7) Blueprint 등록
     register_blueprints(app)
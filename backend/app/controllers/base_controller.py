@@ -11,6 +11,7 @@
 
 from flask import request, jsonify
 from datetime import datetime
+from utils.response_utils import ndjson_response, wants_ndjson
 import logging
 import json
 
@@ -128,6 +129,14 @@ class BaseController:
         
         return jsonify(response_data), status
     
+    def wants_stream(self):
+        """NDJSON 스트리밍 응답 요청 여부 (?format=ndjson 또는 Accept: application/x-ndjson)"""
+        return wants_ndjson(request)
+    
+    def stream_response(self, records, serialize=None, filename=None):
+        """NDJSON 스트리밍 응답 (한 줄에 레코드 하나, 결과 크기와 무관하게 메모리 일정)"""
+        return ndjson_response(records, serialize=serialize, filename=filename)
+    
     def error_response(self, message="오류가 발생했습니다", details=None, status=500):
         """에러 응답 생성"""
         response_data = {
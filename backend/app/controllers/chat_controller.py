@@ -204,6 +204,58 @@ class ChatController(BaseController):
                 status=500
             )
     
+    def start_rag_migration(self):
+        """임베딩 모델 온라인 마이그레이션 시작"""
+        self.log_request("rag_migration_start")
+        
+        data, error = self.get_json_data(['model'])
+        if error:
+            return error
+        
+        try:
+            result = self.chat_service.start_rag_migration(data['model'])
+            
+            if result["success"]:
+                return self.success_response(
+                    data=result.get("migration"),
+                    message=result["message"],
+                    status=202
+                )
+            else:
+                return self.error_response(
+                    message="임베딩 마이그레이션 시작 실패",
+                    details=result["message"],
+                    status=409
+                )
+                
+        except ValueError as e:
+            return self.validation_error("model", str(e))
+        except Exception as e:
+            return self.error_response(
+                message="임베딩 마이그레이션 시작 실패",
+                details=str(e),
+                status=500
+            )
+    
+    def get_rag_migration_status(self):
+        """임베딩 모델 마이그레이션 진행 상황"""
+        self.log_request("rag_migration_status")
+        
+        try:
+            status = self.chat_service.get_rag_migration_status()
+            
+            return self.success_response(
+                data=status,
+                message="마이그레이션 상태 조회 완료"
+            )
+            
+        except Exception as e:
+            return self.error_response(
+                message="마이그레이션 상태 조회 실패",
+                details=str(e),
+                status=500
+            )
+    
     # =========================
     # 채팅 히스토리 기능 (완전 구현)
     # =========================
@@ -215,13 +267,16 @@ class ChatController(BaseController):
         try:
             # ✅ GET 요청에서 쿼리 파라미터 사용
             limit = request.args.get('limit', 50, type=int)
-            history = self.chat_service.get_chat_history(limit=limit)
+            cursor = request.args.get('cursor')
+            page = self.chat_service.get_chat_history_page(limit=limit, cursor=cursor)
             
             return self.success_response(
-                data={"history": history},
-                message=f"{len(history)}개의 채팅 기록을 조회했습니다"
+                data=page,
+                message=f"{len(page['history'])}개의 채팅 기록을 조회했습니다"
             )
             
+        except ValueError as e:
+            return self.validation_error("cursor", str(e))
         except Exception as e:
             return self.error_response(
                 message="채팅 히스토리 조회 실패",
@@ -248,6 +303,53 @@ class ChatController(BaseController):
                 status=500
             )
     
+    def archive_chat_history_endpoint(self):
+        """오래된 채팅을 월별 압축 아카이브로 옮기기 (본문의 retention_days/max_rows로 이번만 조정 가능)"""
+        self.log_request("archive_chat_history")
+        
+        data = request.get_json(silent=True) or {}
+        
+        try:
+            report = self.chat_service.archive_chat_history(
+                retention_days=data.get('retention_days'),
+                max_rows=data.get('max_rows')
+            )
+            
+            return self.success_response(
+                data=report,
+                message=report["skipped"] or f"{report['archived']}개의 채팅 기록을 아카이브했습니다"
+            )
+            
+        except ValueError as e:
+            return self.error_response(
+                message="잘못된 보관 정책 값",
+                details=str(e),
+                status=400
+            )
+        except Exception as e:
+            return self.error_response(
+                message="채팅 아카이브 실패",
+                details=str(e),
+                status=500
+            )
+    
+    def get_archive_status_endpoint(self):
+        """채팅 아카이브 상태"""
+        self.log_request("archive_status")
+        
+        try:
+            return self.success_response(
+                data=self.chat_service.get_archive_status(),
+                message="채팅 아카이브 상태 조회 완료"
+            )
+            
+        except Exception as e:
+            return self.error_response(
+                message="채팅 아카이브 상태 조회 실패",
+                details=str(e),
+                status=500
+            )
+    
     def search_chat_history_endpoint(self):
         """✅ 채팅 히스토리 검색 (완전 구현)"""
         self.log_request("search_chat_history")
@@ -299,6 +401,14 @@ class ChatController(BaseController):
             start_date = data.get('start_date')
             end_date = data.get('end_date')
             
+            # NDJSON 스트리밍: 기록을 DB 커서에서 나눠 읽으며 바로 전송
+            if self.wants_stream():
+                try:
+                    records = self.chat_service.iter_chat_history(start_date, end_date)
+                except ValueError as e:
+                    return self.validation_error("date_range", str(e))
+                return self.stream_response(records, filename="chat_history.ndjson")
+            
             result = self.chat_service.export_chat_history(start_date, end_date)
             
             if result["success"]:
@@ -326,7 +436,7 @@ class ChatController(BaseController):
         
         try:
             # GET 요청에서 쿼리 파라미터 사용
-            days = request.args.get('days', 7, type=int)
+            days = min(max(request.args.get('days', 7, type=int), 1), 365)
             
             summary = self.chat_service.get_chat_summary(days)
             
@@ -374,13 +484,10 @@ class ChatController(BaseController):
         self.log_request("advanced_stats")
         
         try:
-            # 기본 통계
-            basic_stats = self.chat_service.get_chat_stats()
-            
-            # 요약 통계 (여러 기간)
-            summaries = {}
-            for days in [1, 7, 30]:
-                summaries[f"{days}d"] = self.chat_service.get_chat_summary(days)
+            # 기본 통계 + 기간별 요약 (같은 집계 스냅숏에서 계산)
+            analytics = self.chat_service.get_chat_analytics((1, 7, 30))
+            basic_stats = analytics["basic_stats"]
+            summaries = analytics["period_summaries"]
             
             # RAG 통계
             rag_status = self.chat_service.get_rag_status()
@@ -721,6 +828,7 @@ class ChatController(BaseController):
         self.log_request("debug_info")
         
         try:
+            chat_stats = self.chat_service.get_chat_stats()
             debug_info = {
                 "system_status": {
                     "claude_api": bool(self.chat_service.api_key),
@@ -729,8 +837,8 @@ class ChatController(BaseController):
                     "database": True  # DB 연결은 기본적으로 있다고 가정
                 },
                 "recent_activity": {
-                    "total_chats": self.chat_service.get_chat_stats()["total_chats"],
-                    "today_chats": self.chat_service.get_chat_stats()["today_chats"]
+                    "total_chats": chat_stats["total_chats"],
+                    "today_chats": chat_stats["today_chats"]
                 },
                 "environment": {
                     "python_version": "3.8+",
@@ -9,10 +9,14 @@ BaseController + NoteService를 활용
 from flask import request
 from app.controllers.base_controller import BaseController
 from app.services.note_service import NoteService
+from utils.json_provider import loads as json_loads
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 일괄 가져오기에서 줄 단위 JSON으로 처리하는 Content-Type
+NDJSON_MIMETYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonl')
+
 
 class NoteController(BaseController):
     """노트 API 컨트롤러"""
@@ -31,16 +35,29 @@ class NoteController(BaseController):
             # 쿼리 파라미터 추출
             limit = request.args.get('limit', type=int)
             offset = request.args.get('offset', type=int)
+            cursor = request.args.get('cursor')
+            fields, error = self._parse_fields()
+            if error:
+                return error
             
-            # 노트 조회
-            notes = self.service.get_all_notes(limit=limit, offset=offset)
+            # 노트 조회: offset이 있으면 기존 방식, 없으면 커서(키셋) 페이지네이션
+            next_cursor = None
+            if offset is not None:
+                notes = self.service.get_all_notes(limit=limit, offset=offset, fields=fields)
+            else:
+                try:
+                    notes, next_cursor = self.service.get_notes_page(limit=limit, cursor=cursor, fields=fields)
+                except ValueError as e:
+                    return self.validation_error("cursor", str(e))
             
             # 응답 데이터 구성
             response_data = {
-                "notes": [self._note_to_dict(note) for note in notes],
+                "notes": [self._note_to_dict(note, fields) for note in notes],
                 "total": len(notes),
                 "limit": limit,
-                "offset": offset
+                "offset": offset,
+                "next_cursor": next_cursor,
+                "has_more": next_cursor is not None
             }
             
             return self.success_response(
@@ -63,7 +80,7 @@ class NoteController(BaseController):
         self.log_request(f"get_note/{note_id}")
         
         try:
-            note = self.service.get_note_by_id(note_id)
+            note = self.service.get_note_data(note_id)
             
             return self.success_response(
                 data={"note": self._note_to_dict(note)},
@@ -79,6 +96,19 @@ class NoteController(BaseController):
                 status=500
             )
     
+    def stream_notes(self, fields=None):
+        """
+        GET /api/notes?format=ndjson
+        노트 목록 스트리밍 (한 줄에 노트 하나, 최신순)
+        """
+        self.log_request("stream_notes")
+        
+        limit = request.args.get('limit', type=int)
+        return self.stream_response(
+            self.service.iter_notes(limit=limit, fields=fields),
+            serialize=lambda note: self._note_to_dict(note, fields)
+        )
+    
     def create_note(self):
         """
         POST /api/notes
@@ -199,18 +229,30 @@ class NoteController(BaseController):
             
             query = data.get('query')
             tags = data.get('tags')
+            fields, error = self._parse_fields()
+            if error:
+                return error
+            
+            # 스트리밍 요청이면 limit이 없을 때 모든 결과를 보낸다
+            if self.wants_stream():
+                return self.stream_response(
+                    self.service.iter_search_notes(query=query, tags=tags, limit=data.get('limit'), fields=fields),
+                    serialize=lambda note: self._note_to_dict(note, fields)
+                )
+            
             limit = data.get('limit', 50)
             
             # 검색 실행
             results = self.service.search_notes(
                 query=query,
                 tags=tags,
-                limit=limit
+                limit=limit,
+                fields=fields
             )
             
             return self.success_response(
                 data={
-                    "notes": [self._note_to_dict(note) for note in results],
+                    "notes": [self._note_to_dict(note, fields) for note in results],
                     "total": len(results),
                     "query": query,
                     "tags": tags
@@ -225,15 +267,108 @@ class NoteController(BaseController):
                 status=500
             )
     
+    def import_notes(self):
+        """
+        POST /api/notes/import
+        노트 일괄 가져오기
+
+        - application/json: 노트 배열 또는 {"notes": [...]}
+        - application/x-ndjson: 한 줄에 노트 하나 (요청 본문을 줄 단위로 읽으며 처리)
+        """
+        self.log_request("import_notes")
+        
+        try:
+            batch_size = request.args.get('batch_size', type=int)
+            
+            if request.mimetype in NDJSON_MIMETYPES:
+                records = self._iter_ndjson(request.stream)
+            elif request.is_json:
+                data = request.get_json(silent=True)
+                if isinstance(data, dict):
+                    data = data.get('notes')
+                if not isinstance(data, list):
+                    return self.validation_error("notes", "노트 배열(JSON 배열 또는 {\"notes\": [...]})이 필요합니다")
+                records = data
+            else:
+                return self.error_response(
+                    message="JSON 또는 NDJSON 데이터가 필요합니다",
+                    details=f"Content-Type을 application/json 또는 {NDJSON_MIMETYPES[0]}으로 설정해주세요",
+                    status=400
+                )
+            
+            report = self.service.import_notes(records, batch_size=batch_size)
+            
+            if report["aborted"]:
+                return self.error_response(
+                    message=f"노트 가져오기 중단 ({report['imported']}개 저장됨)",
+                    details=report["aborted"],
+                    status=500
+                )
+            
+            return self.success_response(
+                data=report,
+                message=f"{report['imported']}개의 노트를 가져왔습니다 (실패 {report['failed']}개)",
+                status=201
+            )
+            
+        except Exception as e:
+            return self.error_response(
+                message="노트 가져오기 실패",
+                details=str(e),
+                status=500
+            )
+    
+    def bulk_notes(self):
+        """
+        POST /api/notes/bulk
+        노트 일괄 삭제/태그 변경 (한 트랜잭션)
+
+        본문: {"action": "delete" | "add_tags" | "remove_tags" | "set_tags", "ids": [...], "tags": [...]}
+        """
+        self.log_request("bulk_notes")
+        
+        try:
+            data = request.get_json(silent=True)
+            if not isinstance(data, dict):
+                return self.validation_error("body", "JSON 객체가 필요합니다")
+            
+            result = self.service.bulk_update(data.get('action'), data.get('ids'), data.get('tags'))
+            
+            return self.success_response(
+                data=result,
+                message=f"{len(result['affected'])}개의 노트를 처리했습니다 (없는 노트 {len(result['not_found'])}개)"
+            )
+            
+        except ValueError as e:
+            return self.validation_error("bulk", str(e))
+        except Exception as e:
+            return self.error_response(
+                message="노트 일괄 처리 실패",
+                details=str(e),
+                status=500
+            )
+    
+    def _iter_ndjson(self, stream):
+        """NDJSON 스트림 → 노트 dict (파싱 실패한 줄은 ValueError 객체로 전달)"""
+        for line_number, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json_loads(line)
+            except ValueError as e:
+                yield ValueError(f"{line_number}번째 줄 JSON 파싱 실패: {e}")
+    
     def get_tags(self):
         """
         GET /api/notes/tags
-        모든 태그 목록
+        모든 태그 목록 (?with_counts=1이면 태그별 노트 수/마지막 사용 시각 포함)
         """
         self.log_request("get_tags")
         
         try:
-            tags = self.service.get_all_tags()
+            with_counts = request.args.get('with_counts', '').lower() in ('1', 'true', 'yes')
+            tags = self.service.get_all_tags(with_counts=with_counts)
             
             return self.success_response(
                 data={
@@ -278,6 +413,32 @@ class NoteController(BaseController):
                 status=500
             )
     
+    def get_suggestions(self):
+        """
+        GET /api/notes/suggest?q=...&limit=5
+        제목/태그/단어 자동완성 (메모리 색인, 입력마다 호출해도 DB를 읽지 않음)
+        """
+        self.log_request("get_suggestions")
+        
+        try:
+            query = request.args.get('q', '')
+            limit = min(max(request.args.get('limit', 5, type=int), 1), 20)
+            suggestions = self.service.get_suggestions(query, limit=limit)
+            
+            return self.success_response(
+                data={"query": query, **suggestions},
+                message="자동완성 제안을 조회했습니다"
+            )
+            
+        except ValueError as e:
+            return self.validation_error("q", str(e))
+        except Exception as e:
+            return self.error_response(
+                message="자동완성 조회 실패",
+                details=str(e),
+                status=500
+            )
+    
     def get_stats(self):
         """
         GET /api/notes/stats
@@ -300,27 +461,54 @@ class NoteController(BaseController):
                 status=500
             )
     
-    def _note_to_dict(self, note):
+    def _parse_fields(self):
+        """fields 파라미터 (쿼리스트링 또는 JSON 본문) → (필드 목록, 에러 응답)"""
+        fields = request.args.get('fields')
+        if fields is None and request.is_json:
+            fields = (request.get_json(silent=True) or {}).get('fields')
+        
+        try:
+            return self.service.parse_fields(fields), None
+        except ValueError as e:
+            return None, self.validation_error("fields", str(e))
+    
+    def _note_to_dict(self, note, fields=None):
         """
         Note 모델을 딕셔너리로 변환
         
         프론트엔드가 사용하기 쉬운 형태로 변환
+        fields가 주어지면 해당 필드만 만든다 (읽지 않은 content 등에 접근하지 않음)
+        note가 캐시된 dict(Note.to_dict())여도 같은 형태로 변환한다
         """
         try:
-            # Note 모델의 get_tags() 메소드 사용
-            note_tags = note.get_tags() if hasattr(note, 'get_tags') else []
+            if isinstance(note, dict):
+                note_dict = {**note, "tag_count": len(note.get("tags") or [])}
+                return {name: value for name, value in note_dict.items() if not fields or name in fields}
             
-            return {
-                "id": note.id,
-                "title": note.title,
-                "content": note.content,
-                "tags": note_tags,
-                "created_at": note.created_at.isoformat() if note.created_at else None,
-                "updated_at": note.updated_at.isoformat() if note.updated_at else None,
-                # 추가 메타데이터
-                "content_length": len(note.content) if note.content else 0,
-                "tag_count": len(note_tags)
+            builders = {
+                "id": lambda: note.id,
+                "title": lambda: note.title,
+                "content": lambda: note.content,
+                "preview": lambda: note.preview,
+                "tags": lambda: note.get_tags(),
+                "created_at": lambda: note.created_at.isoformat() if note.created_at else None,
+                "updated_at": lambda: note.updated_at.isoformat() if note.updated_at else None,
+                # 추가 메타데이터 (content_length는 저장 시 계산된 값)
+                "content_length": lambda: note.content_length or 0,
+                "tag_count": lambda: len(note.get_tags()),
             }
+            
+            note_dict = {name: build() for name, build in builders.items() if not fields or name in fields}
+            
+            # 전문 검색 결과면 점수와 하이라이트 포함
+            if getattr(note, 'search_snippet', None) is not None and (not fields or "search" in fields):
+                note_dict["search"] = {
+                    "score": note.search_score,
+                    "title_highlight": note.search_title_highlight,
+                    "snippet": note.search_snippet
+                }
+            
+            return note_dict
         except Exception as e:
             logger.error(f"Error converting note to dict: {e}")
             # 최소한의 정보라도 반환
@@ -6,7 +6,9 @@ BaseRepository - 모든 레포지토리의 기본 클래스
 """
 
 from config.database import db
+from sqlalchemy import tuple_
 from sqlalchemy.exc import SQLAlchemyError
+from utils.pagination import decode_cursor, next_cursor_for
 import logging
 
 logger = logging.getLogger(__name__)
@@ -40,6 +42,57 @@ class BaseRepository:
             logger.error(f"Error finding all {self.model.__name__}: {e}")
             raise
     
+    def find_page(self, limit=20, cursor=None, query=None):
+        """키셋(커서) 페이지네이션 - 최신순 (created_at DESC, id DESC)
+
+        (created_at, id) 복합 인덱스를 따라 커서 위치부터 읽으므로 페이지 깊이와 무관하게 비용이 같다.
+
+        Args:
+            limit: 페이지 크기 (None이면 커서 이후 전부)
+            cursor: 이전 응답의 next_cursor (None이면 첫 페이지)
+            query: 추가 조건이 걸린 기본 쿼리 (None이면 전체)
+
+        Returns:
+            (항목 목록, 다음 커서 또는 None)
+
+        Raises:
+            ValueError: 유효하지 않은 커서
+        """
+        try:
+            items = self.page_query(limit, cursor, query).all()
+            
+            if not limit:
+                return items, None
+            
+            has_more = len(items) > limit
+            items = items[:limit]
+            
+            return items, next_cursor_for(items, has_more)
+            
+        except SQLAlchemyError as e:
+            logger.error(f"Error finding page of {self.model.__name__}: {e}")
+            raise
+    
+    def page_query(self, limit=20, cursor=None, query=None):
+        """find_page가 실행하는 쿼리 (쿼리 계획 점검용으로도 사용)
+
+        limit이 있으면 다음 페이지 존재 여부를 알기 위해 한 개 더 읽는다.
+
+        Raises:
+            ValueError: 유효하지 않은 커서
+        """
+        query = query if query is not None else self.model.query
+        
+        if cursor:
+            created_at, last_id = decode_cursor(cursor)
+            query = query.filter(
+                tuple_(self.model.created_at, self.model.id) < tuple_(created_at, last_id)
+            )
+        
+        query = query.order_by(self.model.created_at.desc(), self.model.id.desc())
+        
+        return query.limit(limit + 1) if limit else query
+    
     def find_by_id(self, id):
         """ID로 레코드 조회"""
         try:
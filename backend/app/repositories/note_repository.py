@@ -1,167 +1,66 @@
 # backend/app/repositories/note_repository.py
 """
-NoteRepository - 완전한 디버깅 강화 버전
+NoteRepository - 노트 모델 전용 데이터 접근 클래스
 
-노트 모델 전용 데이터 접근 클래스
-모든 DB 조회와 쿼리를 상세하게 로깅
+목록 조회(find_all)는 운영 경로라 쿼리 한 번만 실행하고,
+쿼리 수/시간은 utils.query_diagnostics의 샘플링 진단으로 확인
 """
 
 from .base_repository import BaseRepository
-from models.note import Note
-from sqlalchemy import or_, func, desc, text
+from models.note import Note, Tag, ChatHistory, note_tags, make_preview
+from utils.query_diagnostics import query_diagnostics
+from utils.note_cache import note_cache
+from utils import fulltext_search, note_stats, note_versions
+from sqlalchemy import or_, func, desc, text, insert, select, update, delete, exists, bindparam
+from flask import g, has_request_context
 from datetime import datetime, timedelta
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 요청 안에서 버전을 아직 읽지 않았음 (노트가 없을 때의 버전 None과 구분)
+_NOT_READ = object()
+
 
 class NoteRepository(BaseRepository):
     """노트 전용 레포지토리"""
     
+    # 태그 집계 캐시 (노트 변경 카운터 값과 함께 저장, 카운터가 바뀌면 다시 집계)
+    _tag_summary_cache = {"version": None, "tags": None}
+    
     def __init__(self):
         super().__init__(Note)
         print("🗄️ NoteRepository 초기화 완료")
     
-    def find_all(self, limit=None, offset=None):
-        """모든 노트 조회 - 디버깅 강화"""
-        
-        print(f"\n{'='*60}")
-        print(f"🗄️ NoteRepository.find_all() 실행")
-        print(f"{'='*60}")
-        print(f"📋 Parameters: limit={limit}, offset={offset}")
-        
+    def list_query(self, fields=None):
+        """목록용 기본 쿼리 (fields가 있으면 필요한 컬럼만 읽고 content 등은 제외)
+
+        fields가 없으면 기존처럼 content까지 읽는다. 프런트엔드 노트 스토어가 목록의
+        content로 클라이언트 검색을 하므로, 본문을 빼는 것은 fields=...로 요청할 때만이다.
+        """
+        query = self.model.query
+        if fields:
+            query = query.options(self.model.load_only_fields(fields))
+        return query
+    
+    def find_all(self, limit=None, offset=None, fields=None):
+        """모든 노트 조회 (최신순) - 쿼리 한 번만 실행
+
+        쿼리 수/시간 확인이 필요하면 DB_DIAGNOSTICS_SAMPLE_RATE로 샘플링 진단을 켠다
+        """
         try:
-            print("🔍 Step 1: DB 연결 상태 확인...")
-            
-            # DB 연결 확인
-            try:
-                # 간단한 쿼리로 DB 연결 테스트
-                test_result = self.session.execute(text("SELECT 1")).fetchone()
-                print(f"✅ DB 연결 성공: {test_result}")
-            except Exception as db_error:
-                print(f"❌ DB 연결 실패: {db_error}")
-                raise
-            
-            print("🔍 Step 2: 노트 테이블 존재 확인...")
-            
-            # 테이블 존재 확인
-            try:
-                table_exists = self.session.execute(
-                    text("SELECT name FROM sqlite_master WHERE type='table' AND name='notes'")
-                ).fetchone()
-                print(f"📊 Notes 테이블 존재: {table_exists is not None}")
-                
-                if table_exists:
-                    # 테이블 구조 확인
-                    columns = self.session.execute(text("PRAGMA table_info(notes)")).fetchall()
-                    print(f"📊 Notes 테이블 컬럼: {[col[1] for col in columns]}")
-                    
-                    # 전체 노트 개수 확인
-                    total_count = self.session.execute(text("SELECT COUNT(*) FROM notes")).fetchone()[0]
-                    print(f"📊 DB 내 총 노트 수: {total_count}")
-                    
-                    if total_count > 0:
-                        # 첫 번째 노트 확인 (원시 SQL)
-                        first_note_raw = self.session.execute(text("SELECT * FROM notes LIMIT 1")).fetchone()
-                        print(f"📊 첫 번째 노트 (Raw): {first_note_raw}")
-                        
-                        # 모든 노트의 ID와 제목 확인
-                        all_notes_brief = self.session.execute(text("SELECT id, title FROM notes LIMIT 5")).fetchall()
-                        print(f"📊 노트 목록 (처음 5개): {all_notes_brief}")
-                else:
-                    print("❌ Notes 테이블이 존재하지 않습니다!")
-                    return []
-                    
-            except Exception as table_error:
-                print(f"❌ 테이블 확인 실패: {table_error}")
-                # 계속 진행
-            
-            print("🔍 Step 3: SQLAlchemy ORM 쿼리 실행...")
-            
-            # 실제 ORM 쿼리 실행
-            query = self.model.query
-            print(f"📊 Base Query: {query}")
-            
-            # 정렬 추가 (최신순)
-            query = query.order_by(desc(self.model.created_at))
-            print(f"📊 Query with Order: {query}")
-            
-            if offset:
-                query = query.offset(offset)
-                print(f"📊 Query with Offset: {query}")
-            
-            if limit:
-                query = query.limit(limit)
-                print(f"📊 Query with Limit: {query}")
-            
-            # 최종 SQL 출력 (가능하면)
-            try:
-                print(f"📊 Final SQL: {query.statement.compile(compile_kwargs={'literal_binds': True})}")
-            except:
-                print(f"📊 Final SQL: {query.statement}")
-            
-            print("🔍 Step 4: 쿼리 실행 및 결과 확인...")
-            
-            # 쿼리 실행
-            results = query.all()
-            
-            print(f"🔍 Step 4 완료:")
-            print(f"   - 결과 타입: {type(results)}")
-            print(f"   - 결과 개수: {len(results) if results else 0}")
-            
-            if results:
-                print(f"   - 첫 번째 결과 타입: {type(results[0])}")
-                
-                # 첫 번째 노트의 모든 속성 확인
-                first_note = results[0]
-                try:
-                    print(f"📊 첫 번째 노트 상세:")
-                    print(f"   - ID: {first_note.id}")
-                    print(f"   - Title: {first_note.title}")
-                    print(f"   - Content: {first_note.content[:100]}..." if first_note.content else "None")
-                    print(f"   - Created: {first_note.created_at}")
-                    print(f"   - Updated: {first_note.updated_at}")
-                    print(f"   - Tags: {first_note.tags}")
-                    
-                    # 태그 메서드 테스트
-                    if hasattr(first_note, 'get_tags'):
-                        tags_list = first_note.get_tags()
-                        print(f"   - Tags List: {tags_list}")
-                    
-                    # 전체 노트 ID 목록 출력
-                    all_ids = [note.id for note in results]
-                    print(f"📊 모든 노트 ID: {all_ids[:10]}...")  # 처음 10개만
-                    
-                except Exception as attr_error:
-                    print(f"⚠️ 노트 속성 접근 실패: {attr_error}")
-            else:
-                print("⚠️ ORM 쿼리 결과가 비어있습니다!")
-                
-                # 다시 원시 SQL로 확인
-                print("🔍 원시 SQL로 재확인...")
-                raw_results = self.session.execute(text("SELECT * FROM notes")).fetchall()
-                print(f"📊 원시 SQL 결과: {len(raw_results)}개")
-                
-                if raw_results:
-                    print(f"📊 첫 번째 원시 결과: {raw_results[0]}")
-                    print("❌ ORM과 원시 SQL 결과가 다름! 모델 매핑 문제 의심됨")
-                else:
-                    print("📊 원시 SQL도 결과 없음 - DB가 실제로 비어있음")
-            
-            print(f"✅ NoteRepository.find_all() 완료")
-            print(f"{'='*60}\n")
-            
-            return results
-            
+            with query_diagnostics.track('NoteRepository.find_all'):
+                query = self.list_query(fields).order_by(desc(self.model.created_at))
+
+                if offset:
+                    query = query.offset(offset)
+                if limit:
+                    query = query.limit(limit)
+
+                return query.all()
+
         except Exception as e:
-            print(f"❌ NoteRepository.find_all() 에러:")
-            print(f"   - 에러 타입: {type(e).__name__}")
-            print(f"   - 에러 메시지: {str(e)}")
-            
-            import traceback
-            print(f"❌ 전체 트레이스백:")
-            traceback.print_exc()
-            
             logger.error(f"Error finding all Notes: {e}")
             raise
     
@@ -185,6 +84,64 @@ class NoteRepository(BaseRepository):
             logger.error(f"Error finding note by id {note_id}: {e}")
             raise
     
+    def find_dict_by_id(self, note_id):
+        """ID로 노트 dict 조회 (읽기 전용 경로, 캐시에 없을 때만 DB 조회 후 캐시에 저장)
+
+        캐시 항목에는 읽을 때의 updated_at(note_version)을 함께 넣고, 꺼낼 때 현재 값과 다르면 버린다.
+        다른 워커가 수정해서 이 프로세스의 LRU가 무효화되지 않은 경우에도 오래된 본문을 돌려주지 않는다.
+        같은 요청에서 ETag용으로 읽은 버전이 있으면 그 값을 쓰므로, 캐시 적중 시 쿼리는 그 한 번뿐이다.
+
+        ORM 객체가 필요한 수정/삭제 경로는 find_by_id를 사용한다.
+        """
+        version = self._take_request_version(note_id)
+        if version is _NOT_READ:
+            version = note_versions.read_note_version(self.session, note_id)
+        if version is None:
+            return None
+
+        cached = note_cache.get(note_id)
+        if cached is not None:
+            if cached.get("version") == version:
+                return cached["note"]
+            note_cache.invalidate(note_id)
+
+        generation = note_cache.generation()
+        note = self.find_by_id(note_id)
+        if not note:
+            return None
+
+        # 버전을 먼저 읽었으므로 그 사이 수정됐다면 더 새 본문이 옛 버전으로 저장될 뿐 (다음 조회에서 버려짐)
+        note_dict = note.to_dict()
+        note_cache.set(note_id, {"version": version, "note": note_dict}, generation)
+        return note_dict
+    
+    def data_version(self):
+        """노트 데이터 전체 버전 (트리거 변경 카운터, 사용 불가하면 None)"""
+        return note_versions.read_version(self.session)
+    
+    def note_version(self, note_id):
+        """노트 단건 버전 (updated_at, 노트가 없으면 None)
+
+        요청 안에서는 읽은 값을 g에 남겨, 이어서 본문을 읽는 find_dict_by_id가 같은 SELECT를 반복하지 않게 한다.
+        """
+        version = note_versions.read_note_version(self.session, note_id)
+        if has_request_context():
+            g.setdefault('note_versions', {})[note_id] = version
+        return version
+    
+    @staticmethod
+    def _take_request_version(note_id):
+        """이 요청에서 note_version으로 읽어 둔 값 (한 번 쓰면 버림, 없으면 _NOT_READ)"""
+        if not has_request_context():
+            return _NOT_READ
+        return g.get('note_versions', {}).pop(note_id, _NOT_READ)
+    
+    def update(self, instance, **kwargs):
+        """노트 수정 후 캐시 무효화"""
+        note = super().update(instance, **kwargs)
+        note_cache.invalidate(note.id)
+        return note
+    
     def find_by_tags(self, tags):
         """태그로 노트 검색"""
         print(f"\n🏷️ NoteRepository.find_by_tags({tags}) 실행")
@@ -195,32 +152,36 @@ class NoteRepository(BaseRepository):
             
             print(f"🔍 검색할 태그들: {tags}")
             
-            # JSON 문자열에서 태그 검색 (Note 모델의 저장 방식에 맞춤)
-            conditions = []
-            for tag in tags:
-                # JSON 배열에서 정확한 태그 매칭을 위해 따옴표 포함해서 검색
-                tag_pattern = f'"{tag}"'
-                conditions.append(self.model.tags.contains(tag_pattern))
-                print(f"🔍 태그 '{tag}' 검색 패턴: {tag_pattern}")
-            
-            if conditions:
-                results = self.model.query.filter(or_(*conditions)).all()
-                print(f"✅ 태그 검색 완료: {len(results)}개 노트 발견")
-                return results
-            else:
+            if not tags:
                 print("⚠️ 검색할 태그가 없음")
                 return []
             
+            results = self.tag_query(tags).all()
+            print(f"✅ 태그 검색 완료: {len(results)}개 노트 발견")
+            return results
+            
         except Exception as e:
             print(f"❌ 태그 검색 에러: {e}")
             logger.error(f"Error finding notes by tags {tags}: {e}")
             raise
     
-    def search_content(self, query):
-        """제목과 내용에서 텍스트 검색"""
+    def tag_query(self, tags):
+        """태그 중 하나라도 가진 노트 (최신순) 쿼리"""
+        return self.model.query.filter(self.model.tag_filter(tags)).order_by(desc(self.model.created_at))
+    
+    def search_content(self, query, limit=None):
+        """제목과 내용에서 텍스트 검색 (FTS5 bm25 순, 불가능하면 LIKE)"""
         print(f"\n🔍 NoteRepository.search_content('{query}') 실행")
         
         try:
+            fts_query = fulltext_search.search_query(self.session, self.model, query)
+            if fts_query is not None:
+                if limit:
+                    fts_query = fts_query.limit(limit)
+                results = fulltext_search.attach_search_meta(fts_query.all())
+                print(f"✅ 전문 검색 완료: {len(results)}개 노트 발견")
+                return results
+            
             search_term = f"%{query}%"
             print(f"🔍 검색 패턴: {search_term}")
             
@@ -229,7 +190,10 @@ class NoteRepository(BaseRepository):
                     self.model.title.ilike(search_term),
                     self.model.content.ilike(search_term)
                 )
-            ).order_by(desc(self.model.created_at)).all()
+            ).order_by(desc(self.model.created_at))
+            if limit:
+                results = results.limit(limit)
+            results = results.all()
             
             print(f"✅ 내용 검색 완료: {len(results)}개 노트 발견")
             return results
@@ -239,12 +203,12 @@ class NoteRepository(BaseRepository):
             logger.error(f"Error searching notes with query '{query}': {e}")
             raise
     
-    def find_recent(self, limit=10):
+    def find_recent(self, limit=10, fields=None):
         """최근 생성된 노트들"""
         print(f"\n📅 NoteRepository.find_recent({limit}) 실행")
         
         try:
-            results = self.model.query.order_by(desc(self.model.created_at)).limit(limit).all()
+            results = self.recent_query(limit, fields).all()
             print(f"✅ 최근 노트 조회 완료: {len(results)}개")
             
             if results:
@@ -257,6 +221,10 @@ class NoteRepository(BaseRepository):
             logger.error(f"Error finding recent notes: {e}")
             raise
     
+    def recent_query(self, limit=10, fields=None):
+        """최근 생성된 노트 쿼리"""
+        return self.list_query(fields).order_by(desc(self.model.created_at)).limit(limit)
+    
     def find_by_title_like(self, title_part):
         """제목에 특정 문자열이 포함된 노트들"""
         print(f"\n📝 NoteRepository.find_by_title_like('{title_part}') 실행")
@@ -274,31 +242,48 @@ class NoteRepository(BaseRepository):
             raise
     
     def get_all_tags(self):
-        """모든 노트의 태그들을 중복 제거해서 반환"""
-        print(f"\n🏷️ NoteRepository.get_all_tags() 실행")
-        
+        """노트에 연결된 태그 목록 (이름순)"""
         try:
-            notes = self.find_all()
-            all_tags = set()
+            return self.model.get_all_tags()
             
-            print(f"🔍 {len(notes)}개 노트에서 태그 추출 중...")
-            
-            for note in notes:
-                # Note 모델의 get_tags() 메소드 사용
-                note_tags = note.get_tags() if hasattr(note, 'get_tags') else []
-                if note_tags:
-                    all_tags.update(note_tags)
-                    print(f"📊 노트 '{note.title}' 태그: {note_tags}")
+        except Exception as e:
+            print(f"❌ 태그 목록 조회 에러: {e}")
+            logger.error(f"Error getting all tags: {e}")
+            raise
+    
+    def get_tag_summary(self):
+        """태그별 노트 수/마지막 사용 시각 (노트가 바뀌지 않았으면 캐시된 집계 반환)
+
+        캐시 키는 트리거로 올라가는 노트 변경 카운터라 어느 워커에서 쓰든 바로 무효화된다.
+        카운터를 쓸 수 없는 DB에서는 매번 집계한다.
+        """
+        try:
+            version = self.data_version()
+            cached = NoteRepository._tag_summary_cache
+            if version is not None and cached["version"] == version:
+                return cached["tags"]
             
-            sorted_tags = sorted(list(all_tags))
-            print(f"✅ 전체 태그 추출 완료: {len(sorted_tags)}개 태그")
-            print(f"📊 태그 목록: {sorted_tags}")
+            # 카운터를 먼저 읽었으므로 그사이 쓰기가 있어도 다음 조회에서 다시 집계된다
+            tags = self.model.get_tag_summary()
+            if version is not None:
+                NoteRepository._tag_summary_cache = {"version": version, "tags": tags}
+            return tags
             
-            return sorted_tags
+        except Exception as e:
+            print(f"❌ 태그 집계 에러: {e}")
+            logger.error(f"Error summarizing tags: {e}")
+            raise
+    
+    def get_tag_counts(self):
+        """태그별 노트 수 (통계 테이블, 없으면 note_tags 집계 쿼리 한 번)"""
+        try:
+            if note_stats.is_available():
+                return note_stats.read_tag_counts(self.session)
+            return self.model.get_tag_counts()
             
         except Exception as e:
-            print(f"❌ 태그 목록 조회 에러: {e}")
-            logger.error(f"Error getting all tags: {e}")
+            print(f"❌ 태그 집계 에러: {e}")
+            logger.error(f"Error counting tags: {e}")
             raise
     
     def get_notes_by_date_range(self, start_date, end_date):
@@ -306,10 +291,7 @@ class NoteRepository(BaseRepository):
         print(f"\n📅 NoteRepository.get_notes_by_date_range({start_date}, {end_date}) 실행")
         
         try:
-            results = self.model.query.filter(
-                self.model.created_at >= start_date,
-                self.model.created_at <= end_date
-            ).order_by(desc(self.model.created_at)).all()
+            results = self.date_range_query(start_date, end_date).all()
             
             print(f"✅ 날짜 범위 검색 완료: {len(results)}개 노트 발견")
             return results
@@ -319,39 +301,43 @@ class NoteRepository(BaseRepository):
             logger.error(f"Error finding notes by date range: {e}")
             raise
     
+    def date_range_query(self, start_date, end_date):
+        """생성일 범위 노트 (최신순) 쿼리"""
+        return self.model.query.filter(
+            self.model.created_at >= start_date,
+            self.model.created_at <= end_date
+        ).order_by(desc(self.model.created_at))
+    
     def get_note_stats(self):
-        """노트 통계 정보"""
+        """노트 통계 정보 (트리거로 유지되는 통계 테이블에서 조회)"""
         print(f"\n📊 NoteRepository.get_note_stats() 실행")
-        
+
         try:
-            total_notes = self.count()
-            total_tags = len(self.get_all_tags())
-            
-            # 가장 최근 노트
-            recent_note = self.find_recent(1)
-            last_created = recent_note[0].created_at if recent_note else None
-            
-            # 7일 내 생성된 노트 수
-            week_ago = datetime.now() - timedelta(days=7)
-            recent_notes_count = self.model.query.filter(
-                self.model.created_at >= week_ago
-            ).count()
-            
-            # 평균 내용 길이
-            all_notes = self.find_all()
-            avg_content_length = 0
-            if all_notes:
-                total_length = sum(len(note.content) if note.content else 0 for note in all_notes)
-                avg_content_length = total_length / len(all_notes)
-            
+            if note_stats.is_available():
+                stats = note_stats.read_note_stats(self.session)
+                stats["top_tags"] = note_stats.read_tag_counts(self.session, limit=10)
+                return stats
+
+            # 통계 트리거가 없는 DB: 집계 쿼리로 계산 (노트 본문은 읽지 않음)
+            total_notes, total_length, last_created = self.session.query(
+                func.count(self.model.id),
+                func.coalesce(func.sum(func.length(self.model.content)), 0),
+                func.max(self.model.created_at)
+            ).one()
+
+            week_ago = datetime.utcnow() - timedelta(days=note_stats.RECENT_DAYS)
+            recent_notes_count = self.model.query.filter(self.model.created_at >= week_ago).count()
+            tag_counts = self.get_tag_counts()
+
             stats = {
                 "total_notes": total_notes,
-                "total_tags": total_tags,
+                "total_tags": len(tag_counts),
                 "last_created": last_created.isoformat() if last_created else None,
                 "recent_notes_count": recent_notes_count,
-                "avg_content_length": round(avg_content_length, 2)
+                "avg_content_length": round(total_length / total_notes, 2) if total_notes else 0,
+                "top_tags": tag_counts[:10]
             }
-            
+
             print(f"✅ 통계 생성 완료: {stats}")
             return stats
             
@@ -360,53 +346,57 @@ class NoteRepository(BaseRepository):
             logger.error(f"Error getting note stats: {e}")
             raise
     
-    def search_combined(self, query=None, tags=None, limit=50):
+    def _search_query(self, query=None, tags=None, fields=None):
+        """통합 검색 쿼리 구성 → (쿼리, FTS 여부)
+
+        FTS 쿼리의 결과 행은 (노트, score, title_highlight, snippet)이라 attach_search_meta가 필요하다.
+        """
+        # 검색어가 있으면 FTS5로 태그 조건까지 한 쿼리에서 처리 (bm25 순)
+        fts_query = fulltext_search.search_query(self.session, self.model, query.strip()) if query else None
+        if fts_query is not None:
+            if fields:
+                fts_query = fts_query.options(self.model.load_only_fields(fields))
+            if tags:
+                fts_query = fts_query.filter(self.model.tag_filter(tags))
+            return fts_query, True
+        
+        base_query = self.list_query(fields)
+        conditions = []
+        
+        # 텍스트 검색 조건 (FTS로 처리할 수 없는 짧은 검색어)
+        if query and query.strip():
+            search_term = f"%{query.strip()}%"
+            text_condition = or_(
+                self.model.title.ilike(search_term),
+                self.model.content.ilike(search_term)
+            )
+            conditions.append(text_condition)
+            print(f"🔍 텍스트 검색 조건 추가: {search_term}")
+        
+        # 태그 검색 조건
+        if tags:
+            if isinstance(tags, str):
+                tags = [tags]
+            
+            conditions.append(self.model.tag_filter(tags))
+            print(f"🔍 태그 검색 조건 추가: {tags}")
+        
+        # 조건 적용 (여러 조건은 AND로 결합, 조건이 없으면 최근 노트)
+        final_query = base_query.filter(*conditions) if conditions else base_query
+        
+        return final_query.order_by(desc(self.model.created_at)), False
+
+    def search_combined(self, query=None, tags=None, limit=50, fields=None):
         """통합 검색 (텍스트 + 태그)"""
         print(f"\n🔍 NoteRepository.search_combined(query='{query}', tags={tags}, limit={limit}) 실행")
         
         try:
-            base_query = self.model.query
-            conditions = []
+            search, is_fts = self._search_query(query, tags, fields)
+            results = search.limit(limit).all()
+            if is_fts:
+                results = fulltext_search.attach_search_meta(results)
             
-            # 텍스트 검색 조건
-            if query and query.strip():
-                search_term = f"%{query.strip()}%"
-                text_condition = or_(
-                    self.model.title.ilike(search_term),
-                    self.model.content.ilike(search_term)
-                )
-                conditions.append(text_condition)
-                print(f"🔍 텍스트 검색 조건 추가: {search_term}")
-            
-            # 태그 검색 조건
-            if tags:
-                if isinstance(tags, str):
-                    tags = [tags]
-                
-                tag_conditions = []
-                for tag in tags:
-                    tag_pattern = f'"{tag}"'
-                    tag_conditions.append(self.model.tags.contains(tag_pattern))
-                
-                if tag_conditions:
-                    conditions.append(or_(*tag_conditions))
-                    print(f"🔍 태그 검색 조건 추가: {tags}")
-            
-            # 조건 적용
-            if conditions:
-                if len(conditions) == 1:
-                    final_query = base_query.filter(conditions[0])
-                else:
-                    # 여러 조건은 AND로 결합
-                    final_query = base_query.filter(*conditions)
-            else:
-                # 조건이 없으면 최근 노트 반환
-                final_query = base_query
-            
-            # 정렬 및 제한
-            results = final_query.order_by(desc(self.model.created_at)).limit(limit).all()
-            
-            print(f"✅ 통합 검색 완료: {len(results)}개 노트 발견")
+            print(f"✅ 통합 검색 완료{' (FTS5)' if is_fts else ''}: {len(results)}개 노트 발견")
             
             if results:
                 print(f"📊 첫 번째 결과: '{results[0].title}'")
@@ -417,7 +407,195 @@ class NoteRepository(BaseRepository):
             print(f"❌ 통합 검색 에러: {e}")
             logger.error(f"Error in combined search: {e}")
             raise
-    
+
+    def iter_search(self, query=None, tags=None, limit=None, fields=None, batch_size=500):
+        """통합 검색 결과를 batch_size개씩 나눠 읽으며 하나씩 반환 (스트리밍 응답용)"""
+        search, is_fts = self._search_query(query, tags, fields)
+        if limit:
+            search = search.limit(limit)
+        
+        for row in search.yield_per(batch_size):
+            yield fulltext_search.attach_search_meta([row])[0] if is_fts else row
+
+    def iter_all(self, limit=None, fields=None, batch_size=500):
+        """모든 노트를 최신순으로 batch_size개씩 나눠 읽으며 하나씩 반환 (스트리밍 응답용)
+
+        yield_per로 커서에서 배치 단위로만 객체를 만들므로 노트 수와 무관하게 메모리가 일정하다.
+        """
+        query = self.list_query(fields).order_by(self.model.created_at.desc(), self.model.id.desc())
+        if limit:
+            query = query.limit(limit)
+        
+        yield from query.yield_per(batch_size)
+
+    def bulk_insert(self, rows):
+        """노트 여러 개를 한 트랜잭션에 삽입 → 삽입된 노트 ID 목록 (입력 순서)
+
+        노트는 INSERT ... RETURNING 배치 한 번, 태그 연결은 executemany 한 번으로 처리한다.
+        ORM 객체를 거치지 않으므로 preview/content_length/tags 사본도 여기서 채운다.
+        (전문 검색/통계 테이블은 트리거가 갱신)
+
+        Args:
+            rows: {'title', 'content', 'tags', 'created_at'(선택), 'updated_at'(선택)} 목록
+        """
+        if not rows:
+            return []
+
+        try:
+            now = datetime.utcnow()
+            note_rows = [{
+                "title": row["title"],
+                "content": row["content"],
+                "tags": json.dumps(row["tags"], ensure_ascii=False),
+                "preview": make_preview(row["content"]),
+                "content_length": len(row["content"]),
+                "created_at": row.get("created_at") or now,
+                "updated_at": row.get("updated_at") or row.get("created_at") or now
+            } for row in rows]
+
+            note_ids = self.session.scalars(
+                insert(self.model).returning(self.model.id, sort_by_parameter_order=True), note_rows
+            ).all()
+
+            tag_ids = Tag.ids_for_names([tag for row in rows for tag in row["tags"]])
+            links = []
+            for note_id, row in zip(note_ids, rows):
+                for tag_id in dict.fromkeys(tag_ids[tag.lower()] for tag in row["tags"]):
+                    links.append({"note_id": note_id, "tag_id": tag_id})
+            if links:
+                self.session.execute(note_tags.insert(), links)
+
+            self.session.commit()
+            return note_ids
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Error bulk inserting {len(rows)} notes: {e}")
+            raise
+
+    def iter_index_rows(self, note_ids, batch_size=500):
+        """RAG 인덱싱용 (id, title, content)를 batch_size개씩 읽기 (ORM 객체를 만들지 않음)"""
+        for start in range(0, len(note_ids), batch_size):
+            chunk = note_ids[start:start + batch_size]
+            rows = self.session.execute(
+                select(self.model.id, self.model.title, self.model.content).where(self.model.id.in_(chunk))
+            ).all()
+            yield [{"id": note_id, "title": title, "content": content} for note_id, title, content in rows]
+
+    def iter_autocomplete_rows(self, note_ids, batch_size=500):
+        """자동완성 색인용 (id, title, tags, content) 튜플을 batch_size개씩 읽기"""
+        for start in range(0, len(note_ids), batch_size):
+            chunk = note_ids[start:start + batch_size]
+            yield from self.session.execute(
+                select(self.model.id, self.model.title, self.model.tags, self.model.content)
+                .where(self.model.id.in_(chunk))
+            ).all()
+
+    def existing_ids(self, note_ids):
+        """주어진 ID 중 실제로 있는 노트 ID 목록 (오름차순)"""
+        if not note_ids:
+            return []
+        return self.session.scalars(
+            select(self.model.id).where(self.model.id.in_(note_ids)).order_by(self.model.id)
+        ).all()
+
+    def bulk_delete(self, note_ids):
+        """노트 여러 개를 한 트랜잭션에서 삭제 → 삭제된 노트 ID 목록
+
+        채팅 기록은 단건 삭제(ORM)와 같이 note_id 연결만 끊고,
+        전문 검색/통계 테이블은 notes 트리거가 같은 트랜잭션에서 갱신한다.
+        """
+        try:
+            ids = self.existing_ids(note_ids)
+            if ids:
+                self.session.execute(
+                    update(ChatHistory).where(ChatHistory.note_id.in_(ids)).values(note_id=None)
+                )
+                self.session.execute(note_tags.delete().where(note_tags.c.note_id.in_(ids)))
+                self.session.execute(delete(self.model).where(self.model.id.in_(ids)))
+            self.session.commit()
+            note_cache.invalidate_many(ids)
+            logger.info(f"Bulk deleted {len(ids)} notes")
+            return ids
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Error bulk deleting notes: {e}")
+            raise
+
+    def bulk_update_tags(self, note_ids, action, tags):
+        """노트 여러 개의 태그를 한 트랜잭션에서 변경 → 변경된 노트 ID 목록
+
+        note_tags는 집합 단위 SQL(INSERT ... SELECT / DELETE ... IN)로 한 번에 바꾸고,
+        응답용 JSON 사본(notes.tags)과 updated_at은 executemany 한 번으로 맞춘다.
+
+        Args:
+            action: 'add'(추가) / 'remove'(제거) / 'set'(교체)
+            tags: 검증된 태그 이름 목록
+        """
+        try:
+            ids = self.existing_ids(note_ids)
+            if not ids:
+                self.session.commit()
+                return []
+
+            if action == 'remove':
+                tag_ids = self.session.scalars(select(Tag.id).where(Tag.name.in_(tags))).all() if tags else []
+                if tag_ids:
+                    self.session.execute(note_tags.delete().where(
+                        note_tags.c.note_id.in_(ids), note_tags.c.tag_id.in_(tag_ids)
+                    ))
+            else:
+                if action == 'set':
+                    self.session.execute(note_tags.delete().where(note_tags.c.note_id.in_(ids)))
+                tag_ids = list(Tag.ids_for_names(tags).values())
+                if tag_ids:
+                    # (노트 × 태그) 조합 중 아직 없는 연결만 한 문장으로 삽입
+                    pairs = select(self.model.id, Tag.id).where(
+                        self.model.id.in_(ids),
+                        Tag.id.in_(tag_ids),
+                        ~exists().where(note_tags.c.note_id == self.model.id, note_tags.c.tag_id == Tag.id)
+                    )
+                    self.session.execute(note_tags.insert().from_select(['note_id', 'tag_id'], pairs))
+
+            # JSON 사본은 기존 순서를 유지하면서 같은 규칙으로 갱신 (태그 이름은 대소문자 구분 없이 비교)
+            now = datetime.utcnow()
+            current = self.session.execute(select(self.model.id, self.model.tags).where(self.model.id.in_(ids)))
+            wanted = {tag.lower() for tag in tags}
+            rows = []
+            for note_id, raw in current:
+                try:
+                    note_tag_list = json.loads(raw) if raw else []
+                except (json.JSONDecodeError, TypeError):
+                    note_tag_list = []
+
+                if action == 'set':
+                    note_tag_list = list(tags)
+                elif action == 'add':
+                    present = {str(tag).lower() for tag in note_tag_list}
+                    note_tag_list += [tag for tag in tags if tag.lower() not in present]
+                else:
+                    note_tag_list = [tag for tag in note_tag_list if str(tag).lower() not in wanted]
+
+                rows.append({"note_id": note_id, "tags": json.dumps(note_tag_list, ensure_ascii=False),
+                             "updated_at": now})
+
+            self.session.execute(
+                update(self.model.__table__)
+                .where(self.model.__table__.c.id == bindparam('note_id'))
+                .values(tags=bindparam('tags'), updated_at=bindparam('updated_at')),
+                rows
+            )
+            self.session.commit()
+            note_cache.invalidate_many(ids)
+            logger.info(f"Bulk {action} tags {tags} on {len(ids)} notes")
+            return ids
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Error bulk updating tags ({action}): {e}")
+            raise
+
     def count(self):
         """전체 노트 개수"""
         try:
@@ -443,6 +621,7 @@ class NoteRepository(BaseRepository):
 
             self.session.delete(note)
             self.session.commit()
+            note_cache.invalidate(note_id)
 
             print(f"✅ 노트 ID {note_id} 삭제 완료")
             logger.info(f"Deleted note: ID={note_id}")
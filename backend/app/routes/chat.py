@@ -53,6 +53,18 @@ def rebuild_rag_index():
     return controller.rebuild_rag_index()
 
 
+@chat_bp.route('/rag/migration', methods=['POST'])
+def start_rag_migration():
+    """임베딩 모델 온라인 마이그레이션 시작"""
+    return controller.start_rag_migration()
+
+
+@chat_bp.route('/rag/migration', methods=['GET'])
+def rag_migration_status():
+    """임베딩 모델 마이그레이션 진행 상황"""
+    return controller.get_rag_migration_status()
+
+
 # ====== Multiple Chains API ======
 
 @chat_bp.route('/summarize', methods=['POST'])
@@ -326,6 +338,18 @@ def export_chat_history():
     return controller.export_chat_history_endpoint()
 
 
+@chat_bp.route('/history/archive', methods=['GET'])
+def get_archive_status():
+    """채팅 아카이브 상태 (월별 기록 수/파일 크기)"""
+    return controller.get_archive_status_endpoint()
+
+
+@chat_bp.route('/history/archive', methods=['POST'])
+def archive_chat_history():
+    """보관 정책을 넘는 오래된 채팅을 월별 압축 아카이브로 이동"""
+    return controller.archive_chat_history_endpoint()
+
+
 @chat_bp.route('/history/summary', methods=['GET'])
 def get_chat_summary():
     """✅ 채팅 요약 통계 (새로 추가)"""
@@ -419,6 +443,12 @@ def list_endpoints():
             "description": "채팅 히스토리 내보내기",
             "body": {"start_date": "str", "end_date": "str"}
         },
+        "history_archive": {
+            "url": "/api/history/archive",
+            "method": "GET, POST",
+            "description": "채팅 아카이브 상태 조회 / 보관 정책 적용",
+            "body": {"retention_days": "int", "max_rows": "int"}
+        },
         "history_summary": {
             "url": "/api/history/summary",
             "method": "GET",
@@ -442,6 +472,12 @@ def list_endpoints():
             "method": "GET",
             "description": "RAG 시스템 상태"
         },
+        "rag_migration": {
+            "url": "/api/rag/migration",
+            "method": "GET, POST",
+            "description": "임베딩 모델 마이그레이션 상태 조회 / 시작",
+            "body": {"model": "str"}
+        },
         "chains_info": {
             "url": "/api/chains",
             "method": "GET", 
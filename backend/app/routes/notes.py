@@ -7,6 +7,7 @@ Notes 라우트 - 디버깅 강화 버전
 
 from flask import Blueprint, request, jsonify
 from app.controllers.note_controller import NoteController
+from utils.http_cache import etag_conditional
 import logging
 import json
 from datetime import datetime
@@ -47,8 +48,12 @@ def log_request_details(endpoint_name):
     print(f"{'='*50}\n")
 
 
-def log_response_details(response_data, status_code=200):
-    """응답 상세 정보 로깅"""
+def log_response_details(response_data, status_code=200, body_size=None):
+    """응답 상세 정보 로깅
+
+    response_data는 응답에 담은 dict를 그대로 넘긴다 (응답 본문을 다시 파싱하지 않도록).
+    body_size가 있으면 직렬화된 본문 크기로 출력한다.
+    """
     print(f"\n{'='*50}")
     print(f"📤 API 응답")
     print(f"{'='*50}")
@@ -69,10 +74,12 @@ def log_response_details(response_data, status_code=200):
                 print(f"⚠️ Notes Array is Empty!")
         
         # 전체 응답 크기
-        response_str = str(response_data)
-        print(f"📊 Response Size: {len(response_str)} characters")
+        if body_size is not None:
+            print(f"📊 Response Size: {body_size} bytes")
         
-        # 처음 200자만 미리보기
+        # 처음 200자만 미리보기 (노트 목록은 위에서 개수만 출력)
+        preview_data = {key: value for key, value in response_data.items() if key != 'notes'}
+        response_str = str(preview_data)
         preview = response_str[:200] + "..." if len(response_str) > 200 else response_str
         print(f"📊 Response Preview: {preview}")
     
@@ -82,6 +89,7 @@ def log_response_details(response_data, status_code=200):
 # ====== 노트 CRUD ======
 
 @notes_bp.route('/notes', methods=['GET'])
+@etag_conditional(lambda: controller.service.get_data_version())
 def get_notes():
     """노트 목록 조회 - 디버깅 강화"""
     
@@ -93,13 +101,28 @@ def get_notes():
         # 쿼리 파라미터 추출
         limit = request.args.get('limit', type=int)
         offset = request.args.get('offset', type=int)
+        cursor = request.args.get('cursor')
+        fields, error = controller._parse_fields()
+        if error:
+            return error
         
-        print(f"🔍 Step 1 완료: limit={limit}, offset={offset}")
+        # NDJSON 스트리밍 (DB 커서를 나눠 읽으며 전송, 전체 목록을 메모리에 만들지 않음)
+        if controller.wants_stream():
+            return controller.stream_notes(fields)
         
-        print("🔍 Step 2: NoteService.get_all_notes() 호출 중...")
+        print(f"🔍 Step 1 완료: limit={limit}, offset={offset}, cursor={cursor}, fields={fields}")
         
-        # 노트 조회
-        notes = controller.service.get_all_notes(limit=limit, offset=offset)
+        print("🔍 Step 2: 노트 조회 중...")
+        
+        # 노트 조회: offset이 있으면 기존 방식, 없으면 커서(키셋) 페이지네이션
+        next_cursor = None
+        if offset is not None:
+            notes = controller.service.get_all_notes(limit=limit, offset=offset, fields=fields)
+        else:
+            try:
+                notes, next_cursor = controller.service.get_notes_page(limit=limit, cursor=cursor, fields=fields)
+            except ValueError as e:
+                return controller.validation_error("cursor", str(e))
         
         print(f"🔍 Step 2 완료: {len(notes) if notes else 0}개 노트 조회됨")
         print(f"🔍 Notes Type: {type(notes)}")
@@ -114,7 +137,7 @@ def get_notes():
         notes_dicts = []
         for i, note in enumerate(notes):
             try:
-                note_dict = controller._note_to_dict(note)
+                note_dict = controller._note_to_dict(note, fields)
                 notes_dicts.append(note_dict)
                 if i == 0:  # 첫 번째 노트만 로그
                     print(f"🔍 First Note Dict: {note_dict}")
@@ -126,7 +149,9 @@ def get_notes():
             "notes": notes_dicts,
             "total": len(notes_dicts),
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
         }
         
         print(f"🔍 Step 3 완료: {len(notes_dicts)}개 노트 딕셔너리 변환됨")
@@ -141,7 +166,7 @@ def get_notes():
         print(f"🔍 Step 4 완료: 응답 생성됨")
         
         # 응답 로깅
-        log_response_details(success_response[0].get_json() if hasattr(success_response[0], 'get_json') else success_response)
+        log_response_details(response_data, body_size=success_response[0].content_length)
         
         return success_response
         
@@ -157,25 +182,27 @@ def get_notes():
             status=500
         )
         
-        log_response_details(error_response[0].get_json() if hasattr(error_response[0], 'get_json') else error_response, 500)
+        log_response_details({"error": str(e)}, 500, body_size=error_response[0].content_length)
         
         return error_response
 
 
 @notes_bp.route('/notes/<int:note_id>', methods=['GET'])
+@etag_conditional(lambda note_id: controller.service.get_note_version(note_id))
 def get_note(note_id):
     """특정 노트 조회"""
     log_request_details(f"GET /api/notes/{note_id}")
     
     try:
-        note = controller.service.get_note_by_id(note_id)
+        # 읽기 전용 경로라 노트 캐시를 사용 (수정/삭제 시 레포지토리가 무효화)
+        note = controller.service.get_note_data(note_id)
         
         response = controller.success_response(
             data={"note": controller._note_to_dict(note)},
             message="노트를 조회했습니다"
         )
         
-        log_response_details(response[0].get_json() if hasattr(response[0], 'get_json') else response)
+        log_response_details({"note": note}, body_size=response[0].content_length)
         return response
         
     except ValueError as e:
@@ -217,6 +244,59 @@ def create_note():
     return controller.create_note()
 
 
+@notes_bp.route('/notes/search', methods=['POST'])
+def search_notes():
+    """노트 검색 (FTS5 bm25 순, 하이라이트 포함)"""
+    log_request_details("POST /api/notes/search")
+    return controller.search_notes()
+
+
+@notes_bp.route('/notes/import', methods=['POST'])
+def import_notes():
+    """노트 일괄 가져오기 (JSON 배열 또는 NDJSON, 배치 삽입 + 마지막에 한 번 인덱싱)"""
+    # 본문 전체를 출력하는 log_request_details 대신 크기만 기록 (수천 개 노트가 로그에 찍히지 않도록)
+    print(f"\n🚀 API 요청: POST /api/notes/import ({request.mimetype}, {request.content_length} bytes)")
+    return controller.import_notes()
+
+
+@notes_bp.route('/notes/bulk', methods=['POST'])
+def bulk_notes():
+    """노트 일괄 삭제/태그 변경 (집합 단위 SQL, 한 트랜잭션)"""
+    log_request_details("POST /api/notes/bulk")
+    return controller.bulk_notes()
+
+
+@notes_bp.route('/notes/tags', methods=['GET'])
+@etag_conditional(lambda: controller.service.get_data_version())
+def get_tags():
+    """태그 목록 (?with_counts=1: 태그 클라우드용 노트 수/마지막 사용 시각)"""
+    log_request_details("GET /api/notes/tags")
+    return controller.get_tags()
+
+
+@notes_bp.route('/notes/tags/<path:tag>', methods=['GET'])
+@etag_conditional(lambda tag: controller.service.get_data_version())
+def get_notes_by_tag(tag):
+    """태그가 붙은 노트 목록"""
+    log_request_details(f"GET /api/notes/tags/{tag}")
+    return controller.get_notes_by_tag(tag)
+
+
+@notes_bp.route('/notes/suggest', methods=['GET'])
+def get_suggestions():
+    """제목/태그/단어 접두사 자동완성 (?q=검색어&limit=5)"""
+    log_request_details("GET /api/notes/suggest")
+    return controller.get_suggestions()
+
+
+@notes_bp.route('/notes/stats', methods=['GET'])
+@etag_conditional(lambda: controller.service.get_stats_version())
+def get_note_stats():
+    """노트 통계 (통계 테이블 조회, 노트 수와 무관하게 일정한 비용)"""
+    log_request_details("GET /api/notes/stats")
+    return controller.get_stats()
+
+
 @notes_bp.route('/notes/<int:note_id>', methods=['PUT'])
 def update_note(note_id):
     """노트 업데이트"""
@@ -5,7 +5,7 @@
 헬스체크, 상태 확인, 라우트 디버깅 등
 """
 
-from flask import Blueprint, jsonify, current_app
+from flask import Blueprint, jsonify, current_app, request
 from datetime import datetime
 from sqlalchemy import text
 from config.database import db
@@ -167,6 +167,102 @@ def debug_database():
         }), 500
 
 
+@system_bp.route('/debug/queries')
+def debug_queries():
+    """샘플링된 쿼리 진단 결과 (DB_DIAGNOSTICS_SAMPLE_RATE > 0일 때 기록)"""
+    try:
+        from utils.query_diagnostics import query_diagnostics
+
+        return jsonify({
+            **query_diagnostics.get_stats(),
+            "timestamp": datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        return jsonify({
+            "error": "쿼리 진단 조회 실패",
+            "details": str(e)
+        }), 500
+
+
+@system_bp.route('/debug/note-cache')
+def debug_note_cache():
+    """노트 단건 조회 캐시 지표 (적중/실패, 무효화, 크기)"""
+    try:
+        from utils.note_cache import note_cache
+
+        return jsonify({
+            **note_cache.get_stats(),
+            "timestamp": datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        return jsonify({
+            "error": "노트 캐시 조회 실패",
+            "details": str(e)
+        }), 500
+
+
+@system_bp.route('/debug/autocomplete')
+def debug_autocomplete():
+    """자동완성 색인 상태 (구성 시각, 노트/제목 키/태그/단어 수)"""
+    try:
+        from utils.autocomplete import note_autocomplete
+
+        return jsonify({
+            **note_autocomplete.get_stats(),
+            "timestamp": datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        return jsonify({
+            "error": "자동완성 색인 조회 실패",
+            "details": str(e)
+        }), 500
+
+
+@system_bp.route('/debug/chat-writer')
+def debug_chat_writer():
+    """채팅 기록 지연 저장 상태 (대기 중/저장된 기록 수, 마지막 저장 시간)"""
+    try:
+        from utils.chat_writer import chat_writer
+
+        return jsonify({
+            **chat_writer.get_stats(),
+            "timestamp": datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        return jsonify({
+            "error": "채팅 지연 저장 상태 조회 실패",
+            "details": str(e)
+        }), 500
+
+
+@system_bp.route('/debug/query-plans')
+def debug_query_plans():
+    """주요 쿼리의 EXPLAIN QUERY PLAN과 인덱스 사용 여부"""
+    try:
+        from config.migrations import explain_hot_queries, get_schema_version
+
+        with db.engine.connect() as connection:
+            schema_version = get_schema_version(connection)
+            queries = explain_hot_queries(connection)
+
+        return jsonify({
+            "schema_version": schema_version,
+            "all_indexed": all(query["uses_index"] and not query["temp_sort"] for query in queries),
+            "queries": queries,
+            "timestamp": datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        return jsonify({
+            "error": "쿼리 계획 조회 실패",
+            "details": str(e)
+        }), 500
+
+
 @system_bp.route('/debug/sample-notes', methods=['POST'])
 def create_sample_notes():
     """샘플 노트 생성 (디버깅용)"""
@@ -335,25 +431,13 @@ def get_date_ranges():
 
 @system_bp.route('/utils/activity', methods=['GET'])
 def get_activity_stats():
-    """노트 작성 활동 통계"""
+    """노트 작성 활동 통계 (일별 생성 수 버킷에서 계산, 노트는 읽지 않음)"""
     try:
-        from models.note import Note
-        from utils.date_utils import get_activity_stats
-        
-        # 모든 노트 데이터
-        notes = Note.query.all()
-        note_data = []
-        
-        for note in notes:
-            note_data.append({
-                'id': note.id,
-                'title': note.title,
-                'created_at': note.created_at.isoformat() if note.created_at else None,
-                'updated_at': note.updated_at.isoformat() if note.updated_at else None
-            })
+        from utils.note_stats import read_daily_counts
+        from utils.date_utils import summarize_daily_counts
         
-        # 활동 통계 계산
-        stats = get_activity_stats(note_data)
+        daily_counts = dict(read_daily_counts(db.session))
+        stats = summarize_daily_counts(daily_counts)
         
         return jsonify({
             "activity_stats": stats,
@@ -364,4 +448,37 @@ def get_activity_stats():
         return jsonify({
             "error": "활동 통계 조회 실패",
             "details": str(e)
+        }), 500
+
+
+@system_bp.route('/utils/activity/heatmap', methods=['GET'])
+def get_activity_heatmap():
+    """연간 작성 활동 히트맵 (?year=YYYY, 없으면 오늘까지 최근 365일)"""
+    try:
+        from datetime import date, timedelta
+        from utils.note_stats import read_daily_counts
+        from utils.date_utils import build_heatmap
+        
+        year = request.args.get('year')
+        if year is not None:
+            if not year.isdigit() or not 1970 <= int(year) <= 9999:
+                return jsonify({
+                    "error": "year는 1970~9999 사이의 연도여야 합니다"
+                }), 400
+            start, end = date(int(year), 1, 1), date(int(year), 12, 31)
+        else:
+            end = datetime.utcnow().date()
+            start = end - timedelta(days=364)
+        
+        daily_counts = dict(read_daily_counts(db.session, start.isoformat(), end.isoformat()))
+        
+        return jsonify({
+            "heatmap": build_heatmap(daily_counts, start, end),
+            "timestamp": datetime.now().isoformat()
+        })
+        
+    except Exception as e:
+        return jsonify({
+            "error": "활동 히트맵 조회 실패",
+            "details": str(e)
         }), 500
\ No newline at end of file
@@ -10,13 +10,17 @@
 5. 모든 누락된 메서드 구현
 """
 
+import time
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
 from config.settings import Config
 from models.note import ChatHistory, Note
 from config.database import db
+from app.repositories.base_repository import BaseRepository
 from chains.rag_chain import rag_chain
+from utils.chat_writer import chat_writer
+from utils.chat_archive import chat_archive
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,9 @@ logger = logging.getLogger(__name__)
 class ChatService:
     """완성된 채팅 서비스 클래스"""
     
+    # 채팅 통계 집계 캐시 (스냅숏, 포함 일수, 집계 시각, 저장/삭제 세대)
+    _analytics_cache = {"data": None, "days": 0, "at": 0.0, "generation": 0}
+    
     def __init__(self):
         self.api_key = Config.ANTHROPIC_API_KEY
     
@@ -104,8 +111,9 @@ class ChatService:
         
         if rag_enabled:
             try:
-                context = rag_chain.get_context_for_query(message, k=3)
+                # 검색은 한 번만 하고 같은 결과로 컨텍스트 생성
                 relevant_notes = rag_chain.search_similar_notes(message, k=3)
+                context = rag_chain.build_context(relevant_notes)
                 
                 # Claude에게 컨텍스트와 함께 질문
                 rag_prompt = f"""다음은 사용자의 노트들에서 검색된 관련 정보입니다:
@@ -205,15 +213,34 @@ class ChatService:
             logger.error(f"Chat history error: {str(e)}")
             return []
     
+    def get_chat_history_page(self, limit: int = 50, cursor: Optional[str] = None) -> dict:
+        """커서 기반 채팅 히스토리 조회 (최신순)
+
+        Raises:
+            ValueError: 유효하지 않은 커서
+        """
+        chat_records, next_cursor = BaseRepository(ChatHistory).find_page(limit=limit, cursor=cursor)
+
+        return {
+            "history": [chat.to_dict() for chat in chat_records],
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
+        }
+    
     def clear_chat_history(self) -> int:
-        """채팅 히스토리 삭제"""
+        """채팅 히스토리 삭제 (아카이브 파일 포함)"""
         try:
+            # 버퍼에 남은 기록도 함께 지워지도록 먼저 저장
+            chat_writer.flush()
+            
             # 모든 채팅 기록 개수 조회
             total_count = ChatHistory.query.count()
             
             # 모든 채팅 기록 삭제
             ChatHistory.query.delete()
             db.session.commit()
+            self._invalidate_analytics()
+            total_count += chat_archive.clear()
             
             logger.info(f"채팅 히스토리 {total_count}개 삭제 완료")
             return total_count
@@ -223,8 +250,29 @@ class ChatService:
             db.session.rollback()
             return 0
     
+    def archive_chat_history(self, retention_days: Optional[int] = None, max_rows: Optional[int] = None) -> dict:
+        """보관 기간/행 수를 넘는 오래된 채팅을 월별 압축 아카이브로 옮기기
+
+        Raises:
+            ValueError: 음수 설정값
+        """
+        for name, value in (("retention_days", retention_days), ("max_rows", max_rows)):
+            if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 0):
+                raise ValueError(f"{name}는 0 이상의 정수여야 합니다")
+        
+        # 버퍼에 남은 기록도 정책 대상에 포함
+        chat_writer.flush()
+        report = chat_archive.apply_retention(retention_days, max_rows)
+        if report["archived"]:
+            self._invalidate_analytics()
+        return report
+    
+    def get_archive_status(self) -> dict:
+        """채팅 아카이브 상태 (월별 기록 수/파일 크기, 마지막 실행)"""
+        return chat_archive.get_stats()
+    
     def search_chat_history(self, query: str, limit: int = 10) -> list:
-        """✅ 채팅 히스토리 검색 (새로 추가된 메서드)"""
+        """✅ 채팅 히스토리 검색 (DB 최신순, 부족하면 아카이브까지)"""
         try:
             if not query or not query.strip():
                 return []
@@ -241,74 +289,20 @@ class ChatService:
                 ChatHistory.created_at.desc()
             ).limit(limit).all()
             
-            return [chat.to_dict() for chat in results]
+            results = [chat.to_dict() for chat in results]
+            # DB에서 모자라면 아카이브(더 오래된 기록)에서 이어서 찾기
+            if len(results) < limit:
+                results += chat_archive.search(query, limit - len(results))
+            return results
             
         except Exception as e:
             logger.error(f"채팅 히스토리 검색 실패: {e}")
             return []
     
     def get_chat_summary(self, days: int = 7) -> dict:
-        """✅ 채팅 요약 통계 (새로 추가된 메서드)"""
+        """✅ 채팅 요약 통계 (시간별 집계 한 번에서 계산, CHAT_STATS_CACHE_SECONDS 동안 재사용)"""
         try:
-            # 지정된 일수 이전 날짜 계산
-            start_date = datetime.now() - timedelta(days=days)
-            
-            # 기간 내 채팅 수
-            period_chats = ChatHistory.query.filter(
-                ChatHistory.created_at >= start_date
-            ).count()
-            
-            # 일별 채팅 수
-            daily_stats = {}
-            for i in range(days):
-                day = datetime.now() - timedelta(days=i)
-                day_str = day.strftime('%Y-%m-%d')
-                
-                day_count = ChatHistory.query.filter(
-                    db.func.date(ChatHistory.created_at) == day.date()
-                ).count()
-                
-                daily_stats[day_str] = day_count
-            
-            # 가장 활발한 시간대 (시간별 통계)
-            hour_stats = {}
-            hour_results = db.session.query(
-                db.func.extract('hour', ChatHistory.created_at).label('hour'),
-                db.func.count(ChatHistory.id).label('count')
-            ).filter(
-                ChatHistory.created_at >= start_date
-            ).group_by('hour').all()
-            
-            for hour, count in hour_results:
-                hour_stats[f"{int(hour):02d}:00"] = count
-            
-            # 평균 메시지 길이
-            recent_chats = ChatHistory.query.filter(
-                ChatHistory.created_at >= start_date
-            ).all()
-            
-            avg_user_length = 0
-            avg_ai_length = 0
-            
-            if recent_chats:
-                user_lengths = [len(chat.user_message or '') for chat in recent_chats]
-                ai_lengths = [len(chat.ai_response or '') for chat in recent_chats]
-                
-                avg_user_length = round(sum(user_lengths) / len(user_lengths))
-                avg_ai_length = round(sum(ai_lengths) / len(ai_lengths))
-            
-            return {
-                "period_days": days,
-                "total_chats": period_chats,
-                "daily_stats": daily_stats,
-                "hourly_stats": hour_stats,
-                "average_message_length": {
-                    "user": avg_user_length,
-                    "ai": avg_ai_length
-                },
-                "most_active_day": max(daily_stats.items(), key=lambda x: x[1])[0] if daily_stats else None,
-                "timestamp": self._get_timestamp()
-            }
+            return self._summarize_period(self._chat_analytics(days), days)
             
         except Exception as e:
             logger.error(f"채팅 요약 통계 실패: {e}")
@@ -319,30 +313,175 @@ class ChatService:
                 "timestamp": self._get_timestamp()
             }
     
+    def get_chat_analytics(self, periods=(1, 7, 30)) -> dict:
+        """대시보드용 채팅 통계 (기본 통계 + 기간별 요약을 같은 집계에서 계산)"""
+        snapshot = self._chat_analytics(max(periods))
+        return {
+            "basic_stats": self._basic_stats(snapshot),
+            "period_summaries": {f"{days}d": self._summarize_period(snapshot, days) for days in periods}
+        }
+    
+    def _chat_analytics(self, days: int) -> dict:
+        """채팅 집계 스냅숏 (SQL 두 번: 최근 days일의 시간별 버킷 / 모델별 전체 집계)
+
+        시간별 버킷(YYYY-MM-DD HH)마다 채팅 수와 사용자/AI 메시지 길이 합을 받아 두고
+        기간별 요약은 이 버킷을 파이썬에서 다시 묶는다 (버킷 수는 최대 days × 24개).
+        created_at은 UTC로 저장되므로 기간과 날짜도 UTC 기준이다.
+        """
+        now = datetime.utcnow()
+        cache = ChatService._analytics_cache
+        if (cache["data"] is not None and cache["days"] >= days
+                and time.monotonic() - cache["at"] < Config.CHAT_STATS_CACHE_SECONDS):
+            return cache["data"]
+        
+        generation = cache["generation"]
+        since = (now - timedelta(days=days)).replace(minute=0, second=0, microsecond=0)
+        buckets = ChatHistory.hourly_buckets_query(since).all()
+        
+        # 최근 100개 응답의 평균 길이는 모델별 집계와 같은 문장의 스칼라 서브쿼리로
+        recent_responses = db.session.query(ChatHistory.ai_response).order_by(
+            ChatHistory.created_at.desc()
+        ).limit(100).subquery()
+        recent_avg = db.session.query(
+            db.func.avg(db.func.length(recent_responses.c.ai_response))
+        ).scalar_subquery()
+        models = db.session.query(
+            ChatHistory.model_used,
+            db.func.count(ChatHistory.id),
+            db.func.max(ChatHistory.created_at),
+            recent_avg
+        ).group_by(ChatHistory.model_used).all()
+        
+        snapshot = {
+            "now": now,
+            "buckets": [(key, count, user_length, ai_length) for key, count, user_length, ai_length in buckets],
+            "model_usage": {model or 'Unknown': count for model, count, _, _ in models},
+            "last_chat": max((last for _, _, last, _ in models if last), default=None),
+            "average_response_length": round(models[0][3] or 0) if models else 0
+        }
+        # 집계 중에 새 채팅이 저장됐다면 캐시하지 않음 (다음 요청에서 다시 집계)
+        if cache["generation"] == generation:
+            ChatService._analytics_cache = {"data": snapshot, "days": days, "at": time.monotonic(),
+                                            "generation": generation}
+        return snapshot
+    
+    @classmethod
+    def _invalidate_analytics(cls):
+        """채팅 저장/삭제 후 통계 캐시 비우기"""
+        cls._analytics_cache = {"data": None, "days": 0, "at": 0.0,
+                                "generation": cls._analytics_cache["generation"] + 1}
+    
+    def _summarize_period(self, snapshot: dict, days: int) -> dict:
+        """시간별 버킷 → 최근 days일 요약 (기간 경계는 시간 단위로 자름)"""
+        now = snapshot["now"]
+        since_key = (now - timedelta(days=days)).strftime('%Y-%m-%d %H')
+        daily_stats = {(now - timedelta(days=i)).strftime('%Y-%m-%d'): 0 for i in range(days)}
+        hour_stats = {}
+        total = user_length = ai_length = 0
+        
+        for key, count, user_sum, ai_sum in snapshot["buckets"]:
+            day = key[:10]
+            if day in daily_stats:
+                daily_stats[day] += count
+            if key < since_key:
+                continue
+            total += count
+            user_length += user_sum
+            ai_length += ai_sum
+            hour_key = f"{key[11:13]}:00"
+            hour_stats[hour_key] = hour_stats.get(hour_key, 0) + count
+        
+        return {
+            "period_days": days,
+            "total_chats": total,
+            "daily_stats": daily_stats,
+            "hourly_stats": dict(sorted(hour_stats.items())),
+            "average_message_length": {
+                "user": round(user_length / total) if total else 0,
+                "ai": round(ai_length / total) if total else 0
+            },
+            "most_active_day": max(daily_stats.items(), key=lambda x: x[1])[0] if daily_stats else None,
+            "timestamp": self._get_timestamp()
+        }
+    
+    def _basic_stats(self, snapshot: dict) -> dict:
+        """집계 스냅숏 → get_chat_stats 응답"""
+        today_key = snapshot["now"].strftime('%Y-%m-%d')
+        week_key = (snapshot["now"] - timedelta(days=7)).strftime('%Y-%m-%d %H')
+        last_chat = snapshot["last_chat"]
+        if isinstance(last_chat, str):
+            last_chat = datetime.fromisoformat(last_chat)
+        
+        return {
+            "total_chats": sum(snapshot["model_usage"].values()),
+            "recent_chats_7d": sum(count for key, count, _, _ in snapshot["buckets"] if key >= week_key),
+            "today_chats": sum(count for key, count, _, _ in snapshot["buckets"] if key.startswith(today_key)),
+            "model_usage": snapshot["model_usage"],
+            "average_response_length": snapshot["average_response_length"],
+            "rag_enabled": rag_chain.is_available(),
+            "claude_connected": bool(self.api_key),
+            "last_chat": last_chat.isoformat() if last_chat else None,
+            "timestamp": self._get_timestamp()
+        }
+    
+    @staticmethod
+    def _parse_export_date(value: Optional[str]) -> Optional[datetime]:
+        """내보내기 기간 문자열 → UTC 기준 naive datetime (created_at과 같은 기준)"""
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
+    
+    def _export_query(self, start_dt: Optional[datetime] = None, end_dt: Optional[datetime] = None):
+        """내보내기 대상 채팅 기록 쿼리 (기간 필터, 오래된 순)"""
+        query = ChatHistory.query
+        
+        if start_dt:
+            query = query.filter(ChatHistory.created_at >= start_dt)
+        if end_dt:
+            query = query.filter(ChatHistory.created_at <= end_dt)
+        
+        return query.order_by(ChatHistory.created_at.asc(), ChatHistory.id.asc())
+    
+    def _export_record(self, chat) -> dict:
+        """내보내기용 채팅 기록 한 건 (DB 행 또는 아카이브의 dict)"""
+        if isinstance(chat, dict):
+            return {key: chat.get(key) for key in ("id", "user_message", "ai_response", "model_used", "created_at")}
+        return {
+            "id": chat.id,
+            "user_message": chat.user_message,
+            "ai_response": chat.ai_response,
+            "model_used": chat.model_used,
+            "created_at": chat.created_at.isoformat() if chat.created_at else None
+        }
+    
+    def iter_chat_history(self, start_date: Optional[str] = None, end_date: Optional[str] = None):
+        """채팅 기록 내보내기 스트리밍 (아카이브 → DB 순, DB는 STREAM_BATCH_SIZE개씩 나눠 읽는 제너레이터)
+        
+        기간 형식이 잘못되면 첫 행을 읽기 전에 ValueError
+        """
+        start_dt = self._parse_export_date(start_date)
+        end_dt = self._parse_export_date(end_date)
+        query = self._export_query(start_dt, end_dt)
+        
+        def generate():
+            for record in chat_archive.iter_records(start_dt, end_dt):
+                yield self._export_record(record)
+            for chat in query.yield_per(Config.STREAM_BATCH_SIZE):
+                yield self._export_record(chat)
+        
+        return generate()
+    
     def export_chat_history(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> dict:
         """✅ 채팅 히스토리 내보내기 (새로 추가된 메서드)"""
         try:
-            query = ChatHistory.query
-            
-            # 날짜 필터링
-            if start_date:
-                try:
-                    start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-                    query = query.filter(ChatHistory.created_at >= start_dt)
-                except:
-                    start_dt = datetime.fromisoformat(start_date)
-                    query = query.filter(ChatHistory.created_at >= start_dt)
-            
-            if end_date:
-                try:
-                    end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-                    query = query.filter(ChatHistory.created_at <= end_dt)
-                except:
-                    end_dt = datetime.fromisoformat(end_date)
-                    query = query.filter(ChatHistory.created_at <= end_dt)
-            
-            # 모든 채팅 기록 조회
-            chat_records = query.order_by(ChatHistory.created_at.asc()).all()
+            # 아카이브 + DB의 모든 채팅 기록 조회
+            chat_records = list(self.iter_chat_history(start_date, end_date))
             
             # 내보내기 데이터 구성
             export_data = {
@@ -354,16 +493,7 @@ class ChatService:
                         "end": end_date
                     }
                 },
-                "chat_history": [
-                    {
-                        "id": chat.id,
-                        "user_message": chat.user_message,
-                        "ai_response": chat.ai_response,
-                        "model_used": chat.model_used,
-                        "created_at": chat.created_at.isoformat()
-                    }
-                    for chat in chat_records
-                ]
+                "chat_history": chat_records
             }
             
             return {
@@ -386,54 +516,9 @@ class ChatService:
     # =========================
     
     def get_chat_stats(self) -> dict:
-        """채팅 통계 정보"""
+        """채팅 통계 정보 (get_chat_summary와 같은 집계 스냅숏 사용)"""
         try:
-            # 기본 통계
-            total_chats = ChatHistory.query.count()
-            
-            # 최근 7일 채팅 수
-            week_ago = datetime.now() - timedelta(days=7)
-            recent_chats = ChatHistory.query.filter(
-                ChatHistory.created_at >= week_ago
-            ).count()
-            
-            # 오늘 채팅 수
-            today = datetime.now().date()
-            today_chats = ChatHistory.query.filter(
-                db.func.date(ChatHistory.created_at) == today
-            ).count()
-            
-            # 모델별 사용 통계
-            model_stats = {}
-            model_results = db.session.query(
-                ChatHistory.model_used,
-                db.func.count(ChatHistory.id).label('count')
-            ).group_by(ChatHistory.model_used).all()
-            
-            for model, count in model_results:
-                model_stats[model or 'Unknown'] = count
-            
-            # 평균 응답 길이 (최근 100개)
-            recent_responses = ChatHistory.query.order_by(
-                ChatHistory.created_at.desc()
-            ).limit(100).all()
-            
-            avg_response_length = 0
-            if recent_responses:
-                total_length = sum(len(chat.ai_response or '') for chat in recent_responses)
-                avg_response_length = round(total_length / len(recent_responses))
-            
-            return {
-                "total_chats": total_chats,
-                "recent_chats_7d": recent_chats,
-                "today_chats": today_chats,
-                "model_usage": model_stats,
-                "average_response_length": avg_response_length,
-                "rag_enabled": rag_chain.is_available(),
-                "claude_connected": bool(self.api_key),
-                "last_chat": recent_responses[0].created_at.isoformat() if recent_responses else None,
-                "timestamp": self._get_timestamp()
-            }
+            return self._basic_stats(self._chat_analytics(7))
             
         except Exception as e:
             logger.error(f"채팅 통계 조회 실패: {e}")
@@ -523,6 +608,30 @@ class ChatService:
                 "notes_indexed": 0
             }
     
+    def start_rag_migration(self, model_name: str) -> dict:
+        """새 임베딩 모델로 온라인 마이그레이션 시작"""
+        if not model_name or not model_name.strip():
+            raise ValueError("마이그레이션할 모델 이름이 필요합니다")
+        
+        if not rag_chain.is_available():
+            return {
+                "success": False,
+                "message": "RAG 시스템을 사용할 수 없습니다"
+            }
+        
+        return rag_chain.start_migration(model_name.strip())
+    
+    def get_rag_migration_status(self) -> dict:
+        """임베딩 모델 마이그레이션 진행 상황"""
+        if not rag_chain.is_available():
+            return {"active_model": None, "migration": None}
+        
+        return {
+            "active_model": rag_chain.model_name,
+            "migration": rag_chain.get_migration_status(),
+            "timestamp": self._get_timestamp()
+        }
+    
     # =========================
     # 내부 헬퍼 메서드들
     # =========================
@@ -575,8 +684,12 @@ class ChatService:
         }
     
     def _save_chat_history(self, user_message: str, ai_response: str, model: str):
-        """채팅 기록 저장"""
+        """채팅 기록 저장 (지연 저장이 켜져 있으면 버퍼에 넣고 바로 반환)"""
         try:
+            if chat_writer.running:
+                chat_writer.enqueue(user_message, ai_response, model)
+                return
+            
             chat_record = ChatHistory(
                 user_message=user_message,
                 ai_response=ai_response,
@@ -585,6 +698,7 @@ class ChatService:
             
             db.session.add(chat_record)
             db.session.commit()
+            self._invalidate_analytics()
             
             logger.debug(f"Chat history saved: {chat_record.id}")
             
@@ -598,4 +712,8 @@ class ChatService:
     
     def _get_db_connection(self):
         """데이터베이스 연결 반환 (호환성)"""
-        return db.session
\ No newline at end of file
+        return db.session
+
+
+# 지연 저장된 채팅이 DB에 들어가면 통계 캐시 비우기
+chat_writer.add_flush_listener(ChatService._invalidate_analytics)
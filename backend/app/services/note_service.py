@@ -6,15 +6,27 @@ NoteService - 디버깅 강화 버전
 """
 
 from app.repositories.note_repository import NoteRepository
+from models.note import Note
+from config.settings import Config
+from utils.autocomplete import note_autocomplete, load_note_rows
 import re
+import time
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger(__name__)
 
 
 class NoteService:
     """노트 비즈니스 로직 서비스"""
+
+    # 일괄 작업 → 태그 처리 방식 (None이면 삭제)
+    BULK_ACTIONS = {
+        'delete': None,
+        'add_tags': 'add',
+        'remove_tags': 'remove',
+        'set_tags': 'set',
+    }
     
     def __init__(self):
         print("🔧 NoteService 초기화 중...")
@@ -29,9 +41,10 @@ class NoteService:
     def _initialize_rag(self):
         """RAG 시스템 초기화"""
         try:
-            from chains.rag_chain import rag_chain, RAG_AVAILABLE
+            from chains.rag_chain import rag_chain
             
-            if RAG_AVAILABLE and rag_chain and rag_chain.is_available():
+            # 경량 엔진(lite)도 같은 인터페이스로 인덱싱 가능
+            if rag_chain and rag_chain.is_available():
                 self.rag_chain = rag_chain
                 self.rag_available = True
                 logger.info("✅ NoteService RAG 시스템 연결 성공")
@@ -41,68 +54,58 @@ class NoteService:
         except ImportError as e:
             logger.warning(f"⚠️ NoteService RAG 시스템 임포트 실패: {e}")
     
-    def get_all_notes(self, limit=None, offset=None):
-        """모든 노트 조회 (페이지네이션 지원) - 디버깅 강화"""
-        
-        print(f"\n{'='*60}")
-        print(f"🗄️ NoteService.get_all_notes() 실행")
-        print(f"{'='*60}")
-        print(f"📋 Parameters: limit={limit}, offset={offset}")
-        
+    def parse_fields(self, fields):
+        """fields 파라미터(쉼표 구분 문자열 또는 목록) → 응답 필드 목록 (없으면 None = 전체)
+
+        Raises:
+            ValueError: 지원하지 않는 필드
+        """
+        if not fields:
+            return None
+        if isinstance(fields, str):
+            fields = fields.split(',')
+
+        parsed = []
+        for field in fields:
+            field = str(field).strip()
+            if field and field not in parsed:
+                parsed.append(field)
+
+        unknown = [field for field in parsed if field not in Note.FIELD_COLUMNS]
+        if unknown:
+            raise ValueError(f"지원하지 않는 필드입니다: {', '.join(unknown)} "
+                             f"(가능한 필드: {', '.join(Note.FIELD_COLUMNS)})")
+        return parsed or None
+    
+    def get_all_notes(self, limit=None, offset=None, fields=None):
+        """모든 노트 조회 (페이지네이션 지원)"""
         try:
-            print("🔍 Step 1: Repository.find_all() 호출 중...")
-            
-            # Repository에서 데이터 조회
-            notes = self.repository.find_all(limit=limit, offset=offset)
-            
-            print(f"🔍 Step 1 완료:")
-            print(f"   - 조회된 노트 수: {len(notes) if notes else 0}")
-            print(f"   - Notes 타입: {type(notes)}")
-            
-            if notes is None:
-                print("⚠️ Repository에서 None 반환!")
-                return []
-            
-            if len(notes) == 0:
-                print("⚠️ Repository에서 빈 리스트 반환!")
-                print("🔍 DB에 노트가 없거나 쿼리 조건에 맞는 노트가 없음")
-                return notes
-            
-            # 첫 번째 노트 상세 정보 출력
-            if len(notes) > 0:
-                first_note = notes[0]
-                print(f"🔍 첫 번째 노트 상세:")
-                print(f"   - ID: {getattr(first_note, 'id', 'No ID')}")
-                print(f"   - Title: {getattr(first_note, 'title', 'No Title')}")
-                print(f"   - Content Length: {len(getattr(first_note, 'content', '')) if getattr(first_note, 'content', None) else 0}")
-                print(f"   - Created At: {getattr(first_note, 'created_at', 'No Date')}")
-                print(f"   - Tags: {getattr(first_note, 'tags_list', 'No Tags')}")
-                print(f"   - Note Type: {type(first_note)}")
-                
-                # 노트 객체의 모든 속성 출력
-                try:
-                    print(f"🔍 Note Attributes: {dir(first_note)}")
-                    print(f"🔍 Note Dict: {first_note.__dict__ if hasattr(first_note, '__dict__') else 'No __dict__'}")
-                except Exception as attr_error:
-                    print(f"⚠️ 속성 확인 실패: {attr_error}")
-            
-            print(f"✅ NoteService.get_all_notes() 완료: {len(notes)}개 노트 반환")
-            print(f"{'='*60}\n")
-            
-            return notes
-            
+            return self.repository.find_all(limit=limit, offset=offset, fields=fields)
+
         except Exception as e:
-            print(f"❌ NoteService.get_all_notes() 에러:")
-            print(f"   - 에러 타입: {type(e).__name__}")
-            print(f"   - 에러 메시지: {str(e)}")
-            
-            import traceback
-            print(f"❌ 전체 트레이스백:")
-            traceback.print_exc()
-            
             logger.error(f"Error getting all notes: {e}")
             raise Exception(f"노트 목록 조회 중 오류가 발생했습니다: {str(e)}")
     
+    def get_notes_page(self, limit=None, cursor=None, fields=None):
+        """커서 기반 노트 목록 조회 → (노트 목록, 다음 커서)
+
+        Raises:
+            ValueError: 유효하지 않은 커서
+        """
+        try:
+            return self.repository.find_page(limit=limit, cursor=cursor,
+                                             query=self.repository.list_query(fields))
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting notes page: {e}")
+            raise Exception(f"노트 목록 조회 중 오류가 발생했습니다: {str(e)}")
+    
+    def iter_notes(self, limit=None, fields=None):
+        """노트 목록 스트리밍용 제너레이터 (최신순, STREAM_BATCH_SIZE개씩 DB에서 나눠 읽음)"""
+        return self.repository.iter_all(limit=limit, fields=fields, batch_size=Config.STREAM_BATCH_SIZE)
+    
     def get_note_by_id(self, note_id):
         """ID로 노트 조회"""
         print(f"\n🔍 NoteService.get_note_by_id({note_id}) 실행")
@@ -126,6 +129,40 @@ class NoteService:
             logger.error(f"Error getting note by id {note_id}: {e}")
             raise Exception(f"노트 조회 중 오류가 발생했습니다: {str(e)}")
     
+    def get_note_data(self, note_id):
+        """ID로 노트 dict 조회 (읽기 전용, 노트 캐시 사용)"""
+        if not note_id or note_id <= 0:
+            raise ValueError("유효하지 않은 노트 ID입니다")
+        
+        try:
+            note_data = self.repository.find_dict_by_id(note_id)
+        except Exception as e:
+            logger.error(f"Error getting note data {note_id}: {e}")
+            raise Exception(f"노트 조회 중 오류가 발생했습니다: {str(e)}")
+        
+        if not note_data:
+            raise ValueError(f"노트 ID {note_id}를 찾을 수 없습니다")
+        return note_data
+    
+    def get_data_version(self):
+        """노트 목록/통계 응답의 버전 (ETag용, 본문 조회 없이 카운터만 읽음)"""
+        return self.repository.data_version()
+    
+    def get_stats_version(self):
+        """통계 응답의 버전 (ETag용)
+
+        최근 7일/일별 생성 수는 날짜가 바뀌면 데이터 변경 없이도 달라지므로
+        데이터 버전에 오늘 UTC 날짜를 더함 (버전을 못 읽으면 None → ETag 없음)
+        """
+        version = self.get_data_version()
+        if version is None:
+            return None
+        return version, datetime.utcnow().date().isoformat()
+    
+    def get_note_version(self, note_id):
+        """노트 단건 응답의 버전 (ETag용)"""
+        return self.repository.note_version(note_id)
+    
     def create_note(self, title, content, tags=None):
         """새 노트 생성"""
         print(f"\n📝 NoteService.create_note() 실행")
@@ -164,6 +201,7 @@ class NoteService:
             
             # RAG 인덱스 업데이트
             self._update_rag_index(note)
+            note_autocomplete.upsert_note(note.id, note.title, tags, note.content)
             
             logger.info(f"Created new note: '{title}' (ID: {note.id})")
             return note
@@ -174,6 +212,190 @@ class NoteService:
             logger.error(f"Error creating note: {e}")
             raise Exception(f"노트 생성 중 오류가 발생했습니다: {str(e)}")
     
+    def update_note(self, note_id, title=None, content=None, tags=None):
+        """노트 수정 (주어진 필드만 변경, 제목/내용이 바뀌면 RAG 인덱스도 갱신)"""
+        print(f"\n✏️ NoteService.update_note({note_id}) 실행")
+        
+        try:
+            if not note_id or note_id <= 0:
+                raise ValueError("유효하지 않은 노트 ID입니다")
+            
+            fields = {}
+            if title is not None:
+                if not isinstance(title, str) or not title.strip():
+                    raise ValueError("제목은 비워둘 수 없습니다")
+                fields['title'] = title.strip()
+            if content is not None:
+                if not isinstance(content, str) or not content.strip():
+                    raise ValueError("내용은 비워둘 수 없습니다")
+                fields['content'] = content.strip()
+            if tags is not None:
+                fields['tags'] = self.validate_tags(tags)
+            
+            if not fields:
+                raise ValueError("업데이트할 필드가 없습니다")
+            
+            note = self.repository.find_by_id(note_id)
+            if not note:
+                raise ValueError(f"노트 ID {note_id}를 찾을 수 없습니다")
+            
+            reindex = fields.get('title', note.title) != note.title or fields.get('content', note.content) != note.content
+            note = self.repository.update(note, **fields)
+            
+            if reindex:
+                self._update_rag_index(note)
+            note_autocomplete.upsert_note(note.id, note.title, note.get_tags(), note.content)
+            
+            print(f"✅ 노트 ID {note_id} 수정 완료")
+            logger.info(f"Updated note ID: {note_id} ({', '.join(fields)})")
+            return note
+            
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error updating note {note_id}: {e}")
+            raise Exception(f"노트 수정 중 오류가 발생했습니다: {str(e)}")
+    
+    def import_notes(self, records, batch_size=None):
+        """노트 일괄 가져오기
+
+        records를 하나씩 검증/태그 추출하면서 batch_size개씩 한 트랜잭션으로 삽입하고,
+        RAG 인덱싱은 모든 삽입이 끝난 뒤 배치 임베딩 한 번으로 처리한다 (인덱스 저장도 한 번).
+        잘못된 항목은 건너뛰고 오류 목록에 기록한다.
+        삽입 중 DB 오류가 나면 거기서 멈추고, 이미 커밋된 배치는 인덱싱한 뒤 aborted에 원인을 담아 반환한다.
+
+        Args:
+            records: 노트 dict를 차례로 내는 이터러블 (JSON 배열, NDJSON 스트림 등).
+                     파싱에 실패한 항목은 예외 객체로 전달하면 해당 위치의 오류로 기록
+            batch_size: 트랜잭션당 노트 수 (기본 NOTE_IMPORT_BATCH_SIZE)
+
+        Returns:
+            가져온/실패한 노트 수, 오류 목록, 단계별(파싱·검증/삽입/인덱싱) 처리량
+        """
+        print(f"\n📥 NoteService.import_notes() 실행")
+
+        batch_size = max(1, batch_size or Config.NOTE_IMPORT_BATCH_SIZE)
+        phases = {name: {"count": 0, "seconds": 0.0} for name in ("validate", "insert", "index")}
+        errors = []
+        failed = 0
+        note_ids = []
+        batch = []
+
+        def flush():
+            started = time.perf_counter()
+            note_ids.extend(self.repository.bulk_insert(batch))
+            phases["insert"]["seconds"] += time.perf_counter() - started
+            phases["insert"]["count"] += len(batch)
+            batch.clear()
+
+        aborted = None
+        iterator = iter(records)
+        position = 0
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    record = next(iterator)
+                except StopIteration:
+                    break
+                position += 1
+
+                try:
+                    if isinstance(record, Exception):
+                        raise ValueError(str(record))
+                    row = self._validate_import_record(record)
+                except ValueError as e:
+                    failed += 1
+                    if len(errors) < Config.NOTE_IMPORT_MAX_ERRORS:
+                        errors.append({"index": position, "error": str(e)})
+                    continue
+                finally:
+                    phases["validate"]["seconds"] += time.perf_counter() - started
+
+                phases["validate"]["count"] += 1
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    flush()
+
+            if batch:
+                flush()
+
+        except Exception as e:
+            aborted = f"{position}번째 항목 처리 중 중단: {e}"
+            logger.error(f"Note import aborted after {len(note_ids)} notes: {e}")
+
+        # 삽입이 끝난 뒤 한 번에 임베딩 (본문은 DB에서 나눠 읽어 메모리에 모두 올리지 않음)
+        if note_ids and self.rag_available and self.rag_chain:
+            started = time.perf_counter()
+            for rows in self.repository.iter_index_rows(note_ids, batch_size):
+                phases["index"]["count"] += self.rag_chain.add_notes(rows, save=False)
+            self.rag_chain.save_index()
+            phases["index"]["seconds"] = time.perf_counter() - started
+
+        if note_ids and note_autocomplete.accepts_updates:
+            for row in self.repository.iter_autocomplete_rows(note_ids, batch_size):
+                note_autocomplete.upsert_note(*row)
+
+        for phase in phases.values():
+            phase["seconds"] = round(phase["seconds"], 4)
+            phase["per_second"] = round(phase["count"] / phase["seconds"], 1) if phase["seconds"] else None
+
+        report = {
+            "imported": len(note_ids),
+            "failed": failed,
+            "errors": errors,
+            "batches": -(-len(note_ids) // batch_size),
+            "batch_size": batch_size,
+            "indexed": phases["index"]["count"],
+            "aborted": aborted,
+            "phases": phases
+        }
+
+        print(f"✅ 일괄 가져오기 완료: {report['imported']}개 성공, {failed}개 실패")
+        logger.info(f"Imported {report['imported']} notes ({failed} failed) in {report['batches']} batches")
+        return report
+
+    def _validate_import_record(self, record):
+        """가져올 노트 항목 검증 → bulk_insert용 행
+
+        Raises:
+            ValueError: 필수 필드 누락, 잘못된 형식
+        """
+        if not isinstance(record, dict):
+            raise ValueError("노트 항목은 JSON 객체여야 합니다")
+
+        title = record.get('title')
+        content = record.get('content')
+        if not isinstance(title, str) or not title.strip():
+            raise ValueError("제목은 필수입니다")
+        if not isinstance(content, str) or not content.strip():
+            raise ValueError("내용은 필수입니다")
+
+        title = title.strip()
+        content = content.strip()
+        if len(title) > 255:
+            raise ValueError("제목은 255자 이하여야 합니다")
+
+        tags = record.get('tags')
+        tags = self.extract_tags_from_content(content) if tags is None else self.validate_tags(tags)
+
+        row = {"title": title, "content": content, "tags": tags}
+
+        # 다른 서비스에서 옮겨오는 노트의 작성 시각 유지 (ISO 8601)
+        # DB에는 UTC naive로 저장하므로 오프셋이 있으면 UTC로 바꾼 뒤 tzinfo를 뗀다
+        for field in ('created_at', 'updated_at'):
+            value = record.get(field)
+            if value:
+                try:
+                    parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+                except ValueError:
+                    raise ValueError(f"{field} 형식이 올바르지 않습니다 (ISO 8601): {value}")
+                if parsed.tzinfo is not None:
+                    parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+                row[field] = parsed
+
+        return row
+
     def extract_tags_from_content(self, content):
         """내용에서 태그 추출 (#태그 형식)"""
         if not content:
@@ -216,9 +438,17 @@ class NoteService:
                     logger.warning(f"⚠️ 노트 {note.id} RAG 인덱스 업데이트 실패")
             except Exception as e:
                 logger.error(f"❌ RAG 인덱스 업데이트 오류: {e}")
+
+    def _remove_from_rag_index(self, note_id):
+        """삭제된 노트를 RAG 인덱스에서 제거"""
+        if self.rag_available and self.rag_chain:
+            try:
+                self.rag_chain.remove_note(note_id)
+            except Exception as e:
+                logger.error(f"❌ RAG 인덱스 제거 오류: {e}")
     
     # 다른 메서드들도 기본 로깅 유지
-    def search_notes(self, query=None, tags=None, limit=50):
+    def search_notes(self, query=None, tags=None, limit=50, fields=None):
         """노트 검색"""
         print(f"\n🔍 NoteService.search_notes() 실행")
         print(f"   - Query: {query}")
@@ -228,13 +458,14 @@ class NoteService:
         try:
             if not query and not tags:
                 # 검색어가 없으면 최근 노트 반환
-                results = self.repository.find_recent(limit)
+                results = self.repository.find_recent(limit, fields=fields)
             else:
                 # 통합 검색 실행
                 results = self.repository.search_combined(
                     query=query,
                     tags=tags,
-                    limit=limit
+                    limit=limit,
+                    fields=fields
                 )
             
             print(f"✅ 검색 완료: {len(results)}개 노트 발견")
@@ -244,7 +475,61 @@ class NoteService:
         except Exception as e:
             logger.error(f"Error searching notes: {e}")
             raise Exception(f"노트 검색 중 오류가 발생했습니다: {str(e)}")
-        
+
+    def iter_search_notes(self, query=None, tags=None, limit=None, fields=None):
+        """노트 검색 스트리밍용 제너레이터 (limit이 없으면 모든 결과)"""
+        if not query and not tags:
+            return self.iter_notes(limit=limit, fields=fields)
+        return self.repository.iter_search(query=query, tags=tags, limit=limit, fields=fields,
+                                           batch_size=Config.STREAM_BATCH_SIZE)
+
+    def get_all_tags(self, with_counts=False):
+        """태그 목록 (이름순), with_counts면 노트 수/마지막 사용 시각 포함 (노트 수 많은 순)"""
+        try:
+            summary = self.repository.get_tag_summary()
+            if with_counts:
+                return summary
+            return sorted((tag["name"] for tag in summary), key=str.lower)
+
+        except Exception as e:
+            logger.error(f"Error getting tags: {e}")
+            raise Exception(f"태그 목록 조회 중 오류가 발생했습니다: {str(e)}")
+
+    def get_notes_by_tag(self, tag):
+        """태그가 붙은 노트 목록 (최신순)"""
+        tags = self.validate_tags([tag]) if isinstance(tag, str) else []
+        if not tags:
+            raise ValueError("유효하지 않은 태그입니다")
+
+        try:
+            return self.repository.find_by_tags(tags)
+
+        except Exception as e:
+            logger.error(f"Error getting notes by tag {tag}: {e}")
+            raise Exception(f"태그별 노트 조회 중 오류가 발생했습니다: {str(e)}")
+
+    def get_suggestions(self, query, limit=5):
+        """제목/태그/단어 접두사 자동완성 (메모리 색인, 첫 호출 때 한 번 구성)"""
+        if not isinstance(query, str) or len(query.strip()) < 1:
+            raise ValueError("검색어(q)를 입력해주세요")
+
+        try:
+            note_autocomplete.ensure_built(lambda: load_note_rows(Config.STREAM_BATCH_SIZE))
+            return note_autocomplete.suggest(query, limit)
+
+        except Exception as e:
+            logger.error(f"Error getting suggestions for '{query}': {e}")
+            raise Exception(f"자동완성 조회 중 오류가 발생했습니다: {str(e)}")
+
+    def get_note_stats(self):
+        """노트 통계 (생성/수정/삭제 시 증분 갱신된 값 조회)"""
+        try:
+            return self.repository.get_note_stats()
+
+        except Exception as e:
+            logger.error(f"Error getting note stats: {e}")
+            raise Exception(f"노트 통계 조회 중 오류가 발생했습니다: {str(e)}")
+
     def delete_note(self, note_id):
         """노트 삭제"""
         print(f"\n🗑️ NoteService.delete_note({note_id}) 실행")
@@ -252,25 +537,87 @@ class NoteService:
         try:
             if not note_id or note_id <= 0:
                 raise ValueError("유효하지 않은 노트 ID입니다")
-            
-            note = self.repository.find_by_id(note_id)
-            if not note:
+
+            # 존재 확인은 repository.delete가 같은 조회로 처리 (노트를 두 번 읽지 않음)
+            if not self.repository.delete(note_id):
                 print(f"❌ 노트 ID {note_id} 찾을 수 없음")
                 raise ValueError(f"노트 ID {note_id}를 찾을 수 없습니다")
-            
-            print(f"🔍 삭제할 노트: ID={note.id}, Title='{note.title}'")
-            
-            success = self.repository.delete(note_id)
-            if success:
-                print(f"✅ 노트 ID {note_id} 삭제 성공")
-                logger.info(f"Deleted note ID: {note_id}")
-                return True
-            else:
-                print(f"❌ 노트 ID {note_id} 삭제 실패")
-                return False
+
+            print(f"✅ 노트 ID {note_id} 삭제 성공")
+            logger.info(f"Deleted note ID: {note_id}")
+            self._remove_from_rag_index(note_id)
+            note_autocomplete.remove_notes([note_id])
+            return True
 
         except ValueError:
             raise
         except Exception as e:
             logger.error(f"Error deleting note {note_id}: {e}")
             raise Exception(f"노트 삭제 중 오류가 발생했습니다: {str(e)}")
+
+    def bulk_update(self, action, note_ids, tags=None):
+        """노트 여러 개를 한 트랜잭션에서 삭제하거나 태그 변경
+
+        Args:
+            action: 'delete' / 'add_tags' / 'remove_tags' / 'set_tags'
+            note_ids: 대상 노트 ID 목록 (최대 NOTE_BULK_MAX_IDS개)
+            tags: 태그 작업에 사용할 태그 목록 (set_tags는 빈 목록이면 모든 태그 제거)
+
+        Returns:
+            요청/처리된 노트 ID와 찾지 못한 노트 ID
+        """
+        print(f"\n📦 NoteService.bulk_update({action}) 실행")
+
+        if action not in self.BULK_ACTIONS:
+            raise ValueError(f"지원하지 않는 작업입니다: {action} (가능: {', '.join(self.BULK_ACTIONS)})")
+
+        if not isinstance(note_ids, list) or not note_ids:
+            raise ValueError("ids는 비어 있지 않은 노트 ID 배열이어야 합니다")
+        ids = []
+        for note_id in note_ids:
+            if isinstance(note_id, bool) or not isinstance(note_id, int) or note_id <= 0:
+                raise ValueError(f"유효하지 않은 노트 ID입니다: {note_id}")
+            ids.append(note_id)
+        ids = list(dict.fromkeys(ids))
+        if len(ids) > Config.NOTE_BULK_MAX_IDS:
+            raise ValueError(f"한 번에 최대 {Config.NOTE_BULK_MAX_IDS}개의 노트만 처리할 수 있습니다")
+
+        tag_action = self.BULK_ACTIONS[action]
+        if tag_action:
+            if tags is None or not isinstance(tags, (list, str)):
+                raise ValueError("tags는 태그 배열이어야 합니다")
+            tags = self.validate_tags(tags)
+            if not tags and tag_action != 'set':
+                raise ValueError("태그를 하나 이상 지정해주세요")
+
+        try:
+            if tag_action:
+                affected = self.repository.bulk_update_tags(ids, tag_action, tags)
+                if affected and note_autocomplete.accepts_updates:
+                    for note_id, _, note_tags, _ in self.repository.iter_autocomplete_rows(affected):
+                        note_autocomplete.update_tags(note_id, note_tags)
+            else:
+                affected = self.repository.bulk_delete(ids)
+                note_autocomplete.remove_notes(affected)
+                # 태그 변경은 임베딩과 무관하므로 인덱스는 삭제할 때만 (저장도 한 번)
+                if affected and self.rag_available and self.rag_chain:
+                    try:
+                        self.rag_chain.remove_notes(affected)
+                    except Exception as e:
+                        logger.error(f"❌ RAG 인덱스 일괄 제거 오류: {e}")
+        except Exception as e:
+            logger.error(f"Error in bulk {action}: {e}")
+            raise Exception(f"노트 일괄 처리 중 오류가 발생했습니다: {str(e)}")
+
+        found = set(affected)
+        result = {
+            "action": action,
+            "requested": len(ids),
+            "affected": affected,
+            "not_found": [note_id for note_id in ids if note_id not in found]
+        }
+        if tag_action:
+            result["tags"] = tags
+
+        print(f"✅ 일괄 처리 완료: {len(affected)}/{len(ids)}개")
+        return result
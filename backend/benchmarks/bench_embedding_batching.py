@@ -0,0 +1,90 @@
+# backend/benchmarks/bench_embedding_batching.py
+"""
+쿼리 임베딩 마이크로 배치 벤치마크
+
+동시 요청 수(concurrency)별로 초당 처리 쿼리 수(QPS)를 비교
+- direct: 요청마다 model.encode([query]) (배치 크기 1)
+- batched: EmbeddingBatcher로 동시 요청을 모아서 한 번에 encode
+
+실행: cd backend && python benchmarks/bench_embedding_batching.py
+"""
+
+import os
+import sys
+import time
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import Config
+from utils.embedding_batcher import EmbeddingBatcher
+
+CONCURRENCY_LEVELS = [1, 2, 4, 8, 16, 32]
+QUERIES_PER_WORKER = 20
+SAMPLE_QUERIES = [
+    "Vue.js 컴포넌트 설계 방법",
+    "파이썬 비동기 처리 정리",
+    "LangChain RAG 파이프라인",
+    "마크다운 문법 요약",
+    "SQLite 인덱스 최적화",
+]
+
+
+def run_load(encode_fn, concurrency: int) -> float:
+    """concurrency개 스레드가 동시에 쿼리를 임베딩하고 QPS 반환"""
+    barrier = threading.Barrier(concurrency + 1)
+
+    def worker(worker_id):
+        barrier.wait()
+        for i in range(QUERIES_PER_WORKER):
+            encode_fn([SAMPLE_QUERIES[(worker_id + i) % len(SAMPLE_QUERIES)]])
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(concurrency)]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return concurrency * QUERIES_PER_WORKER / elapsed
+
+
+def main():
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        print("❌ sentence-transformers가 필요합니다: pip install faiss-cpu sentence-transformers")
+        return
+
+    print("🧪 쿼리 임베딩 마이크로 배치 벤치마크")
+    print("=" * 60)
+    print(f"모델: {Config.RAG_EMBEDDING_MODEL}")
+    print(f"배치 설정: max_wait={Config.RAG_BATCH_MAX_WAIT_MS}ms, max_batch={Config.RAG_BATCH_MAX_SIZE}")
+    print("=" * 60)
+
+    model = SentenceTransformer(Config.RAG_EMBEDDING_MODEL)
+    model.encode(SAMPLE_QUERIES)  # 워밍업
+
+    batcher = EmbeddingBatcher(
+        lambda texts: model.encode(texts, batch_size=max(len(texts), 1)),
+        max_batch_size=Config.RAG_BATCH_MAX_SIZE,
+        max_wait_ms=Config.RAG_BATCH_MAX_WAIT_MS
+    )
+
+    print(f"{'concurrency':>12} | {'direct QPS':>12} | {'batched QPS':>12} | {'speedup':>8}")
+    print("-" * 60)
+
+    for concurrency in CONCURRENCY_LEVELS:
+        direct_qps = run_load(lambda texts: model.encode(texts), concurrency)
+        batched_qps = run_load(batcher.encode, concurrency)
+        print(f"{concurrency:>12} | {direct_qps:>12.1f} | {batched_qps:>12.1f} | {batched_qps / direct_qps:>7.2f}x")
+
+    print("-" * 60)
+    print(f"📊 배치 통계: {batcher.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# backend/benchmarks/bench_fulltext_search.py
+"""
+노트 검색 벤치마크: LIKE '%query%' vs FTS5(trigram) MATCH
+
+노트 수(10k, 100k)별로 같은 검색어 집합에 대한 평균 응답 시간을 비교
+- like: 현재 LIKE 경로 (title/content ILIKE + created_at 정렬, 전체 스캔)
+- fts: notes_fts MATCH + bm25 정렬 + highlight()/snippet() (한 쿼리)
+트리거 동기화 비용을 보기 위해 노트 적재 시간도 함께 출력
+
+실행: cd backend && python benchmarks/bench_fulltext_search.py [노트 수 ...]
+"""
+
+import os
+import sys
+import time
+import random
+import sqlite3
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.fulltext_search import FTS_TABLE, FTS_TRIGGERS, create_table_sql, TITLE_WEIGHT, CONTENT_WEIGHT
+
+NOTE_COUNTS = [10_000, 100_000]
+REPEAT = 5
+VOCABULARY_SIZE = 20_000
+WORDS_PER_LINE = 12
+
+# 앞쪽 단어는 자주, 뒤쪽 단어는 드물게 등장 (Zipf 분포) → 흔한/보통/드문 검색어를 순위로 고름
+QUERY_RANKS = [("흔한 단어", 5), ("보통 단어", 200), ("드문 단어", 5_000), ("두 단어", (200, 300))]
+
+
+LIKE_SQL = ("SELECT id, title FROM notes WHERE title LIKE :q OR content LIKE :q "
+            "ORDER BY created_at DESC LIMIT 50")
+FTS_SQL = (f"SELECT notes.id, notes.title, bm25({FTS_TABLE}, {TITLE_WEIGHT}, {CONTENT_WEIGHT}) AS score, "
+           f"highlight({FTS_TABLE}, 0, '<mark>', '</mark>'), "
+           f"snippet({FTS_TABLE}, 1, '<mark>', '</mark>', '…', 16) "
+           f"FROM {FTS_TABLE} JOIN notes ON notes.id = {FTS_TABLE}.rowid "
+           f"WHERE {FTS_TABLE} MATCH :q ORDER BY score LIMIT 50")
+
+
+def make_vocabulary(rng: random.Random) -> list:
+    """한글 음절 조합 + 영문으로 된 가상 단어 목록"""
+    syllables = [chr(code) for code in range(0xAC00, 0xD7A4, 37)]
+    words = set()
+    while len(words) < VOCABULARY_SIZE:
+        if rng.random() < 0.8:
+            words.add(''.join(rng.choices(syllables, k=rng.randint(2, 4))))
+        else:
+            words.add(''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=rng.randint(4, 9))))
+    return sorted(words)
+
+
+def make_note(rng: random.Random, words: list, weights: list) -> tuple:
+    title = " ".join(rng.choices(words, weights, k=4))
+    content = "\n".join(" ".join(rng.choices(words, weights, k=WORDS_PER_LINE))
+                        for _ in range(rng.randint(3, 15)))
+    return title, content
+
+
+def build_database(path: str, count: int, words: list, weights: list) -> float:
+    """notes + FTS 테이블/트리거 생성 후 노트 적재, 적재 시간(초) 반환"""
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE notes (id INTEGER PRIMARY KEY, title VARCHAR(255) NOT NULL, "
+                 "content TEXT NOT NULL, tags VARCHAR(500), created_at DATETIME, updated_at DATETIME)")
+    conn.execute(create_table_sql('trigram'))
+    for trigger in FTS_TRIGGERS:
+        conn.execute(trigger)
+
+    rng = random.Random(42)
+    rows = [(*make_note(rng, words, weights), f"2024-01-01 00:00:{i % 60:02d}") for i in range(count)]
+
+    started = time.perf_counter()
+    conn.executemany("INSERT INTO notes (title, content, created_at) VALUES (?, ?, ?)", rows)
+    conn.commit()
+    elapsed = time.perf_counter() - started
+
+    conn.close()
+    return elapsed
+
+
+def time_query(conn, sql: str, param: str) -> tuple:
+    """평균 실행 시간(ms)과 결과 수"""
+    rows = conn.execute(sql, {"q": param}).fetchall()  # 워밍업
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        conn.execute(sql, {"q": param}).fetchall()
+    return (time.perf_counter() - started) / REPEAT * 1000, len(rows)
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or NOTE_COUNTS
+
+    rng = random.Random(7)
+    words = make_vocabulary(rng)
+    rng.shuffle(words)
+    weights = [1.0 / rank for rank in range(1, len(words) + 1)]
+
+    def word_near(rank: int) -> str:
+        # trigram은 3글자 미만 단어를 찾을 수 없으므로(서비스는 LIKE로 처리) 3글자 이상만 사용
+        return next(word for word in words[rank:] if len(word) >= 3)
+
+    queries = []
+    for label, rank in QUERY_RANKS:
+        ranks = rank if isinstance(rank, tuple) else (rank,)
+        queries.append((label, " ".join(word_near(r) for r in ranks)))
+    queries.append(("없는 단어", "없는검색어"))
+
+    print("🧪 노트 검색 벤치마크 (LIKE vs FTS5 trigram)")
+    print("=" * 80)
+
+    for count in counts:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'bench.db')
+            load_seconds = build_database(path, count, words, weights)
+            conn = sqlite3.connect(path)
+
+            print(f"\n📚 노트 {count:,}개 (적재 + FTS 트리거: {load_seconds:.2f}s, "
+                  f"DB 크기: {os.path.getsize(path) / 1024 / 1024:.1f}MB)")
+            print(f"{'query':>24} | {'LIKE ms':>10} | {'FTS ms':>10} | {'speedup':>8} | {'hits':>5}")
+            print("-" * 80)
+
+            for label, query in queries:
+                # LIKE 경로는 검색어 전체를 부분 문자열로, FTS는 단어별 AND로 검색
+                like_ms, _ = time_query(conn, LIKE_SQL, f"%{query}%")
+                match = ' '.join('"' + term.replace('"', '""') + '"' for term in query.split())
+                fts_ms, hits = time_query(conn, FTS_SQL, match)
+                print(f"{label + ' ' + query:>24} | {like_ms:>10.2f} | {fts_ms:>10.2f} | "
+                      f"{like_ms / fts_ms:>7.1f}x | {hits:>5}")
+
+            conn.close()
+
+
+if __name__ == "__main__":
+    main()
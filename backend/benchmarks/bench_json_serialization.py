@@ -0,0 +1,108 @@
+# backend/benchmarks/bench_json_serialization.py
+"""
+JSON 응답 직렬화 벤치마크: Flask 기본 프로바이더(표준 json) vs FastJSONProvider(orjson)
+
+노트 목록 응답(GET /api/notes와 같은 봉투 + 노트 dict)을 jsonify로 만드는 시간과
+태그 JSON 파싱(Note.get_tags) 시간을 노트 1,000개 / 10,000개에서 비교
+DB 없이 메모리에서 만든 응답 데이터만 사용
+
+실행: cd backend && python benchmarks/bench_json_serialization.py [반복 횟수]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+from utils.json_provider import FastJSONProvider, ORJSON_AVAILABLE, loads
+
+NOTE_COUNTS = [1_000, 10_000]
+REPEAT = 5
+WORDS = ["파이썬", "플라스크", "데이터베이스", "인덱스", "검색", "노트", "요약", "메모",
+         "회의", "프로젝트", "python", "sqlite", "flask", "vector", "embedding"]
+
+
+def make_payload(count: int) -> dict:
+    """GET /api/notes 응답과 같은 형태의 데이터"""
+    rng = random.Random(42)
+    started = datetime(2025, 1, 1)
+    notes = []
+    for i in range(count):
+        content = "\n".join(" ".join(rng.choices(WORDS, k=12)) for _ in range(rng.randint(5, 30)))
+        tags = rng.sample(WORDS, 3)
+        created = started + timedelta(minutes=i)
+        notes.append({
+            "id": i + 1,
+            "title": f"노트 {i} {rng.choice(WORDS)}",
+            "content": content,
+            "preview": content[:200],
+            "tags": tags,
+            "created_at": created.isoformat(),
+            "updated_at": created.isoformat(),
+            "content_length": len(content),
+            "tag_count": len(tags),
+        })
+    return {
+        "success": True,
+        "message": f"{count}개의 노트를 조회했습니다",
+        "timestamp": datetime.now().isoformat(),
+        "data": {"notes": notes, "total": count, "limit": None, "offset": None,
+                 "next_cursor": None, "has_more": False}
+    }
+
+
+def time_jsonify(provider_class, payload: dict, repeat: int) -> tuple:
+    app = Flask(provider_class.__name__)
+    app.json = provider_class(app)
+    best = float('inf')
+    with app.app_context():
+        for _ in range(repeat):
+            started = time.perf_counter()
+            body = jsonify(payload).get_data()
+            best = min(best, time.perf_counter() - started)
+    return best, len(body)
+
+
+def time_tag_parsing(payload: dict, parse, repeat: int) -> float:
+    raw_tags = [json.dumps(note["tags"], ensure_ascii=False) for note in payload["data"]["notes"]]
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for raw in raw_tags:
+            parse(raw)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else REPEAT
+
+    print("🧪 JSON 응답 직렬화 벤치마크 (최소 시간, 반복 {}회)".format(repeat))
+    print(f"FastJSONProvider 엔진: {'orjson' if ORJSON_AVAILABLE else 'json (orjson 미설치)'}")
+    print("=" * 72)
+    print(f"{'notes':>7} | {'stdlib ms':>10} | {'fast ms':>9} | {'speedup':>7} | "
+          f"{'tags std ms':>11} | {'tags fast ms':>12}")
+    print("-" * 72)
+
+    for count in NOTE_COUNTS:
+        payload = make_payload(count)
+        std_seconds, std_size = time_jsonify(DefaultJSONProvider, payload, repeat)
+        fast_seconds, fast_size = time_jsonify(FastJSONProvider, payload, repeat)
+        tags_std = time_tag_parsing(payload, json.loads, repeat)
+        tags_fast = time_tag_parsing(payload, loads, repeat)
+
+        print(f"{count:>7,} | {std_seconds * 1000:>10.1f} | {fast_seconds * 1000:>9.1f} | "
+              f"{std_seconds / fast_seconds:>6.1f}x | {tags_std * 1000:>11.2f} | {tags_fast * 1000:>12.2f}")
+        print(f"{'':>7}   본문 크기: stdlib {std_size / 1024:,.0f} KB (ASCII 이스케이프) / "
+              f"fast {fast_size / 1024:,.0f} KB (UTF-8)")
+
+
+if __name__ == "__main__":
+    main()
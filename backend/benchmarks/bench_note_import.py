@@ -0,0 +1,111 @@
+# backend/benchmarks/bench_note_import.py
+"""
+노트 가져오기 벤치마크: 노트별 create_note vs 일괄 import_notes
+
+- single: NoteService.create_note를 노트마다 호출 (노트별 커밋 + 노트별 RAG 인덱싱/저장)
+- bulk: NoteService.import_notes (배치 트랜잭션 + 마지막에 배치 인덱싱, 저장 한 번)
+임시 DB와 경량 RAG 엔진(lite) 임시 인덱스를 사용하고, bulk는 단계별 처리량도 출력
+
+실행: cd backend && python benchmarks/bench_note_import.py [노트 수]
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TMP_DIR = tempfile.mkdtemp(prefix='bench_import_')
+# 설정 모듈을 읽기 전에 임시 경로/경량 엔진 지정 (실제 DB와 인덱스를 건드리지 않음)
+os.environ['RAG_ENGINE'] = 'lite'
+os.environ['RAG_LITE_INDEX_PATH'] = os.path.join(TMP_DIR, 'vectors.lite.npz')
+
+from flask import Flask
+
+from config.settings import Config
+from config.database import init_db
+
+NOTE_COUNT = 1_000
+WORDS = ["파이썬", "플라스크", "데이터베이스", "인덱스", "검색", "노트", "요약", "메모",
+         "회의", "프로젝트", "python", "sqlite", "flask", "vector", "embedding"]
+
+
+def make_notes(count: int) -> list:
+    rng = random.Random(42)
+    notes = []
+    for i in range(count):
+        lines = [" ".join(rng.choices(WORDS, k=12)) for _ in range(rng.randint(5, 30))]
+        tags = " ".join(f"#{tag}" for tag in rng.sample(WORDS[-5:], 2))
+        notes.append({"title": f"노트 {i} {rng.choice(WORDS)}", "content": "\n".join(lines) + "\n" + tags})
+    return notes
+
+
+def make_app(name: str):
+    app = Flask(name)
+    app.config.from_object(Config)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(TMP_DIR, name + '.db')}"
+    init_db(app)
+    return app
+
+
+def reset_index(service):
+    if service.rag_chain:
+        service.rag_chain.rebuild_index([])
+
+
+def run_single(app, notes: list) -> float:
+    from app.services.note_service import NoteService
+
+    with app.app_context():
+        service = NoteService()
+        reset_index(service)
+        started = time.perf_counter()
+        for note in notes:
+            service.create_note(note["title"], note["content"])
+        return time.perf_counter() - started
+
+
+def run_bulk(app, notes: list) -> tuple:
+    from app.services.note_service import NoteService
+
+    with app.app_context():
+        service = NoteService()
+        reset_index(service)
+        started = time.perf_counter()
+        report = service.import_notes(iter(notes))
+        return time.perf_counter() - started, report
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else NOTE_COUNT
+    notes = make_notes(count)
+
+    # 노트별 로그 출력이 많아 결과만 보이도록 stdout을 잠시 막음
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        single_seconds = run_single(make_app('single'), notes)
+        bulk_seconds, report = run_bulk(make_app('bulk'), notes)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+        shutil.rmtree(TMP_DIR, ignore_errors=True)
+
+    print("🧪 노트 가져오기 벤치마크 (lite RAG 인덱싱 포함)")
+    print("=" * 64)
+    print(f"노트 {count:,}개 / 배치 크기 {report['batch_size']}")
+    print("=" * 64)
+    print(f"{'mode':>8} | {'seconds':>9} | {'notes/s':>9}")
+    print("-" * 64)
+    print(f"{'single':>8} | {single_seconds:>9.2f} | {count / single_seconds:>9.0f}")
+    print(f"{'bulk':>8} | {bulk_seconds:>9.2f} | {count / bulk_seconds:>9.0f}   ({single_seconds / bulk_seconds:.1f}x)")
+    print("-" * 64)
+    for name, phase in report["phases"].items():
+        print(f"  bulk {name:>8}: {phase['count']:>6}개 {phase['seconds']:>8.3f}s ({phase['per_second'] or 0:,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# backend/benchmarks/bench_sqlite_pragmas.py
+"""
+SQLite 연결 튜닝 벤치마크: 기본 설정 vs PRAGMA 프로파일
+
+스레드 서버 상황을 흉내 내서 읽기 스레드(노트 목록 조회)와
+쓰기 스레드(자동 저장 UPDATE + 커밋)를 동시에 돌리고 처리량/지연을 비교
+- default: rollback journal, synchronous=FULL, pool_pre_ping
+- tuned: config.database.sqlite_pragmas() 프로파일 (WAL, synchronous=NORMAL, mmap, cache, busy_timeout)
+
+실행: cd backend && python benchmarks/bench_sqlite_pragmas.py [읽기 스레드 수] [쓰기 스레드 수]
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, text
+
+from config.settings import Config
+from config.database import sqlite_pragmas, apply_sqlite_pragmas
+
+DURATION_SECONDS = 5.0
+NOTE_COUNT = 5_000
+POOL_SIZE = Config.SQLITE_POOL_SIZE
+
+
+def make_engine(path: str, tuned: bool):
+    url = f"sqlite:///{path}"
+    if not tuned:
+        return create_engine(url, pool_pre_ping=True, pool_size=POOL_SIZE, max_overflow=POOL_SIZE,
+                             connect_args={'check_same_thread': False})
+
+    config = {key: getattr(Config, key) for key in dir(Config) if key.startswith('SQLITE_')}
+    pragmas = sqlite_pragmas(config)
+    engine = create_engine(url, pool_pre_ping=False, pool_size=POOL_SIZE, max_overflow=POOL_SIZE,
+                           connect_args={'check_same_thread': False, 'timeout': Config.SQLITE_BUSY_TIMEOUT_MS / 1000})
+    event.listen(engine, 'connect', lambda dbapi_connection, record: apply_sqlite_pragmas(dbapi_connection, pragmas))
+    return engine
+
+
+def seed(engine):
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE notes (id INTEGER PRIMARY KEY, title VARCHAR(255) NOT NULL, "
+                          "content TEXT NOT NULL, created_at DATETIME, updated_at DATETIME)"))
+        conn.execute(text("CREATE INDEX ix_notes_created_at_id ON notes (created_at, id)"))
+        conn.execute(
+            text("INSERT INTO notes (title, content, created_at, updated_at) VALUES (:t, :c, :d, :d)"),
+            [{"t": f"노트 {i}", "c": "내용 " * 200, "d": f"2024-01-01 00:{i // 60 % 60:02d}:{i % 60:02d}"}
+             for i in range(NOTE_COUNT)]
+        )
+
+
+def percentile(values: list, ratio: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+def run_workload(engine, readers: int, writers: int) -> dict:
+    stop = threading.Event()
+    lock = threading.Lock()
+    read_latencies, write_latencies, errors = [], [], [0]
+
+    def reader():
+        local = []
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT id, title, content FROM notes "
+                                      "ORDER BY created_at DESC, id DESC LIMIT 20")).fetchall()
+                local.append((time.perf_counter() - started) * 1000)
+            except Exception:
+                with lock:
+                    errors[0] += 1
+        with lock:
+            read_latencies.extend(local)
+
+    def writer(seed_value):
+        rng = random.Random(seed_value)
+        local = []
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                with engine.begin() as conn:
+                    conn.execute(text("UPDATE notes SET content = :c, updated_at = CURRENT_TIMESTAMP WHERE id = :id"),
+                                 {"c": "수정된 내용 " * rng.randint(50, 250), "id": rng.randint(1, NOTE_COUNT)})
+                local.append((time.perf_counter() - started) * 1000)
+            except Exception:
+                with lock:
+                    errors[0] += 1
+        with lock:
+            write_latencies.extend(local)
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(DURATION_SECONDS)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return {
+        "reads_per_sec": len(read_latencies) / DURATION_SECONDS,
+        "writes_per_sec": len(write_latencies) / DURATION_SECONDS,
+        "read_p95_ms": percentile(read_latencies, 0.95),
+        "write_p95_ms": percentile(write_latencies, 0.95),
+        "errors": errors[0]
+    }
+
+
+def main():
+    readers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    writers = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+
+    print("🧪 SQLite 연결 튜닝 벤치마크")
+    print("=" * 78)
+    print(f"읽기 스레드 {readers}개 / 쓰기 스레드 {writers}개 / {DURATION_SECONDS:.0f}초 / 노트 {NOTE_COUNT:,}개")
+    print("=" * 78)
+    print(f"{'profile':>8} | {'reads/s':>9} | {'writes/s':>9} | {'read p95':>10} | {'write p95':>10} | {'errors':>6}")
+    print("-" * 78)
+
+    for profile in ('default', 'tuned'):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = make_engine(os.path.join(tmp, 'bench.db'), tuned=(profile == 'tuned'))
+            seed(engine)
+            result = run_workload(engine, readers, writers)
+            engine.dispose()
+
+        print(f"{profile:>8} | {result['reads_per_sec']:>9.0f} | {result['writes_per_sec']:>9.0f} | "
+              f"{result['read_p95_ms']:>8.2f}ms | {result['write_p95_ms']:>8.2f}ms | {result['errors']:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ LangChain 체인들
 try:
     from .rag_chain import rag_chain, RAG_AVAILABLE
     
-    if RAG_AVAILABLE and rag_chain.is_available():
+    if rag_chain.is_available():
         stats = rag_chain.get_stats()
         print("✅ LangChain RAG 시스템 로드 완료")
         print(f"   - 벡터 개수: {stats['vector_count']}개")
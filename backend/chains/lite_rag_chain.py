@@ -0,0 +1,450 @@
+# backend/chains/lite_rag_chain.py
+"""
+경량 RAG 검색 엔진 (NumPy 전용, torch/faiss 불필요)
+
+문자 n-gram을 해시해서 만든 TF-IDF 희소 벡터로 노트를 검색한다.
+음절 단위 n-gram이라 형태소 분석기 없이도 한국어 검색이 동작하고,
+수 ms 안에 시작되며 노트 1000개당 수 MB 수준의 메모리만 사용한다.
+RAGChain과 같은 인터페이스를 제공하므로 rag_chat 등에서 그대로 사용할 수 있다.
+"""
+
+import os
+import re
+import json
+import zlib
+import threading
+import numpy as np
+from typing import List, Dict, Optional
+from config.settings import Config
+from chains.retrieval import mmr_select
+
+ENGINE_NAME = 'hashed-char-ngram-tfidf'
+
+
+class HashedNgramVectorizer:
+    """문자 n-gram 해시 벡터화 (프로세스가 달라도 같은 해시가 나오도록 crc32 사용)"""
+
+    def __init__(self, n_features: int = 2 ** 18, ngram_range: tuple = (2, 3)):
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+
+    def _normalize(self, text: str) -> str:
+        return re.sub(r'\s+', ' ', text.lower()).strip()
+
+    def transform(self, text: str) -> tuple:
+        """텍스트 → (feature 인덱스 int32 배열, L2 정규화된 sublinear TF float32 배열)"""
+        text = self._normalize(text)
+        counts = {}
+
+        for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
+            for i in range(len(text) - n + 1):
+                gram = text[i:i + n]
+                if gram.isspace():
+                    continue
+                feature = zlib.crc32(gram.encode('utf-8')) % self.n_features
+                counts[feature] = counts.get(feature, 0) + 1
+
+        if not counts:
+            return np.zeros(0, dtype='int32'), np.zeros(0, dtype='float32')
+
+        features = np.fromiter(counts.keys(), dtype='int32', count=len(counts))
+        weights = 1.0 + np.log(np.fromiter(counts.values(), dtype='float32', count=len(counts)))
+        weights /= np.linalg.norm(weights)
+
+        order = np.argsort(features)
+        return features[order], weights[order].astype('float32')
+
+
+class LiteRAGChain:
+    """NumPy 기반 경량 RAG 시스템 (RAGChain 호환 인터페이스)"""
+
+    def __init__(self):
+        self.available = True
+        self._lock = threading.RLock()
+
+        self.vectorizer = HashedNgramVectorizer(n_features=Config.RAG_LITE_FEATURES)
+        self.model_name = ENGINE_NAME
+        self.dimension = self.vectorizer.n_features
+
+        self.notes_data = []       # 노트 메타데이터 (RAGChain과 같은 형식)
+        self._doc_features = []    # 노트별 feature 인덱스
+        self._doc_weights = []     # 노트별 가중치
+        self._df = np.zeros(self.dimension, dtype='int32')  # 문서 빈도
+        self._postings = None      # 검색용 역색인 캐시 (추가/삭제 시 무효화)
+
+        self.index_file = Config.RAG_LITE_INDEX_PATH
+        self.metadata_file = os.path.splitext(self.index_file)[0] + '.json'
+
+        self.load_index()
+        print(f"✅ 경량 RAG 시스템 초기화 완료 ({ENGINE_NAME}, {len(self.notes_data)}개 노트)")
+
+    def is_available(self) -> bool:
+        """RAG 시스템 사용 가능 여부"""
+        return self.available
+
+    # =========================
+    # 인덱스 구성
+    # =========================
+
+    def _position_of(self, note_id: int) -> Optional[int]:
+        for position, entry in enumerate(self.notes_data):
+            if entry['note_id'] == note_id:
+                return position
+        return None
+
+    def _remove_at(self, position: int):
+        self._df[self._doc_features[position]] -= 1
+        del self._doc_features[position]
+        del self._doc_weights[position]
+        del self.notes_data[position]
+        self._postings = None
+
+    def add_note(self, note_id: int, title: str, content: str) -> bool:
+        """노트를 벡터화해서 인덱스에 추가 (같은 노트가 있으면 교체)"""
+        try:
+            features, weights = self.vectorizer.transform(f"{title}\n{content}")
+
+            with self._lock:
+                position = self._position_of(note_id)
+                if position is not None:
+                    self._remove_at(position)
+
+                self._doc_features.append(features)
+                self._doc_weights.append(weights)
+                self._df[features] += 1
+                self.notes_data.append({
+                    "note_id": note_id,
+                    "title": title,
+                    "content_preview": content[:200] + "..." if len(content) > 200 else content,
+                    "full_content": content,
+                    "content_length": len(content)
+                })
+                self._postings = None
+
+                self.save_index()
+
+            print(f"✅ 노트 {note_id} 경량 인덱싱 완료")
+            return True
+
+        except Exception as e:
+            print(f"❌ 노트 경량 인덱싱 오류: {e}")
+            return False
+
+    def add_notes(self, notes: List[Dict], batch_size: Optional[int] = None, save: bool = True) -> int:
+        """여러 노트를 한 번에 인덱싱 (같은 노트가 있으면 교체, 인덱스 저장은 마지막에 한 번)
+
+        batch_size는 RAGChain과 인터페이스를 맞추기 위한 인자 (벡터화가 노트별이라 사용하지 않음)
+        """
+        if not notes:
+            return 0
+
+        try:
+            vectors = [self.vectorizer.transform(f"{note['title']}\n{note['content']}") for note in notes]
+
+            with self._lock:
+                ids = {note['id'] for note in notes}
+                for position in reversed([i for i, entry in enumerate(self.notes_data) if entry['note_id'] in ids]):
+                    self._remove_at(position)
+
+                for note, (features, weights) in zip(notes, vectors):
+                    content = note['content']
+                    self._doc_features.append(features)
+                    self._doc_weights.append(weights)
+                    self._df[features] += 1
+                    self.notes_data.append({
+                        "note_id": note['id'],
+                        "title": note['title'],
+                        "content_preview": content[:200] + "..." if len(content) > 200 else content,
+                        "full_content": content,
+                        "content_length": len(content)
+                    })
+                self._postings = None
+
+                if save:
+                    self.save_index()
+
+            print(f"✅ 노트 {len(notes)}개 경량 인덱싱 완료")
+            return len(notes)
+
+        except Exception as e:
+            print(f"❌ 노트 배치 경량 인덱싱 오류: {e}")
+            return 0
+
+    def remove_note(self, note_id: int) -> bool:
+        """노트를 인덱스에서 제거"""
+        with self._lock:
+            position = self._position_of(note_id)
+            if position is None:
+                return False
+            self._remove_at(position)
+            self.save_index()
+        return True
+
+    def remove_notes(self, note_ids: List[int]) -> int:
+        """여러 노트를 인덱스에서 한 번에 제거 (인덱스 저장도 한 번)"""
+        if not note_ids:
+            return 0
+        with self._lock:
+            ids = set(note_ids)
+            positions = [position for position, entry in enumerate(self.notes_data) if entry['note_id'] in ids]
+            # 뒤쪽 위치부터 지워야 앞쪽 위치가 밀리지 않음
+            for position in sorted(positions, reverse=True):
+                self._remove_at(position)
+            if positions:
+                self.save_index()
+        return len(positions)
+
+    def _build_postings(self):
+        """노트별 희소 벡터를 feature 기준 역색인(CSC 형태)으로 변환"""
+        if self._doc_features:
+            features = np.concatenate(self._doc_features)
+            weights = np.concatenate(self._doc_weights)
+            doc_ids = np.repeat(
+                np.arange(len(self._doc_features), dtype='int32'),
+                [len(f) for f in self._doc_features]
+            )
+        else:
+            features = np.zeros(0, dtype='int32')
+            weights = np.zeros(0, dtype='float32')
+            doc_ids = np.zeros(0, dtype='int32')
+
+        order = np.argsort(features, kind='stable')
+        pointers = np.zeros(self.dimension + 1, dtype='int64')
+        np.cumsum(np.bincount(features, minlength=self.dimension), out=pointers[1:])
+
+        self._postings = (pointers, doc_ids[order], weights[order])
+        return self._postings
+
+    def _score(self, query: str) -> tuple:
+        """쿼리와 모든 노트의 TF-IDF 유사도 (역색인 희소 곱)
+
+        Returns:
+            (점수 배열, 점수 위치에 대응하는 노트 메타데이터/벡터 스냅샷)
+            역색인과 메타데이터를 같은 락 안에서 잡으므로, 그 뒤에 노트가 삭제되어 위치가 밀려도
+            점수 위치는 스냅샷의 같은 노트를 가리킨다.
+        """
+        query_features, query_weights = self.vectorizer.transform(query)
+
+        with self._lock:
+            pointers, doc_ids, weights = self._postings or self._build_postings()
+            snapshot = (list(self.notes_data), list(self._doc_features), list(self._doc_weights))
+            n_docs = len(snapshot[0])
+            idf = np.log((1 + n_docs) / (1 + self._df[query_features])) + 1.0
+
+        scores = np.zeros(n_docs, dtype='float32')
+        for feature, query_weight in zip(query_features, query_weights * idf):
+            start, end = pointers[feature], pointers[feature + 1]
+            if start != end:
+                np.add.at(scores, doc_ids[start:end], query_weight * weights[start:end])
+
+        # 쿼리 벡터 크기로 정규화해서 0~1 근처 값으로 맞춤
+        query_norm = np.linalg.norm(query_weights * idf)
+        return (scores / query_norm if query_norm > 0 else scores), snapshot
+
+    # =========================
+    # 검색 (RAGChain 호환)
+    # =========================
+
+    @staticmethod
+    def _pairwise_similarity(doc_features: List[np.ndarray], doc_weights: List[np.ndarray],
+                             positions: List[int]) -> np.ndarray:
+        """후보 노트 간 코사인 유사도 행렬 (노트 벡터는 L2 정규화되어 있음)"""
+        n = len(positions)
+        similarity = np.eye(n, dtype='float32')
+        for a in range(n):
+            features_a, weights_a = doc_features[positions[a]], doc_weights[positions[a]]
+            for b in range(a + 1, n):
+                _, ia, ib = np.intersect1d(features_a, doc_features[positions[b]],
+                                           assume_unique=True, return_indices=True)
+                similarity[a, b] = similarity[b, a] = float(weights_a[ia] @ doc_weights[positions[b]][ib])
+        return similarity
+
+    def search_similar_notes(self, query: str, k: int = 5, mmr: Optional[bool] = None,
+                             mmr_lambda: Optional[float] = None) -> List[Dict]:
+        """쿼리와 유사한 노트 검색 (노트당 벡터 하나이므로 중복 제거 불필요, MMR만 적용)"""
+        if not self.notes_data:
+            return []
+
+        mmr = Config.RAG_MMR_ENABLED if mmr is None else mmr
+        mmr_lambda = Config.RAG_MMR_LAMBDA if mmr_lambda is None else mmr_lambda
+
+        try:
+            # 이후 계산은 모두 점수와 같은 시점의 스냅샷 기준 (락 불필요)
+            scores, (notes_data, doc_features, doc_weights) = self._score(query)
+            if len(scores) == 0:
+                return []
+            fetch_k = min(max(k * Config.RAG_CANDIDATE_MULTIPLIER, k) if mmr else k, len(scores))
+            top = np.argpartition(-scores, fetch_k - 1)[:fetch_k]
+            top = top[np.argsort(-scores[top])]
+            top = top[scores[top] > 0]
+
+            if mmr and len(top) > 1:
+                similarity = self._pairwise_similarity(doc_features, doc_weights, top.tolist())
+                top = top[mmr_select(scores[top], similarity, k, mmr_lambda)]
+            else:
+                top = top[:k]
+            entries = [notes_data[idx] for idx in top]
+
+            results = []
+            for rank, (idx, entry) in enumerate(zip(top, entries), 1):
+                note = entry.copy()
+                note['similarity_score'] = float(scores[idx])
+                note['rank'] = rank
+                results.append(note)
+
+            return results
+
+        except Exception as e:
+            print(f"❌ 경량 유사 노트 검색 오류: {e}")
+            return []
+
+    def build_context(self, similar_notes: List[Dict]) -> str:
+        """검색 결과로 AI 모델에 전달할 컨텍스트 생성"""
+        if not similar_notes:
+            return "관련된 노트를 찾을 수 없습니다."
+
+        context_parts = ["다음은 관련된 노트들입니다:\n"]
+
+        for i, note in enumerate(similar_notes, 1):
+            context_parts.append(f"[노트 {i}] {note['title']}")
+            context_parts.append(f"내용: {note['full_content']}")
+            context_parts.append(f"유사도: {note['similarity_score']:.3f}\n")
+
+        return "\n".join(context_parts)
+
+    def get_context_for_query(self, query: str, k: int = 3) -> str:
+        """쿼리에 대한 컨텍스트 생성 (AI 모델에 전달용)"""
+        return self.build_context(self.search_similar_notes(query, k))
+
+    # =========================
+    # 저장 / 로드
+    # =========================
+
+    def save_index(self) -> bool:
+        """희소 벡터(npz)와 메타데이터(json) 저장"""
+        try:
+            with self._lock:
+                lengths = np.array([len(f) for f in self._doc_features], dtype='int64')
+                np.savez(
+                    self.index_file,
+                    features=np.concatenate(self._doc_features) if self._doc_features else np.zeros(0, dtype='int32'),
+                    weights=np.concatenate(self._doc_weights) if self._doc_weights else np.zeros(0, dtype='float32'),
+                    lengths=lengths,
+                    n_features=np.array([self.dimension])
+                )
+                with open(self.metadata_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.notes_data, f, ensure_ascii=False)
+            return True
+
+        except Exception as e:
+            print(f"❌ 경량 인덱스 저장 오류: {e}")
+            return False
+
+    def load_index(self) -> bool:
+        """저장된 인덱스 로드"""
+        try:
+            if not (os.path.exists(self.index_file) and os.path.exists(self.metadata_file)):
+                return True
+
+            with np.load(self.index_file) as data:
+                if int(data['n_features'][0]) != self.dimension:
+                    print("⚠️ 경량 인덱스 feature 수가 설정과 달라 새로 구축이 필요합니다")
+                    return False
+                offsets = np.concatenate([[0], np.cumsum(data['lengths'])])
+                features, weights = data['features'], data['weights']
+
+            with open(self.metadata_file, 'r', encoding='utf-8') as f:
+                notes_data = json.load(f)
+
+            with self._lock:
+                self._doc_features = [features[offsets[i]:offsets[i + 1]] for i in range(len(notes_data))]
+                self._doc_weights = [weights[offsets[i]:offsets[i + 1]] for i in range(len(notes_data))]
+                self.notes_data = notes_data
+                self._df = np.bincount(features, minlength=self.dimension).astype('int32')
+                self._postings = None
+
+            return True
+
+        except Exception as e:
+            print(f"❌ 경량 인덱스 로드 오류: {e}")
+            return False
+
+    def rebuild_index(self, notes: List[Dict]) -> bool:
+        """전체 인덱스 재구축"""
+        print("🔄 경량 RAG 인덱스 재구축 시작...")
+
+        try:
+            with self._lock:
+                self.notes_data = []
+                self._doc_features = []
+                self._doc_weights = []
+                self._df = np.zeros(self.dimension, dtype='int32')
+                self._postings = None
+
+                for note in notes:
+                    features, weights = self.vectorizer.transform(f"{note['title']}\n{note['content']}")
+                    self._doc_features.append(features)
+                    self._doc_weights.append(weights)
+                    self._df[features] += 1
+                    content = note['content']
+                    self.notes_data.append({
+                        "note_id": note['id'],
+                        "title": note['title'],
+                        "content_preview": content[:200] + "..." if len(content) > 200 else content,
+                        "full_content": content,
+                        "content_length": len(content)
+                    })
+
+                self.save_index()
+
+            print(f"✅ 경량 RAG 인덱스 재구축 완료! ({len(notes)}개)")
+            return True
+
+        except Exception as e:
+            print(f"❌ 경량 인덱스 재구축 오류: {e}")
+            return False
+
+    def clear_index(self) -> bool:
+        """인덱스 완전 삭제"""
+        with self._lock:
+            self.notes_data = []
+            self._doc_features = []
+            self._doc_weights = []
+            self._df = np.zeros(self.dimension, dtype='int32')
+            self._postings = None
+
+            for path in (self.index_file, self.metadata_file):
+                if os.path.exists(path):
+                    os.remove(path)
+
+        print("✅ 경량 RAG 인덱스 완전 삭제 완료")
+        return True
+
+    # =========================
+    # 통계 / 호환 메서드
+    # =========================
+
+    def memory_bytes(self) -> int:
+        """희소 벡터가 차지하는 대략적인 메모리"""
+        vectors = sum(f.nbytes + w.nbytes for f, w in zip(self._doc_features, self._doc_weights))
+        return int(vectors + self._df.nbytes)
+
+    def get_stats(self) -> Dict:
+        """RAG 시스템 통계 정보"""
+        return {
+            "available": self.available,
+            "engine": "lite",
+            "indexed_notes": len(self.notes_data),
+            "vector_count": len(self._doc_features),
+            "model_name": self.model_name,
+            "dimension": self.dimension,
+            "memory_bytes": self.memory_bytes(),
+            "migration": None
+        }
+
+    def start_migration(self, model_name: str) -> Dict:
+        """경량 엔진은 임베딩 모델이 없으므로 마이그레이션 불가"""
+        return {"success": False, "message": "경량 RAG 엔진에서는 임베딩 모델 마이그레이션을 지원하지 않습니다"}
+
+    def get_migration_status(self) -> Optional[Dict]:
+        return None
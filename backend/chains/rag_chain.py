@@ -1,230 +1,828 @@
 # backend/chains/rag_chain.py
 import os
+import re
 import json
+import time
+import threading
 import numpy as np
 from typing import List, Dict, Optional
 from config.settings import Config
+from utils.embedding_batcher import EmbeddingBatcher
+from utils.embedding_service import RemoteEmbeddingClient, EmbeddingServiceUnavailable
+from chains.retrieval import collapse_by_note, mmr_select
 
 try:
     import faiss
-    from sentence_transformers import SentenceTransformer
+    if Config.RAG_EMBEDDING_BACKEND != 'remote':
+        # 원격 임베딩 서버 모드에서는 워커에 torch를 올리지 않음 (폴백 시에만 지연 로드)
+        from sentence_transformers import SentenceTransformer
     RAG_AVAILABLE = True
 except ImportError:
     RAG_AVAILABLE = False
     print("⚠️ RAG 패키지 (faiss, sentence-transformers)가 설치되지 않았습니다")
 
+# 모델 네임스페이스 도입 이전에 하드코딩되어 있던 모델 (기존 인덱스 파일 호환용)
+LEGACY_MODEL_NAME = 'sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2'
+
+
+def _model_slug(model_name: str) -> str:
+    """모델 이름을 파일명에 쓸 수 있는 형태로 변환"""
+    slug = re.sub(r'[^A-Za-z0-9]+', '-', model_name.split('/')[-1])
+    return slug.strip('-').lower() or 'default'
+
+
+def _namespaced_path(path: str, model_name: str) -> str:
+    """모델별 인덱스 파일 경로 (예: note_vectors.index → note_vectors.<slug>.index)"""
+    base, ext = os.path.splitext(path)
+    return f"{base}.{_model_slug(model_name)}{ext}"
+
+
+class EmbeddingSpace:
+    """모델 하나에 대응하는 임베딩 공간 (모델 + FAISS 인덱스 + 메타데이터)"""
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self.model = None
+        self.client = None
+        self._remote_retry_at = 0.0
+
+        if Config.RAG_EMBEDDING_BACKEND == 'remote':
+            self._connect_remote()
+        else:
+            self._load_local_model()
+
+        # 동시 요청 마이크로 배치 (끄면 요청마다 바로 encode)
+        self.batcher = None
+        if Config.RAG_BATCHING_ENABLED:
+            self.batcher = EmbeddingBatcher(
+                self._encode_raw,
+                max_batch_size=Config.RAG_BATCH_MAX_SIZE,
+                max_wait_ms=Config.RAG_BATCH_MAX_WAIT_MS
+            )
+
+        self.index = faiss.IndexFlatIP(self.dimension)  # 코사인 유사도
+        self.notes_data = []  # 노트 메타데이터 저장
+
+        # 모델별로 분리된 파일 경로
+        self.index_file = _namespaced_path(Config.RAG_INDEX_PATH, model_name)
+        self.metadata_file = _namespaced_path(Config.RAG_METADATA_PATH, model_name)
+
+    def _load_local_model(self):
+        """프로세스 내부에 SentenceTransformer 로드"""
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(self.model_name)
+        self.dimension = self.model.get_sentence_embedding_dimension()
+
+    def _connect_remote(self):
+        """공유 임베딩 서버 연결 (사용 불가하면 설정에 따라 로컬 모델로 폴백)"""
+        self.client = RemoteEmbeddingClient(
+            Config.RAG_EMBEDDING_SOCKET,
+            pool_size=Config.RAG_EMBEDDING_POOL_SIZE,
+            timeout=Config.RAG_EMBEDDING_TIMEOUT,
+            batch_timeout=Config.RAG_EMBEDDING_BATCH_TIMEOUT,
+            large_batch=Config.RAG_BATCH_MAX_SIZE
+        )
+
+        try:
+            info = self.client.info()
+        except (EmbeddingServiceUnavailable, RuntimeError) as e:
+            if not Config.RAG_EMBEDDING_FALLBACK:
+                raise
+            # 서버가 나중에 뜨면 재시도 간격 이후 원격 경로로 복귀
+            print(f"⚠️ 원격 임베딩 서버 사용 불가, 로컬 모델로 폴백: {e}")
+            self._remote_retry_at = time.monotonic() + Config.RAG_EMBEDDING_RETRY_SECONDS
+            self._load_local_model()
+            return
+
+        if info['model'] != self.model_name:
+            # 다른 모델을 서빙 중인 서버는 사용할 수 없음 (예: 마이그레이션 대상 모델)
+            print(f"⚠️ 임베딩 서버 모델 불일치 ({info['model']}), 로컬 모델 사용: {self.model_name}")
+            self.client = None
+            self._load_local_model()
+            return
+
+        self.dimension = info['dimension']
+        print(f"🔌 원격 임베딩 서버 연결: {Config.RAG_EMBEDDING_SOCKET} ({self.model_name})")
+
+    def _encode_raw(self, texts: List[str]) -> np.ndarray:
+        """모델 forward pass (배치 그대로) - 원격 서버 우선, 실패 시 로컬 폴백"""
+        if self.client and time.monotonic() >= self._remote_retry_at:
+            try:
+                return self.client.encode(texts)
+            except EmbeddingServiceUnavailable as e:
+                if not Config.RAG_EMBEDDING_FALLBACK:
+                    raise
+                # 잠시 동안은 재연결을 시도하지 않고 로컬 모델 사용
+                self._remote_retry_at = time.monotonic() + Config.RAG_EMBEDDING_RETRY_SECONDS
+                print(f"⚠️ 원격 임베딩 실패, 로컬 모델로 폴백: {e}")
+
+        if self.model is None:
+            self._load_local_model()
+        return np.asarray(self.model.encode(texts, batch_size=max(len(texts), 1)), dtype='float32')
+
+    @property
+    def backend(self) -> str:
+        """현재 사용 중인 임베딩 경로"""
+        if self.client and time.monotonic() >= self._remote_retry_at:
+            return 'remote'
+        return 'local'
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """텍스트 목록을 정규화된 float32 벡터로 변환"""
+        # 작은 요청은 다른 동시 요청과 묶고, 이미 큰 배치는 바로 처리
+        if self.batcher and len(texts) < self.batcher.max_batch_size:
+            embeddings = self.batcher.encode(texts)
+        else:
+            embeddings = self._encode_raw(texts)
+
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return embeddings / norms
+
+    def add_embeddings(self, embeddings: np.ndarray, entries: List[Dict]):
+        """벡터와 메타데이터를 함께 추가"""
+        self.index.add(embeddings.astype('float32'))
+        self.notes_data.extend(entries)
+
+    def note_ids(self) -> set:
+        """인덱싱된 노트 ID 집합"""
+        return {entry['note_id'] for entry in self.notes_data}
+
+    def remove_positions(self, positions: List[int]) -> int:
+        """인덱스 위치 목록의 벡터와 메타데이터 제거"""
+        if not positions:
+            return 0
+
+        drop = set(positions)
+        self.index.remove_ids(np.array(sorted(drop), dtype='int64'))
+        self.notes_data = [entry for i, entry in enumerate(self.notes_data) if i not in drop]
+        return len(drop)
+
+    def remove_note(self, note_id: int) -> int:
+        """노트의 기존 벡터를 모두 제거"""
+        return self.remove_positions([i for i, entry in enumerate(self.notes_data) if entry['note_id'] == note_id])
+
+    def compact(self) -> int:
+        """같은 노트의 중복 벡터 정리 (가장 마지막에 추가된 것만 유지)"""
+        latest = {}
+        for i, entry in enumerate(self.notes_data):
+            latest[entry['note_id']] = i
+        keep = set(latest.values())
+        return self.remove_positions([i for i in range(len(self.notes_data)) if i not in keep])
+
+    def vectors_at(self, positions) -> np.ndarray:
+        """인덱스 위치의 저장된 벡터 (MMR 계산용)"""
+        return np.vstack([self.index.reconstruct(int(i)) for i in positions]).astype('float32')
+
+    def reset(self):
+        """메모리상 인덱스 초기화"""
+        self.index = faiss.IndexFlatIP(self.dimension)
+        self.notes_data = []
+
+    def save(self):
+        """인덱스와 메타데이터 저장"""
+        if self.index.ntotal > 0:
+            faiss.write_index(self.index, self.index_file)
+
+        with open(self.metadata_file, 'w', encoding='utf-8') as f:
+            json.dump(self.notes_data, f, ensure_ascii=False, indent=2)
+
+    def load(self):
+        """기존 인덱스와 메타데이터 로드"""
+        index_file = self.index_file
+        metadata_file = self.metadata_file
+
+        # 네임스페이스 도입 이전 파일은 기존 기본 모델의 인덱스로 간주
+        if (self.model_name == LEGACY_MODEL_NAME
+                and not os.path.exists(index_file)
+                and os.path.exists(Config.RAG_INDEX_PATH)):
+            index_file = Config.RAG_INDEX_PATH
+            metadata_file = Config.RAG_METADATA_PATH
+            print(f"📂 기존(네임스페이스 없는) 인덱스 파일 사용: {index_file}")
+
+        if os.path.exists(index_file):
+            self.index = faiss.read_index(index_file)
+            print(f"✅ 기존 FAISS 인덱스 로드 완료 ({self.index.ntotal}개 벡터, {self.model_name})")
+
+        if os.path.exists(metadata_file):
+            with open(metadata_file, 'r', encoding='utf-8') as f:
+                self.notes_data = json.load(f)
+            print(f"✅ 메타데이터 로드 완료 ({len(self.notes_data)}개 노트)")
+
+        # 수정 시 재추가로 쌓인 중복 벡터 정리
+        removed = self.compact()
+        if removed:
+            print(f"🧹 중복 벡터 {removed}개 정리")
+
+    def remove_files(self):
+        """저장된 파일 삭제"""
+        for path in (self.index_file, self.metadata_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+class EmbeddingMigration:
+    """임베딩 모델 온라인 마이그레이션 진행 상태
+
+    마이그레이션 동안 새 쓰기는 기존/신규 공간 모두에 기록되고(dual-write),
+    백그라운드 작업이 기존 노트를 새 공간에 다시 임베딩한다.
+    커버리지가 100%가 되면 읽기 경로가 새 공간으로 전환된다.
+    """
+
+    def __init__(self, source: EmbeddingSpace, target: EmbeddingSpace, batch_size: int):
+        self.source = source
+        self.target = target
+        self.batch_size = max(1, batch_size)
+        self.status = 'pending'  # pending → running → completed / failed / cancelled
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self.cancelled = threading.Event()
+
+        # 재임베딩 대상: 기존 공간의 노트 (note_id 기준 최신 항목만)
+        latest = {}
+        for entry in source.notes_data:
+            latest[entry['note_id']] = entry
+        self.pending = list(latest.values())
+        self.expected_ids = set(latest.keys())
+        self.total_chars = sum(len(entry.get('full_content', '')) for entry in self.pending)
+
+    def covered_ids(self) -> set:
+        """새 공간에 이미 들어간 노트 ID"""
+        return self.target.note_ids() & self.expected_ids
+
+    def coverage(self) -> float:
+        """마이그레이션 커버리지 (0.0 ~ 1.0)"""
+        if not self.expected_ids:
+            return 1.0
+        return len(self.covered_ids()) / len(self.expected_ids)
+
+    def get_progress(self) -> Dict:
+        """진행률 및 비용 추정치"""
+        done = len(self.covered_ids())
+        total = len(self.expected_ids)
+        elapsed = ((self.finished_at or time.time()) - self.started_at) if self.started_at else 0.0
+        rate = done / elapsed if elapsed > 0 else 0.0
+        remaining = total - done
+
+        return {
+            "status": self.status,
+            "source_model": self.source.model_name,
+            "target_model": self.target.model_name,
+            "total_notes": total,
+            "migrated_notes": done,
+            "coverage": round(self.coverage() * 100, 2),
+            "elapsed_seconds": round(elapsed, 2),
+            "notes_per_second": round(rate, 2),
+            "eta_seconds": round(remaining / rate, 2) if rate > 0 else None,
+            "estimated_cost": {
+                "characters_to_embed": self.total_chars,
+                "batches": (total + self.batch_size - 1) // self.batch_size,
+                "target_dimension": self.target.dimension,
+                "target_index_bytes": total * self.target.dimension * 4
+            },
+            "error": self.error
+        }
+
+
 class RAGChain:
     """Retrieval-Augmented Generation 시스템"""
-    
+
     def __init__(self):
         self.available = RAG_AVAILABLE
-        
+
         if not self.available:
             return
-            
+
         try:
-            # 다국어 지원 임베딩 모델
-            self.model = SentenceTransformer('sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2')
-            self.dimension = 384  # 모델의 벡터 차원
-            
-            # FAISS 인덱스 초기화
-            self.index = faiss.IndexFlatIP(self.dimension)  # 코사인 유사도
-            self.notes_data = []  # 노트 메타데이터 저장
-            
-            # 파일 경로 설정
-            self.index_file = Config.RAG_INDEX_PATH
-            self.metadata_file = Config.RAG_METADATA_PATH
-            
-            # 기존 인덱스 로드
-            self.load_index()
-            
-            print("✅ RAG 시스템 초기화 완료")
-            
+            self._lock = threading.RLock()
+            self.migration = None
+            self.state_file = Config.RAG_MODEL_STATE_PATH
+
+            # 읽기 경로에 사용할 모델: 마지막으로 전환된 모델 → 설정값 순
+            configured_model = Config.RAG_EMBEDDING_MODEL
+            active_model = self._load_active_model_name() or configured_model
+
+            self.space = EmbeddingSpace(active_model)
+            self.space.load()
+
+            print(f"✅ RAG 시스템 초기화 완료 (모델: {active_model})")
+
+            # 설정된 모델이 현재 인덱스 모델과 다르면 온라인 마이그레이션 시작
+            if configured_model != active_model:
+                print(f"🔄 임베딩 모델 변경 감지: {active_model} → {configured_model}")
+                self.start_migration(configured_model)
+
         except Exception as e:
             print(f"❌ RAG 시스템 초기화 실패: {e}")
             self.available = False
-    
+
+    # 읽기 경로(활성 공간) 위임 속성
+    @property
+    def model(self):
+        return self.space.model
+
+    @property
+    def model_name(self) -> str:
+        return self.space.model_name
+
+    @property
+    def dimension(self) -> int:
+        return self.space.dimension
+
+    @property
+    def index(self):
+        return self.space.index
+
+    @property
+    def notes_data(self) -> List[Dict]:
+        return self.space.notes_data
+
+    @property
+    def index_file(self) -> str:
+        return self.space.index_file
+
+    @property
+    def metadata_file(self) -> str:
+        return self.space.metadata_file
+
     def is_available(self) -> bool:
         """RAG 시스템 사용 가능 여부"""
         return self.available
-    
+
+    def _make_entry(self, note_id: int, title: str, content: str) -> Dict:
+        """인덱스 메타데이터 항목 생성"""
+        return {
+            "note_id": note_id,
+            "title": title,
+            "content_preview": content[:200] + "..." if len(content) > 200 else content,
+            "full_content": content,
+            "content_length": len(content)
+        }
+
+    def _encode_for_write(self, texts: List[str]) -> List[tuple]:
+        """활성 공간(마이그레이션 중이면 대상 공간도)용 임베딩을 락 밖에서 미리 계산 → [(공간, 임베딩)]"""
+        with self._lock:
+            spaces = [self.space]
+            migration = self.migration
+            if migration and migration.status in ('pending', 'running'):
+                spaces.append(migration.target)
+        return [(space, space.encode(texts)) for space in spaces]
+
+    @staticmethod
+    def _embeddings_for(encoded: List[tuple], space: EmbeddingSpace, texts: List[str]) -> np.ndarray:
+        """미리 계산한 임베딩 (그 사이 마이그레이션이 시작/전환돼 공간이 바뀌었으면 다시 계산)"""
+        for encoded_space, embeddings in encoded:
+            if encoded_space is space:
+                return embeddings
+        return space.encode(texts)
+
     def add_note(self, note_id: int, title: str, content: str) -> bool:
         """노트를 벡터화해서 인덱스에 추가"""
         if not self.available:
             return False
-            
+
         try:
             # 제목과 내용 합쳐서 임베딩
             text = f"제목: {title}\n\n{content}"
-            
-            # 벡터화
-            embedding = self.model.encode([text])
-            embedding = embedding / np.linalg.norm(embedding)  # 정규화
-            
-            # FAISS 인덱스에 추가
-            self.index.add(embedding.astype('float32'))
-            
-            # 메타데이터 저장
-            self.notes_data.append({
-                "note_id": note_id,
-                "title": title,
-                "content_preview": content[:200] + "..." if len(content) > 200 else content,
-                "full_content": content,
-                "content_length": len(content)
-            })
-            
-            # 저장
-            self.save_index()
+            entry = self._make_entry(note_id, title, content)
+
+            # 임베딩은 락 밖에서 (동시 요청이 배처에서 묶이도록)
+            encoded = self._encode_for_write([text])
+
+            with self._lock:
+                # 활성 공간 (읽기 경로) - 같은 노트의 기존 벡터는 교체
+                self.space.remove_note(note_id)
+                self.space.add_embeddings(self._embeddings_for(encoded, self.space, [text]), [dict(entry)])
+                self.save_index()
+
+                # 마이그레이션 중이면 새 공간에도 기록 (dual-write)
+                migration = self.migration
+                if migration and migration.status in ('pending', 'running'):
+                    migration.target.remove_note(note_id)
+                    migration.target.add_embeddings(self._embeddings_for(encoded, migration.target, [text]),
+                                                    [dict(entry)])
+                    migration.expected_ids.add(note_id)
+
             print(f"✅ 노트 {note_id} 벡터화 완료")
             return True
-            
+
         except Exception as e:
             print(f"❌ 노트 벡터화 오류: {e}")
             return False
-    
-    def search_similar_notes(self, query: str, k: int = 5) -> List[Dict]:
-        """쿼리와 유사한 노트 검색"""
+
+    def add_notes(self, notes: List[Dict], batch_size: Optional[int] = None, save: bool = True) -> int:
+        """여러 노트를 배치로 벡터화해서 인덱스에 추가 (같은 노트의 기존 벡터는 교체)
+
+        Args:
+            notes: {'id', 'title', 'content'} 목록
+            batch_size: 임베딩 배치 크기 (기본 RAG_MIGRATION_BATCH_SIZE)
+            save: 끝난 뒤 인덱스 파일 저장 여부 (호출자가 여러 번 나눠 부르면 마지막에 한 번만)
+
+        Returns:
+            인덱싱된 노트 수
+        """
+        if not self.available or not notes:
+            return 0
+
+        batch_size = batch_size or Config.RAG_MIGRATION_BATCH_SIZE
+        added = 0
+
+        try:
+            for start in range(0, len(notes), batch_size):
+                batch = notes[start:start + batch_size]
+                texts = [f"제목: {note['title']}\n\n{note['content']}" for note in batch]
+                entries = [self._make_entry(note['id'], note['title'], note['content']) for note in batch]
+                ids = {note['id'] for note in batch}
+                encoded = self._encode_for_write(texts)
+
+                with self._lock:
+                    self.space.remove_positions([i for i, entry in enumerate(self.space.notes_data)
+                                                 if entry['note_id'] in ids])
+                    self.space.add_embeddings(self._embeddings_for(encoded, self.space, texts),
+                                              [dict(entry) for entry in entries])
+
+                    migration = self.migration
+                    if migration and migration.status in ('pending', 'running'):
+                        migration.target.remove_positions([i for i, entry in enumerate(migration.target.notes_data)
+                                                           if entry['note_id'] in ids])
+                        migration.target.add_embeddings(self._embeddings_for(encoded, migration.target, texts),
+                                                        [dict(entry) for entry in entries])
+                        migration.expected_ids.update(ids)
+
+                added += len(batch)
+
+            if save:
+                with self._lock:
+                    self.save_index()
+
+            print(f"✅ 노트 {added}개 배치 벡터화 완료")
+            return added
+
+        except Exception as e:
+            print(f"❌ 노트 배치 벡터화 오류: {e}")
+            return added
+
+    def remove_note(self, note_id: int) -> bool:
+        """노트를 인덱스에서 제거"""
+        if not self.available:
+            return False
+
+        try:
+            with self._lock:
+                removed = self.space.remove_note(note_id)
+                migration = self.migration
+                if migration and migration.status in ('pending', 'running'):
+                    migration.target.remove_note(note_id)
+                    migration.expected_ids.discard(note_id)
+                    migration.pending = [entry for entry in migration.pending if entry['note_id'] != note_id]
+                if removed:
+                    self.save_index()
+            return removed > 0
+
+        except Exception as e:
+            print(f"❌ 노트 벡터 제거 오류: {e}")
+            return False
+
+    def remove_notes(self, note_ids: List[int]) -> int:
+        """여러 노트를 인덱스에서 한 번에 제거 (인덱스 저장도 한 번)
+
+        Returns:
+            제거된 벡터 수
+        """
+        if not self.available or not note_ids:
+            return 0
+
+        try:
+            ids = set(note_ids)
+            with self._lock:
+                removed = self.space.remove_positions([i for i, entry in enumerate(self.space.notes_data)
+                                                       if entry['note_id'] in ids])
+                migration = self.migration
+                if migration and migration.status in ('pending', 'running'):
+                    migration.target.remove_positions([i for i, entry in enumerate(migration.target.notes_data)
+                                                       if entry['note_id'] in ids])
+                    migration.expected_ids -= ids
+                    migration.pending = [entry for entry in migration.pending if entry['note_id'] not in ids]
+                if removed:
+                    self.save_index()
+            return removed
+
+        except Exception as e:
+            print(f"❌ 노트 벡터 일괄 제거 오류: {e}")
+            return 0
+
+    def search_similar_notes(self, query: str, k: int = 5, mmr: Optional[bool] = None,
+                             mmr_lambda: Optional[float] = None) -> List[Dict]:
+        """쿼리와 유사한 노트 검색
+
+        노트 단위로 중복을 제거하고, mmr이 켜져 있으면 후보 벡터로 MMR을 적용해서
+        서로 겹치지 않는 k개를 반환
+        """
         if not self.available or self.index.ntotal == 0:
             return []
-            
+
+        mmr = Config.RAG_MMR_ENABLED if mmr is None else mmr
+        mmr_lambda = Config.RAG_MMR_LAMBDA if mmr_lambda is None else mmr_lambda
+
         try:
-            # 쿼리 벡터화
-            query_embedding = self.model.encode([query])
-            query_embedding = query_embedding / np.linalg.norm(query_embedding)
-            
-            # 유사한 벡터 검색
-            scores, indices = self.index.search(query_embedding.astype('float32'), min(k, self.index.ntotal))
-            
+            # 쿼리 벡터화는 락 밖에서 (동시 검색이 배처에서 한 배치로 묶이도록)
+            # 그 사이 읽기 경로가 전환돼도 이 검색은 임베딩을 만든 공간에서 끝까지 수행
+            with self._lock:
+                space = self.space
+            query_embedding = space.encode([query])
+
+            with self._lock:
+                if space.index.ntotal == 0:
+                    return []
+
+                # 중복 제거/MMR을 위해 k보다 넉넉하게 후보 검색
+                fetch_k = min(max(k * Config.RAG_CANDIDATE_MULTIPLIER, k), space.index.ntotal)
+                scores, indices = space.index.search(query_embedding, fetch_k)
+
+                valid = [(float(score), int(idx)) for score, idx in zip(scores[0], indices[0])
+                         if 0 <= idx < len(space.notes_data)]
+                if not valid:
+                    return []
+
+                candidate_scores = np.array([score for score, _ in valid], dtype='float32')
+                candidate_positions = [idx for _, idx in valid]
+
+                # 노트당 최고 점수 후보 하나만 유지
+                keep = collapse_by_note([space.notes_data[idx]['note_id'] for idx in candidate_positions],
+                                        candidate_scores)
+                candidate_scores = candidate_scores[keep]
+                candidate_positions = [candidate_positions[i] for i in keep]
+                entries = [space.notes_data[idx] for idx in candidate_positions]
+
+                if mmr and len(candidate_positions) > 1:
+                    vectors = space.vectors_at(candidate_positions)
+                    order = mmr_select(candidate_scores, vectors @ vectors.T, k, mmr_lambda)
+                else:
+                    order = list(range(min(k, len(candidate_positions))))
+
             results = []
-            for i, (score, idx) in enumerate(zip(scores[0], indices[0])):
-                if 0 <= idx < len(self.notes_data):
-                    note = self.notes_data[idx].copy()
-                    note['similarity_score'] = float(score)
-                    note['rank'] = i + 1
-                    results.append(note)
-            
+            for rank, i in enumerate(order, 1):
+                note = entries[i].copy()
+                note['similarity_score'] = float(candidate_scores[i])
+                note['rank'] = rank
+                results.append(note)
+
             return results
-            
+
         except Exception as e:
             print(f"❌ 유사 노트 검색 오류: {e}")
             return []
-    
-    def get_context_for_query(self, query: str, k: int = 3) -> str:
-        """쿼리에 대한 컨텍스트 생성 (AI 모델에 전달용)"""
-        similar_notes = self.search_similar_notes(query, k)
-        
+
+    def build_context(self, similar_notes: List[Dict]) -> str:
+        """검색 결과로 AI 모델에 전달할 컨텍스트 생성"""
         if not similar_notes:
             return "관련된 노트를 찾을 수 없습니다."
-        
+
         context_parts = ["다음은 관련된 노트들입니다:\n"]
-        
+
         for i, note in enumerate(similar_notes, 1):
             context_parts.append(f"[노트 {i}] {note['title']}")
             context_parts.append(f"내용: {note['full_content']}")
             context_parts.append(f"유사도: {note['similarity_score']:.3f}\n")
-        
+
         return "\n".join(context_parts)
-    
+
+    def get_context_for_query(self, query: str, k: int = 3) -> str:
+        """쿼리에 대한 컨텍스트 생성 (AI 모델에 전달용)"""
+        return self.build_context(self.search_similar_notes(query, k))
+
     def save_index(self) -> bool:
         """인덱스와 메타데이터 저장"""
         if not self.available:
             return False
-            
+
         try:
-            # FAISS 인덱스 저장
-            if self.index.ntotal > 0:
-                faiss.write_index(self.index, self.index_file)
-            
-            # 메타데이터 저장
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(self.notes_data, f, ensure_ascii=False, indent=2)
-            
+            self.space.save()
             return True
-            
+
         except Exception as e:
             print(f"❌ 인덱스 저장 오류: {e}")
             return False
-    
+
     def load_index(self) -> bool:
         """기존 인덱스와 메타데이터 로드"""
         if not self.available:
             return False
-            
+
         try:
-            # FAISS 인덱스 로드
-            if os.path.exists(self.index_file):
-                self.index = faiss.read_index(self.index_file)
-                print(f"✅ 기존 FAISS 인덱스 로드 완료 ({self.index.ntotal}개 벡터)")
-            
-            # 메타데이터 로드
-            if os.path.exists(self.metadata_file):
-                with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                    self.notes_data = json.load(f)
-                print(f"✅ 메타데이터 로드 완료 ({len(self.notes_data)}개 노트)")
-            
+            self.space.load()
             return True
-            
+
         except Exception as e:
             print(f"❌ 인덱스 로드 오류: {e}")
             return False
-    
+
     def rebuild_index(self, notes: List[Dict]) -> bool:
         """전체 인덱스 재구축"""
         if not self.available:
             return False
-            
+
         print("🔄 RAG 인덱스 재구축 시작...")
-        
+
         try:
             # 기존 인덱스 초기화
-            self.index = faiss.IndexFlatIP(self.dimension)
-            self.notes_data = []
-            
-            # 모든 노트 다시 추가
-            success_count = 0
-            for note in notes:
-                if self.add_note(note['id'], note['title'], note['content']):
-                    success_count += 1
-            
+            with self._lock:
+                self.space.reset()
+
+            # 모든 노트 다시 추가 (배치 임베딩, 저장은 한 번)
+            success_count = self.add_notes(notes)
+
             print(f"✅ RAG 인덱스 재구축 완료! ({success_count}/{len(notes)}개 성공)")
             return True
-            
+
         except Exception as e:
             print(f"❌ 인덱스 재구축 오류: {e}")
             return False
-    
+
     def get_stats(self) -> Dict:
         """RAG 시스템 통계 정보"""
         return {
             "available": self.available,
-            "indexed_notes": len(self.notes_data),
+            "indexed_notes": len(self.notes_data) if self.available else 0,
             "vector_count": self.index.ntotal if self.available else 0,
-            "model_name": "paraphrase-multilingual-MiniLM-L12-v2" if self.available else None,
-            "dimension": self.dimension if self.available else None
+            "model_name": self.model_name if self.available else None,
+            "dimension": self.dimension if self.available else None,
+            "batching": self.space.batcher.get_stats() if self.available and self.space.batcher else None,
+            "embedding_backend": self.space.backend if self.available else None,
+            "migration": self.get_migration_status() if self.available else None
         }
-    
+
     def clear_index(self) -> bool:
         """인덱스 완전 삭제"""
         if not self.available:
             return False
-            
+
         try:
-            # 메모리상 인덱스 초기화
-            self.index = faiss.IndexFlatIP(self.dimension)
-            self.notes_data = []
-            
-            # 파일 삭제
-            if os.path.exists(self.index_file):
-                os.remove(self.index_file)
-            if os.path.exists(self.metadata_file):
-                os.remove(self.metadata_file)
-            
+            self.cancel_migration()
+
+            # 메모리상 인덱스 초기화 및 파일 삭제
+            with self._lock:
+                self.space.reset()
+                self.space.remove_files()
+
             print("✅ RAG 인덱스 완전 삭제 완료")
             return True
-            
+
         except Exception as e:
             print(f"❌ 인덱스 삭제 오류: {e}")
             return False
 
+    # =========================
+    # 임베딩 모델 마이그레이션
+    # =========================
+
+    def start_migration(self, model_name: str) -> Dict:
+        """새 임베딩 모델로 온라인 마이그레이션 시작"""
+        if not self.available:
+            return {"success": False, "message": "RAG 시스템을 사용할 수 없습니다"}
+
+        with self._lock:
+            if self.migration and self.migration.status in ('pending', 'running'):
+                return {
+                    "success": False,
+                    "message": "이미 마이그레이션이 진행 중입니다",
+                    "migration": self.migration.get_progress()
+                }
+
+            if model_name == self.model_name:
+                return {"success": False, "message": f"이미 {model_name} 모델을 사용 중입니다"}
+
+            try:
+                target = EmbeddingSpace(model_name)
+            except Exception as e:
+                return {"success": False, "message": f"모델 로드 실패: {e}"}
+
+            self.migration = EmbeddingMigration(self.space, target, Config.RAG_MIGRATION_BATCH_SIZE)
+
+        worker = threading.Thread(
+            target=self._run_migration,
+            args=(self.migration,),
+            name='rag-embedding-migration',
+            daemon=True
+        )
+        worker.start()
+
+        print(f"🚚 임베딩 마이그레이션 시작: {self.model_name} → {model_name} ({len(self.migration.pending)}개 노트)")
+        return {"success": True, "message": "마이그레이션을 시작했습니다", "migration": self.migration.get_progress()}
+
+    def _run_migration(self, migration: EmbeddingMigration):
+        """백그라운드 재임베딩 작업"""
+        migration.status = 'running'
+        migration.started_at = time.time()
+
+        try:
+            while True:
+                if migration.cancelled.is_set():
+                    migration.status = 'cancelled'
+                    return
+
+                # 대기열 앞에서 한 배치 꺼내기 (삭제된 노트는 remove_note(s)가 대기열에서 이미 뺌)
+                with self._lock:
+                    batch = migration.pending[:migration.batch_size]
+                    del migration.pending[:migration.batch_size]
+                    done_ids = migration.target.note_ids()
+                if not batch:
+                    break
+
+                # dual-write로 이미 들어간 노트는 건너뜀
+                batch = [entry for entry in batch if entry['note_id'] not in done_ids]
+                if not batch:
+                    continue
+
+                texts = [f"제목: {entry['title']}\n\n{entry.get('full_content', '')}" for entry in batch]
+                embeddings = migration.target.encode(texts)
+
+                with self._lock:
+                    # 임베딩하는 동안 삭제됐거나(expected_ids에서 빠짐) dual-write로 더 새 내용이
+                    # 들어간 노트는 버림 - 삭제된 노트가 되살아나거나 한 노트에 벡터가 두 개 생기지 않도록
+                    done_ids = migration.target.note_ids()
+                    keep = [i for i, entry in enumerate(batch)
+                            if entry['note_id'] in migration.expected_ids and entry['note_id'] not in done_ids]
+                    if keep:
+                        migration.target.add_embeddings(embeddings[keep], [dict(batch[i]) for i in keep])
+
+                progress = migration.get_progress()
+                print(f"🚚 마이그레이션 진행: {progress['migrated_notes']}/{progress['total_notes']} "
+                      f"({progress['coverage']}%, ETA {progress['eta_seconds']}s)")
+
+            self._complete_migration(migration)
+
+        except Exception as e:
+            migration.status = 'failed'
+            migration.error = str(e)
+            print(f"❌ 임베딩 마이그레이션 실패: {e}")
+        finally:
+            migration.finished_at = time.time()
+
+    def _complete_migration(self, migration: EmbeddingMigration):
+        """커버리지 100% 도달 시 읽기 경로 전환"""
+        with self._lock:
+            if migration.coverage() < 1.0:
+                migration.status = 'failed'
+                migration.error = f"커버리지 부족 ({migration.coverage() * 100:.2f}%)"
+                return
+
+            migration.target.save()
+            self.space = migration.target
+            self._save_active_model_name(migration.target.model_name)
+            migration.status = 'completed'
+
+        # 이전 모델의 인덱스 파일은 롤백용으로 남겨둠
+        print(f"✅ 임베딩 마이그레이션 완료, 읽기 경로 전환: {migration.target.model_name}")
+
+    def cancel_migration(self) -> bool:
+        """진행 중인 마이그레이션 취소"""
+        migration = getattr(self, 'migration', None)
+        if not migration or migration.status not in ('pending', 'running'):
+            return False
+
+        migration.cancelled.set()
+        migration.status = 'cancelled'
+        print(f"⏹️ 임베딩 마이그레이션 취소: {migration.target.model_name}")
+        return True
+
+    def get_migration_status(self) -> Optional[Dict]:
+        """마이그레이션 진행률 (없으면 None)"""
+        migration = getattr(self, 'migration', None)
+        return migration.get_progress() if migration else None
+
+    def _load_active_model_name(self) -> Optional[str]:
+        """마지막으로 읽기 경로에 전환된 모델 이름"""
+        if not os.path.exists(self.state_file):
+            return None
+
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get('active_model')
+        except (OSError, ValueError):
+            return None
+
+    def _save_active_model_name(self, model_name: str):
+        """읽기 경로 모델 기록 (재시작 후에도 유지)"""
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump({"active_model": model_name, "switched_at": time.time()}, f, ensure_ascii=False)
+
+def _create_rag_chain():
+    """설정(RAG_ENGINE)과 설치된 패키지에 맞는 RAG 엔진 생성
+
+    - dense: faiss + 임베딩 모델 (RAGChain)
+    - lite: NumPy 해시 n-gram TF-IDF (LiteRAGChain, torch 불필요)
+    - auto: dense를 쓸 수 있으면 dense, 아니면 lite
+    """
+    engine = Config.RAG_ENGINE
+
+    if engine == 'lite' or (engine == 'auto' and not RAG_AVAILABLE):
+        from chains.lite_rag_chain import LiteRAGChain
+        return LiteRAGChain()
+
+    return RAGChain()
+
 # 전역 RAG 체인 인스턴스
-rag_chain = RAGChain()
\ No newline at end of file
+rag_chain = _create_rag_chain()
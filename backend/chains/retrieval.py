@@ -0,0 +1,55 @@
+# backend/chains/retrieval.py
+"""
+검색 결과 후처리 (RAGChain / LiteRAGChain 공통)
+
+- 노트 단위 중복 제거: 같은 노트의 여러 벡터(중복 인덱싱, 청크)는 최고 점수 하나만 남김
+- MMR(Maximal Marginal Relevance): 쿼리 관련도와 이미 고른 결과와의 유사도를
+  함께 고려해서 서로 겹치지 않는 k개를 고름
+"""
+
+import numpy as np
+from typing import List
+
+
+def collapse_by_note(note_ids: List[int], scores: np.ndarray) -> List[int]:
+    """note_id별 최고 점수 후보의 위치만 점수 내림차순으로 반환"""
+    best = {}
+    for position, (note_id, score) in enumerate(zip(note_ids, scores)):
+        if note_id not in best or score > scores[best[note_id]]:
+            best[note_id] = position
+
+    return sorted(best.values(), key=lambda position: -scores[position])
+
+
+def mmr_select(query_scores: np.ndarray, similarity: np.ndarray, k: int, mmr_lambda: float = 0.7) -> List[int]:
+    """MMR로 k개 후보 선택
+
+    Args:
+        query_scores: 후보별 쿼리 유사도 (n,)
+        similarity: 후보 간 유사도 행렬 (n, n)
+        k: 선택할 개수
+        mmr_lambda: 1.0이면 관련도만, 0.0이면 다양성만 고려
+
+    Returns:
+        선택된 후보 위치 (선택 순서대로)
+    """
+    n = len(query_scores)
+    if n == 0 or k <= 0:
+        return []
+
+    selected = [int(np.argmax(query_scores))]
+    # 각 후보가 이미 선택된 결과들과 가지는 최대 유사도
+    max_similarity = similarity[:, selected[0]].astype('float32').copy()
+    available = np.ones(n, dtype=bool)
+    available[selected[0]] = False
+
+    while len(selected) < min(k, n):
+        mmr_scores = mmr_lambda * query_scores - (1.0 - mmr_lambda) * max_similarity
+        mmr_scores[~available] = -np.inf
+
+        chosen = int(np.argmax(mmr_scores))
+        selected.append(chosen)
+        available[chosen] = False
+        np.maximum(max_similarity, similarity[:, chosen], out=max_similarity)
+
+    return selected
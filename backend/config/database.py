@@ -6,7 +6,7 @@
 """
 
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import inspect, text
+from sqlalchemy import inspect, text, event
 import os
 
 # 전역 DB 인스턴스
@@ -16,14 +16,23 @@ db = SQLAlchemy()
 def init_db(app):
     """Flask 앱에 데이터베이스 초기화"""
     try:
+        # SQLite면 연결 풀/PRAGMA 튜닝 설정 (엔진 생성 전에 적용)
+        pragmas = configure_sqlite(app)
+        
         # SQLAlchemy 초기화
         db.init_app(app)
         
         # 앱 컨텍스트에서 테이블 생성
         with app.app_context():
+            if pragmas:
+                # 새 연결이 열릴 때마다 PRAGMA 적용 (첫 연결 전에 등록)
+                event.listen(db.engine, 'connect',
+                             lambda dbapi_connection, connection_record: apply_sqlite_pragmas(dbapi_connection, pragmas))
+                print(f"✅ SQLite 튜닝 적용: {', '.join(f'{name}={value}' for name, value in pragmas)}")
+            
             # 모든 모델 임포트 (테이블 생성을 위해)
             try:
-                from models.note import Note
+                from models.note import Note, Tag
                 print("✅ 노트 모델 로드 완료")
             except ImportError as e:
                 print(f"⚠️ 모델 임포트 오류: {e}")
@@ -40,6 +49,37 @@ def init_db(app):
             # 모든 테이블 생성
             db.create_all()
             print("✅ 데이터베이스 테이블 생성 완료")
+
+            # 기존 DB에 인덱스/데이터 변경 적용 (버전 기반, 미적용분만)
+            from config.migrations import run_migrations
+            applied = run_migrations(db.engine)
+            if applied:
+                print(f"✅ 스키마 마이그레이션 적용: v{applied[-1]}")
+
+            # 전문 검색(FTS5) 테이블과 동기화 트리거
+            from utils.fulltext_search import setup_fulltext_search
+            with db.engine.begin() as connection:
+                tokenizer = setup_fulltext_search(connection)
+            if tokenizer:
+                print(f"✅ 전문 검색 준비 완료 (FTS5, {tokenizer})")
+            else:
+                print("⚠️ FTS5 사용 불가 - LIKE 검색 사용")
+
+            # 노트 통계 테이블과 증분 갱신 트리거
+            from utils.note_stats import setup_note_stats
+            with db.engine.begin() as connection:
+                if setup_note_stats(connection):
+                    print("✅ 노트 통계 트리거 준비 완료")
+
+            # 노트 변경 카운터 (목록/통계 ETag)
+            from utils.note_versions import setup_note_versions
+            with db.engine.begin() as connection:
+                if setup_note_versions(connection):
+                    print("✅ 노트 변경 카운터 준비 완료")
+
+            # 쿼리 진단 리스너 (DB_DIAGNOSTICS_SAMPLE_RATE > 0일 때만 기록)
+            from utils.query_diagnostics import query_diagnostics
+            query_diagnostics.install(db.engine)
             
             # 테이블 확인
             check_tables()
@@ -49,6 +89,64 @@ def init_db(app):
         raise
 
 
+def sqlite_pragmas(config, in_memory: bool = False) -> list:
+    """설정 → 연결마다 적용할 PRAGMA 목록 [(이름, 값)]"""
+    pragmas = [
+        ('busy_timeout', int(config.get('SQLITE_BUSY_TIMEOUT_MS', 5000))),
+        ('synchronous', config.get('SQLITE_SYNCHRONOUS', 'NORMAL')),
+        ('cache_size', int(config.get('SQLITE_CACHE_SIZE', -20000))),
+        ('temp_store', config.get('SQLITE_TEMP_STORE', 'MEMORY')),
+    ]
+    if not in_memory:
+        # WAL/mmap은 파일 DB에서만 의미가 있음
+        pragmas.insert(0, ('journal_mode', config.get('SQLITE_JOURNAL_MODE', 'WAL')))
+        pragmas.append(('mmap_size', int(config.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))))
+    return pragmas
+
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas: list):
+    """DB-API 연결에 PRAGMA 적용"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas:
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def configure_sqlite(app) -> list:
+    """SQLite용 엔진 옵션 설정, 적용할 PRAGMA 목록 반환 (SQLite가 아니거나 꺼져 있으면 빈 목록)
+
+    - pool_pre_ping 제거: 로컬 파일이라 끊긴 연결 확인용 왕복이 필요 없음
+    - check_same_thread 해제 + busy timeout: 스레드 서버에서 풀 연결을 공유
+    - 파일 DB는 WAL 기준으로 읽기 동시성이 생기므로 풀 크기를 명시
+    """
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI', '')
+    if not uri.startswith('sqlite') or not app.config.get('SQLITE_TUNING_ENABLED', True):
+        return []
+
+    in_memory = uri in ('sqlite://', 'sqlite:///:memory:') or 'mode=memory' in uri
+    busy_timeout_ms = int(app.config.get('SQLITE_BUSY_TIMEOUT_MS', 5000))
+
+    options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    options['pool_pre_ping'] = False
+    options['connect_args'] = {
+        **options.get('connect_args', {}),
+        'check_same_thread': False,
+        'timeout': busy_timeout_ms / 1000
+    }
+    if in_memory:
+        # 메모리 DB는 SQLAlchemy가 전용 풀을 사용하므로 크기 옵션을 넘기지 않음
+        for key in ('pool_size', 'max_overflow', 'pool_timeout'):
+            options.pop(key, None)
+    else:
+        options['pool_size'] = int(app.config.get('SQLITE_POOL_SIZE', 8))
+        options['max_overflow'] = int(app.config.get('SQLITE_MAX_OVERFLOW', 8))
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+    return sqlite_pragmas(app.config, in_memory)
+
+
 def check_tables():
     """생성된 테이블 확인 (SQLAlchemy 2.0+ 호환)"""
     try:
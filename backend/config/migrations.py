@@ -0,0 +1,280 @@
+# backend/config/migrations.py - 버전 기반 스키마 마이그레이션
+"""
+스키마 마이그레이션
+
+db.create_all()은 없는 테이블만 만들고 기존 테이블에 인덱스/데이터 변경을 적용하지 못한다.
+여기서는 적용된 버전을 schema_migrations 테이블에 기록하고,
+아직 적용되지 않은 마이그레이션만 버전 순서대로 한 번씩 실행한다.
+
+새 마이그레이션은 MIGRATIONS 끝에 (버전, 설명, 함수)로 추가한다.
+각 함수는 SQLAlchemy Connection을 받아 트랜잭션 안에서 실행된다.
+
+FTS5(utils.fulltext_search), 노트 통계(utils.note_stats), 변경 카운터(utils.note_versions)의
+테이블/트리거는 여기 등록하지 않고 init_db가 시작할 때마다 setup_*()으로 확인한다.
+- 모두 IF NOT EXISTS라 다시 실행해도 기존 테이블을 확인하는 비용뿐이다
+- 실행하면서 모듈 상태(사용 가능 여부, FTS 토크나이저)를 정하므로 프로세스마다 한 번은 돌아야 한다
+- 사용 가능 여부가 DB가 아니라 SQLite 빌드에 달려 있다 (trigram 미지원 → unicode61, FTS5 없음 → LIKE 검색)
+  한 번 기록하고 건너뛰는 버전 마이그레이션으로는 SQLite가 바뀐 환경을 처리할 수 없다
+
+쿼리 계획 점검: cd backend && python -m config.migrations --check
+"""
+
+import sys
+from datetime import datetime
+from typing import Dict, List
+
+from sqlalchemy import text
+
+MIGRATIONS_TABLE = 'schema_migrations'
+
+
+# =========================
+# 마이그레이션 정의
+# =========================
+
+def _backfill_note_tags(connection):
+    """JSON 태그 문자열 → tags/note_tags 테이블
+
+    tags.name은 NOCASE 유일이라 대소문자만 다른 태그는 한 행으로 합쳐지므로,
+    notes.tags JSON도 실제로 연결된 정규 이름(중복 제거)으로 다시 씀
+    """
+    import json
+
+    if connection.execute(text("SELECT 1 FROM note_tags LIMIT 1")).first():
+        return
+
+    rows = connection.execute(text(
+        "SELECT id, tags FROM notes WHERE tags IS NOT NULL AND tags NOT IN ('', '[]')"
+    )).fetchall()
+
+    tags_by_key = {}  # 소문자 이름 → (tag_id, 저장된 이름)
+    for note_id, raw_tags in rows:
+        try:
+            names = json.loads(raw_tags)
+        except (ValueError, TypeError):
+            continue
+
+        linked = set()
+        canonical_names = []
+        for name in names:
+            name = str(name).strip()
+            if not name:
+                continue
+
+            key = name.lower()
+            if key not in tags_by_key:
+                row = connection.execute(text("SELECT id, name FROM tags WHERE name = :name"), {"name": name}).first()
+                if row is None:
+                    tag_id = connection.execute(text("INSERT INTO tags (name) VALUES (:name)"), {"name": name}).lastrowid
+                    row = (tag_id, name)
+                tags_by_key[key] = tuple(row)
+
+            tag_id, canonical_name = tags_by_key[key]
+            if tag_id not in linked:
+                connection.execute(
+                    text("INSERT INTO note_tags (note_id, tag_id) VALUES (:note_id, :tag_id)"),
+                    {"note_id": note_id, "tag_id": tag_id}
+                )
+                linked.add(tag_id)
+                canonical_names.append(canonical_name)
+
+        canonical_tags = json.dumps(canonical_names, ensure_ascii=False)
+        if canonical_tags != raw_tags:
+            connection.execute(
+                text("UPDATE notes SET tags = :tags WHERE id = :id"),
+                {"tags": canonical_tags, "id": note_id}
+            )
+
+
+def _add_hot_column_indexes(connection):
+    """목록/정렬/필터에 쓰이는 컬럼 인덱스"""
+    statements = [
+        # 노트 최신순 목록, 커서 페이지네이션, 날짜 범위 조회
+        "CREATE INDEX IF NOT EXISTS ix_notes_created_at_id ON notes (created_at, id)",
+        # 최근 수정순 (search_by_tag, get_recent_notes, 검색 결과)
+        "CREATE INDEX IF NOT EXISTS ix_notes_updated_at ON notes (updated_at)",
+        # 채팅 최신순 히스토리, 기간별 통계
+        "CREATE INDEX IF NOT EXISTS ix_chat_history_created_at_id ON chat_history (created_at, id)",
+        # 노트별 최근 채팅 (get_recent_chats(note_id))
+        "CREATE INDEX IF NOT EXISTS ix_chat_history_note_id_created_at ON chat_history (note_id, created_at)",
+    ]
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+def _add_note_preview_columns(connection):
+    """목록용 preview/content_length 컬럼 추가 후 기존 노트 채우기"""
+    from models.note import make_preview
+
+    columns = {row[1] for row in connection.execute(text("PRAGMA table_info(notes)")).fetchall()}
+    if 'preview' not in columns:
+        connection.execute(text("ALTER TABLE notes ADD COLUMN preview VARCHAR(201)"))
+    if 'content_length' not in columns:
+        connection.execute(text("ALTER TABLE notes ADD COLUMN content_length INTEGER DEFAULT 0"))
+
+    # 본문을 한꺼번에 메모리에 올리지 않도록 id 순으로 나눠서 처리
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            text("SELECT id, content FROM notes WHERE id > :last_id ORDER BY id LIMIT 500"), {"last_id": last_id}
+        ).fetchall()
+        if not rows:
+            break
+        connection.execute(
+            text("UPDATE notes SET preview = :preview, content_length = :length WHERE id = :id"),
+            [{"id": note_id, "preview": make_preview(content), "length": len(content) if content else 0}
+             for note_id, content in rows]
+        )
+        last_id = rows[-1][0]
+
+
+def _add_chat_hour_index(connection):
+    """채팅 시간별 통계(ChatHistory.hourly_buckets_query)용 식 인덱스"""
+    from models.note import CHAT_HOUR_FORMAT
+
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_chat_history_created_hour "
+        f"ON chat_history (strftime('{CHAT_HOUR_FORMAT}', created_at))"
+    ))
+
+
+MIGRATIONS = [
+    (1, "JSON 태그를 tags/note_tags 테이블로 이전", _backfill_note_tags),
+    (2, "정렬/필터 컬럼 인덱스 추가", _add_hot_column_indexes),
+    (3, "노트 미리보기/내용 길이 컬럼 추가", _add_note_preview_columns),
+    (4, "채팅 시간별 버킷 식 인덱스 추가", _add_chat_hour_index),
+]
+
+
+# =========================
+# 실행
+# =========================
+
+def _ensure_migrations_table(connection):
+    connection.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {MIGRATIONS_TABLE} ("
+        "version INTEGER PRIMARY KEY, description VARCHAR(255) NOT NULL, applied_at DATETIME NOT NULL)"
+    ))
+
+
+def get_schema_version(connection) -> int:
+    """적용된 마지막 마이그레이션 버전 (없으면 0)"""
+    _ensure_migrations_table(connection)
+    return connection.execute(text(f"SELECT COALESCE(MAX(version), 0) FROM {MIGRATIONS_TABLE}")).scalar()
+
+
+def run_migrations(engine) -> List[int]:
+    """아직 적용되지 않은 마이그레이션 실행 (각 버전마다 별도 트랜잭션)
+
+    Returns:
+        이번에 적용한 버전 목록
+    """
+    with engine.begin() as connection:
+        current = get_schema_version(connection)
+
+    applied = []
+    for version, description, migrate in MIGRATIONS:
+        if version <= current:
+            continue
+
+        print(f"🔄 스키마 마이그레이션 v{version}: {description}")
+        with engine.begin() as connection:
+            migrate(connection)
+            connection.execute(
+                text(f"INSERT INTO {MIGRATIONS_TABLE} (version, description, applied_at) "
+                     "VALUES (:version, :description, :applied_at)"),
+                {"version": version, "description": description, "applied_at": datetime.utcnow()}
+            )
+        applied.append(version)
+
+    return applied
+
+
+# =========================
+# 쿼리 계획 점검
+# =========================
+
+def _hot_queries():
+    """(이름, 쿼리, 사용해야 하는 인덱스) - 리포지토리/모델이 실제로 실행하는 쿼리 (앱 컨텍스트 필요)"""
+    from app.repositories.base_repository import BaseRepository
+    from app.repositories.note_repository import NoteRepository
+    from models.note import ChatHistory
+    from utils.pagination import encode_cursor
+
+    notes = NoteRepository()
+    chats = BaseRepository(ChatHistory)
+    cursor = encode_cursor(datetime(2024, 1, 1), 100)
+    start, end = datetime(2024, 1, 1), datetime(2024, 2, 1)
+
+    return [
+        ("노트 최신순 목록", notes.page_query(20), "ix_notes_created_at_id"),
+        ("노트 커서 페이지", notes.page_query(20, cursor), "ix_notes_created_at_id"),
+        ("노트 날짜 범위", notes.date_range_query(start, end), "ix_notes_created_at_id"),
+        ("최근 생성 노트", notes.recent_query(10), "ix_notes_created_at_id"),
+        ("태그별 노트", notes.tag_query(['python', 'db']), "ix_note_tags_tag_id_note_id"),
+        ("태그 필터 커서 페이지",
+         notes.page_query(20, cursor, notes.model.query.filter(notes.model.tag_filter(['python']))),
+         "ix_notes_created_at_id"),
+        ("태그 필터 검색 (짧은 검색어 없음)", notes._search_query(tags=['python'])[0].limit(50),
+         "ix_notes_created_at_id"),
+        ("최근 수정 노트 (태그)",
+         notes.model.query.filter(notes.model.tag_filter('python')).order_by(notes.model.updated_at.desc()),
+         "ix_notes_updated_at"),
+        ("채팅 최신순 히스토리", chats.page_query(50), "ix_chat_history_created_at_id"),
+        ("채팅 커서 페이지", chats.page_query(50, cursor), "ix_chat_history_created_at_id"),
+        ("채팅 기간 통계", ChatHistory.hourly_buckets_query(start), "ix_chat_history_created_hour"),
+        ("노트별 최근 채팅", ChatHistory.recent_chats_query(note_id=1), "ix_chat_history_note_id_created_at"),
+    ]
+
+
+def _compile(query, dialect) -> str:
+    """ORM 쿼리 → 값이 박힌 SQL (EXPLAIN QUERY PLAN용)"""
+    statement = getattr(query, 'statement', query)
+    return str(statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+
+def explain_hot_queries(connection) -> List[Dict]:
+    """주요 쿼리의 EXPLAIN QUERY PLAN과 기대 인덱스 사용 여부"""
+    results = []
+    for name, query, expected_index in _hot_queries():
+        sql = _compile(query, connection.dialect)
+        plan = [row[-1] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {sql}")).fetchall()]
+        results.append({
+            "name": name,
+            "expected_index": expected_index,
+            "uses_index": any(expected_index in step for step in plan),
+            "full_scan": any(step.startswith('SCAN ') and 'INDEX' not in step for step in plan),
+            "temp_sort": any('USE TEMP B-TREE' in step for step in plan),
+            "sql": sql,
+            "plan": plan
+        })
+    return results
+
+
+def main():
+    """마이그레이션 적용 후 주요 쿼리 계획 점검 (인덱스를 쓰지 않는 쿼리가 있으면 종료 코드 1)"""
+    from flask import Flask
+    from config.settings import Config
+    from config.database import init_db, db
+
+    # SPA 빌드 없이 DB만 초기화 (init_db가 마이그레이션까지 적용)
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    init_db(app)
+
+    with app.app_context():
+        with db.engine.connect() as connection:
+            print(f"📦 스키마 버전: v{get_schema_version(connection)}")
+            results = explain_hot_queries(connection)
+
+    failed = [result for result in results if not result["uses_index"] or result["temp_sort"]]
+    for result in results:
+        status = "✅" if result not in failed else "❌"
+        print(f"{status} {result['name']}: {' / '.join(result['plan'])}")
+
+    if '--check' in sys.argv and failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
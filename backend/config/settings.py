@@ -41,6 +41,38 @@ class Config:
         'pool_recycle': -1,
         'pool_pre_ping': True
     }
+    # SQLite 연결 튜닝 (연결마다 PRAGMA 적용, init_db에서 SQLite일 때만 사용)
+    SQLITE_TUNING_ENABLED = os.getenv('SQLITE_TUNING_ENABLED', 'True').lower() in ('true', '1', 'yes')
+    SQLITE_JOURNAL_MODE = os.getenv('SQLITE_JOURNAL_MODE', 'WAL').upper()
+    SQLITE_SYNCHRONOUS = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL').upper()
+    SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))  # bytes
+    SQLITE_CACHE_SIZE = int(os.getenv('SQLITE_CACHE_SIZE', '-20000'))  # 음수 = KiB 단위 (약 20MB)
+    SQLITE_TEMP_STORE = os.getenv('SQLITE_TEMP_STORE', 'MEMORY').upper()
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+    SQLITE_POOL_SIZE = int(os.getenv('SQLITE_POOL_SIZE', '8'))
+    SQLITE_MAX_OVERFLOW = int(os.getenv('SQLITE_MAX_OVERFLOW', '8'))
+    # 쿼리 진단: 샘플링 비율(0.0 = 끔)과 느린 쿼리 경고 기준(ms)
+    DB_DIAGNOSTICS_SAMPLE_RATE = float(os.getenv('DB_DIAGNOSTICS_SAMPLE_RATE', '0.0'))
+    DB_DIAGNOSTICS_SLOW_MS = float(os.getenv('DB_DIAGNOSTICS_SLOW_MS', '100'))
+    # 노트 일괄 가져오기: 트랜잭션당 노트 수, 응답에 담을 최대 오류 수
+    NOTE_IMPORT_BATCH_SIZE = int(os.getenv('NOTE_IMPORT_BATCH_SIZE', '500'))
+    NOTE_IMPORT_MAX_ERRORS = int(os.getenv('NOTE_IMPORT_MAX_ERRORS', '50'))
+    # 스트리밍(NDJSON) 응답: DB 커서에서 한 번에 읽는 행 수 (yield_per)
+    STREAM_BATCH_SIZE = int(os.getenv('STREAM_BATCH_SIZE', '500'))
+    # 노트 일괄 삭제/태그 변경: 요청당 최대 노트 수
+    NOTE_BULK_MAX_IDS = int(os.getenv('NOTE_BULK_MAX_IDS', '1000'))
+    # 채팅 기록 지연 저장(write-behind): 배치 크기, 저장 주기(ms), 유실 방지 파일, 기록마다 fsync 여부
+    CHAT_WRITE_BEHIND = os.getenv('CHAT_WRITE_BEHIND', 'False').lower() in ('true', '1', 'yes')
+    CHAT_WRITE_BEHIND_BATCH_SIZE = int(os.getenv('CHAT_WRITE_BEHIND_BATCH_SIZE', '100'))
+    CHAT_WRITE_BEHIND_INTERVAL_MS = float(os.getenv('CHAT_WRITE_BEHIND_INTERVAL_MS', '200'))
+    CHAT_WRITE_BEHIND_SPILL_PATH = os.getenv('CHAT_WRITE_BEHIND_SPILL_PATH', str(BASE_DIR / 'data' / 'chat_spill.ndjson'))
+    CHAT_WRITE_BEHIND_FSYNC = os.getenv('CHAT_WRITE_BEHIND_FSYNC', 'False').lower() in ('true', '1', 'yes')
+    # 채팅 보관 정책: 보관 일수/최대 행 수(0 = 끔)를 넘는 오래된 채팅은 월별 gzip NDJSON 아카이브로 이동
+    CHAT_RETENTION_DAYS = int(os.getenv('CHAT_RETENTION_DAYS', '0'))
+    CHAT_RETENTION_MAX_ROWS = int(os.getenv('CHAT_RETENTION_MAX_ROWS', '0'))
+    CHAT_ARCHIVE_DIR = os.getenv('CHAT_ARCHIVE_DIR', str(BASE_DIR / 'data' / 'chat_archive'))
+    CHAT_ARCHIVE_BATCH_SIZE = int(os.getenv('CHAT_ARCHIVE_BATCH_SIZE', '1000'))
+    CHAT_ARCHIVE_INTERVAL_HOURS = float(os.getenv('CHAT_ARCHIVE_INTERVAL_HOURS', '24'))
     
     # ========== AI API 설정 ==========
     ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
@@ -56,8 +88,32 @@ class Config:
     RAG_INDEX_PATH = os.getenv('RAG_INDEX_PATH', str(BASE_DIR / 'data' / 'note_vectors.index'))
     RAG_METADATA_PATH = os.getenv('RAG_METADATA_PATH', str(BASE_DIR / 'data' / 'notes_metadata.json'))
     RAG_EMBEDDING_MODEL = os.getenv('RAG_EMBEDDING_MODEL', 'sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2')
+    # RAG 엔진: auto(가능하면 dense, 아니면 lite) / dense(faiss + 임베딩) / lite(NumPy n-gram TF-IDF)
+    RAG_ENGINE = os.getenv('RAG_ENGINE', 'auto').lower()
+    RAG_LITE_INDEX_PATH = os.getenv('RAG_LITE_INDEX_PATH', str(BASE_DIR / 'data' / 'note_vectors.lite.npz'))
+    RAG_LITE_FEATURES = int(os.getenv('RAG_LITE_FEATURES', str(2 ** 18)))
     RAG_CHUNK_SIZE = int(os.getenv('RAG_CHUNK_SIZE', '500'))
     RAG_CHUNK_OVERLAP = int(os.getenv('RAG_CHUNK_OVERLAP', '50'))
+    # 검색 결과 다양화: 노트 단위 중복 제거 후 MMR 적용 (lambda 1.0 = 관련도만)
+    RAG_MMR_ENABLED = os.getenv('RAG_MMR_ENABLED', 'True').lower() in ('true', '1', 'yes')
+    RAG_MMR_LAMBDA = float(os.getenv('RAG_MMR_LAMBDA', '0.7'))
+    RAG_CANDIDATE_MULTIPLIER = int(os.getenv('RAG_CANDIDATE_MULTIPLIER', '4'))
+    # 임베딩 모델 전환(마이그레이션) 상태 파일 및 재임베딩 배치 크기
+    RAG_MODEL_STATE_PATH = os.getenv('RAG_MODEL_STATE_PATH', str(BASE_DIR / 'data' / 'rag_model_state.json'))
+    RAG_MIGRATION_BATCH_SIZE = int(os.getenv('RAG_MIGRATION_BATCH_SIZE', '32'))
+    # 동시 쿼리 임베딩 마이크로 배치 (최대 대기 시간 ms / 최대 배치 크기)
+    RAG_BATCHING_ENABLED = os.getenv('RAG_BATCHING_ENABLED', 'True').lower() in ('true', '1', 'yes')
+    RAG_BATCH_MAX_WAIT_MS = float(os.getenv('RAG_BATCH_MAX_WAIT_MS', '5'))
+    RAG_BATCH_MAX_SIZE = int(os.getenv('RAG_BATCH_MAX_SIZE', '32'))
+    # 임베딩 경로: local(프로세스 내부 모델) / remote(공유 임베딩 서버, Unix 소켓)
+    RAG_EMBEDDING_BACKEND = os.getenv('RAG_EMBEDDING_BACKEND', 'local').lower()
+    RAG_EMBEDDING_SOCKET = os.getenv('RAG_EMBEDDING_SOCKET', '/tmp/ai-note-embedding.sock')
+    RAG_EMBEDDING_POOL_SIZE = int(os.getenv('RAG_EMBEDDING_POOL_SIZE', '4'))
+    RAG_EMBEDDING_TIMEOUT = float(os.getenv('RAG_EMBEDDING_TIMEOUT', '5'))
+    # RAG_BATCH_MAX_SIZE개 이상을 한 번에 임베딩하는 요청(마이그레이션/일괄 색인)의 응답 대기 시간
+    RAG_EMBEDDING_BATCH_TIMEOUT = float(os.getenv('RAG_EMBEDDING_BATCH_TIMEOUT', '60'))
+    RAG_EMBEDDING_FALLBACK = os.getenv('RAG_EMBEDDING_FALLBACK', 'True').lower() in ('true', '1', 'yes')
+    RAG_EMBEDDING_RETRY_SECONDS = float(os.getenv('RAG_EMBEDDING_RETRY_SECONDS', '30'))
     
     # ========== 보안 설정 ==========
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', '*').split(',')
@@ -77,6 +133,14 @@ class Config:
     # ========== 캐싱 설정 ==========
     CACHE_TYPE = os.getenv('CACHE_TYPE', 'simple')
     CACHE_DEFAULT_TIMEOUT = int(os.getenv('CACHE_DEFAULT_TIMEOUT', '300'))
+    # 노트 단건 조회 캐시: 로컬 LRU 크기(0 = 끔), 공유 저장소(redis://...)와 항목 TTL(초)
+    NOTE_CACHE_SIZE = int(os.getenv('NOTE_CACHE_SIZE', '512'))
+    NOTE_CACHE_URL = os.getenv('NOTE_CACHE_URL', '')
+    NOTE_CACHE_TTL = int(os.getenv('NOTE_CACHE_TTL', '300'))
+    # 자동완성 색인: 다른 워커의 변경을 반영하기 위한 백그라운드 재구성 주기(초, 0 = 끔)
+    AUTOCOMPLETE_REFRESH_SECONDS = float(os.getenv('AUTOCOMPLETE_REFRESH_SECONDS', '300'))
+    # 채팅 통계(/api/stats, /api/stats/advanced, /api/history/summary) 집계 캐시 유지 시간(초, 0 = 끔)
+    CHAT_STATS_CACHE_SECONDS = float(os.getenv('CHAT_STATS_CACHE_SECONDS', '30'))
     
     # ========== 속도 제한 설정 ==========
     RATELIMIT_ENABLED = os.getenv('RATELIMIT_ENABLED', 'False').lower() in ('true', '1', 'yes')
@@ -141,11 +205,21 @@ class Config:
         """RAG 시스템 설정 반환"""
         return {
             'enabled': cls.RAG_ENABLED,
+            'engine': cls.RAG_ENGINE,
             'index_path': cls.RAG_INDEX_PATH,
             'metadata_path': cls.RAG_METADATA_PATH,
             'embedding_model': cls.RAG_EMBEDDING_MODEL,
             'chunk_size': cls.RAG_CHUNK_SIZE,
-            'chunk_overlap': cls.RAG_CHUNK_OVERLAP
+            'chunk_overlap': cls.RAG_CHUNK_OVERLAP,
+            'mmr_enabled': cls.RAG_MMR_ENABLED,
+            'mmr_lambda': cls.RAG_MMR_LAMBDA,
+            'model_state_path': cls.RAG_MODEL_STATE_PATH,
+            'migration_batch_size': cls.RAG_MIGRATION_BATCH_SIZE,
+            'batching_enabled': cls.RAG_BATCHING_ENABLED,
+            'batch_max_wait_ms': cls.RAG_BATCH_MAX_WAIT_MS,
+            'batch_max_size': cls.RAG_BATCH_MAX_SIZE,
+            'embedding_backend': cls.RAG_EMBEDDING_BACKEND,
+            'embedding_socket': cls.RAG_EMBEDDING_SOCKET
         }
     
     @classmethod
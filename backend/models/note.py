@@ -1,18 +1,137 @@
 # backend/models/note.py
 from datetime import datetime
 import json
+import re
+from sqlalchemy.orm import load_only
 from config.database import db
+from utils.json_provider import loads as json_loads
+
+# 목록용 미리보기 길이 (글자 수)
+PREVIEW_LENGTH = 200
+
+_PREVIEW_PATTERNS = [
+    (re.compile(r'#{1,6}\s'), ''),              # 헤더
+    (re.compile(r'\*\*(.*?)\*\*'), r'\1'),       # 볼드
+    (re.compile(r'\*(.*?)\*'), r'\1'),           # 이탤릭
+    (re.compile(r'`(.*?)`'), r'\1'),             # 인라인 코드
+    (re.compile(r'\[(.*?)\]\(.*?\)'), r'\1'),    # 링크
+    (re.compile(r'\s+'), ' '),                  # 줄바꿈/연속 공백
+]
+
+
+def make_preview(content, length=PREVIEW_LENGTH):
+    """마크다운 기호를 걷어낸 앞부분 텍스트 (프론트엔드 미리보기와 같은 규칙)"""
+    if not content:
+        return ''
+    # 긴 노트도 앞부분만 정리 (마크다운 기호가 빠져도 length 이상 남도록 여유를 둠)
+    text = content[:length * 4]
+    clipped = len(content) > len(text)
+    for pattern, replacement in _PREVIEW_PATTERNS:
+        text = pattern.sub(replacement, text)
+    text = text.strip()
+    return text[:length] + '…' if clipped or len(text) > length else text
+
+
+# 노트-태그 연결 테이블 (PK가 note_id 기준 조회, 보조 인덱스가 tag_id 기준 조회를 담당)
+note_tags = db.Table(
+    'note_tags',
+    db.Column('note_id', db.Integer, db.ForeignKey('notes.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('tag_id', db.Integer, db.ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True),
+    db.Index('ix_note_tags_tag_id_note_id', 'tag_id', 'note_id')
+)
+
+
+class Tag(db.Model):
+    """태그 모델 (이름은 대소문자 구분 없이 유일)"""
+    __tablename__ = 'tags'
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100, collation='NOCASE'), nullable=False, unique=True, index=True)
+
+    def __repr__(self):
+        return f'<Tag {self.id}: {self.name}>'
+
+    @classmethod
+    def get_or_create_many(cls, names):
+        """이름 목록에 해당하는 Tag 객체 목록 (없는 태그는 세션에 추가)"""
+        if not names:
+            return []
+
+        with db.session.no_autoflush:
+            existing = {tag.name.lower(): tag for tag in cls.query.filter(cls.name.in_(names)).all()}
+
+        # 같은 트랜잭션에서 먼저 만들어진(아직 flush 전) 태그 재사용
+        for obj in db.session.new:
+            if isinstance(obj, cls):
+                existing.setdefault(obj.name.lower(), obj)
+
+        tags = []
+        for name in names:
+            tag = existing.get(name.lower())
+            if tag is None:
+                tag = cls(name=name)
+                db.session.add(tag)
+                existing[name.lower()] = tag
+            if tag not in tags:
+                tags.append(tag)
+        return tags
+
+    @classmethod
+    def ids_for_names(cls, names):
+        """태그 이름 → id 매핑 (키는 소문자, 없는 태그는 한 번에 삽입) - 일괄 가져오기용"""
+        wanted = {}
+        for name in names:
+            wanted.setdefault(name.lower(), name)
+        if not wanted:
+            return {}
+
+        rows = db.session.execute(db.select(cls.id, cls.name).where(cls.name.in_(list(wanted.values()))))
+        ids = {name.lower(): tag_id for tag_id, name in rows}
+
+        missing = [{"name": name} for key, name in wanted.items() if key not in ids]
+        if missing:
+            rows = db.session.execute(db.insert(cls).returning(cls.id, cls.name, sort_by_parameter_order=True), missing)
+            ids.update({name.lower(): tag_id for tag_id, name in rows})
+        return ids
+
 
 class Note(db.Model):
     """노트 모델"""
     __tablename__ = 'notes'
+    __table_args__ = (
+        # 기존 DB에는 config/migrations.py가 같은 인덱스를 추가
+        # 최신순 목록/커서 페이지네이션 (created_at DESC, id DESC)
+        db.Index('ix_notes_created_at_id', 'created_at', 'id'),
+        # 최근 수정순 조회
+        db.Index('ix_notes_updated_at', 'updated_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
     content = db.Column(db.Text, nullable=False)
-    tags = db.Column(db.String(500))  # JSON 문자열로 저장
+    tags = db.Column(db.String(500))  # JSON 문자열 (응답용 사본, 검색은 tag_objects 사용)
+    # content가 바뀔 때 함께 갱신 (목록 응답이 content를 읽지 않도록)
+    preview = db.Column(db.String(PREVIEW_LENGTH + 1))
+    content_length = db.Column(db.Integer, default=0)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # 정규화된 태그 (note_tags 연결 테이블, set_tags로 JSON 사본과 함께 갱신)
+    tag_objects = db.relationship('Tag', secondary=note_tags, lazy='select', backref='notes')
+
+    # 응답 필드(fields=) → 읽어야 하는 컬럼 (id/created_at은 커서 페이지네이션에 필요해서 항상 포함)
+    FIELD_COLUMNS = {
+        'id': [],
+        'title': ['title'],
+        'content': ['content'],
+        'preview': ['preview'],
+        'tags': ['tags'],
+        'created_at': [],
+        'updated_at': ['updated_at'],
+        'content_length': ['content_length'],
+        'tag_count': ['tags'],
+        'search': [],
+    }
     
     def __repr__(self):
         return f'<Note {self.id}: {self.title}>'
@@ -24,26 +143,30 @@ class Note(db.Model):
             'title': self.title,
             'content': self.content,
             'tags': self.get_tags(),
+            'preview': self.preview,
+            'content_length': self.content_length or 0,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
     
     def set_tags(self, tags_list):
-        """태그 리스트를 JSON 문자열로 저장"""
+        """태그 리스트를 JSON 문자열과 note_tags 연결 테이블에 함께 저장"""
         if isinstance(tags_list, list):
-            self.tags = json.dumps(tags_list, ensure_ascii=False)
+            tag_list = tags_list
         elif isinstance(tags_list, str):
             # 콤마로 구분된 문자열을 리스트로 변환
             tag_list = [tag.strip() for tag in tags_list.split(',') if tag.strip()]
-            self.tags = json.dumps(tag_list, ensure_ascii=False)
         else:
-            self.tags = json.dumps([], ensure_ascii=False)
+            tag_list = []
+
+        self.tags = json.dumps(tag_list, ensure_ascii=False)
+        self.tag_objects = Tag.get_or_create_many([str(tag) for tag in tag_list if str(tag).strip()])
     
     def get_tags(self):
         """저장된 태그를 리스트로 반환"""
         try:
-            return json.loads(self.tags) if self.tags else []
-        except (json.JSONDecodeError, TypeError):
+            return json_loads(self.tags) if self.tags else []
+        except (ValueError, TypeError):
             return []
     
     def add_tag(self, tag):
@@ -64,6 +187,14 @@ class Note(db.Model):
         """특정 태그 포함 여부 확인"""
         return tag in self.get_tags()
     
+    @classmethod
+    def load_only_fields(cls, fields):
+        """응답 필드에 필요한 컬럼만 읽는 로더 옵션 (나머지 컬럼, 특히 content는 읽지 않음)"""
+        names = {'id', 'created_at'}
+        for field in fields:
+            names.update(cls.FIELD_COLUMNS[field])
+        return load_only(*(getattr(cls, name) for name in sorted(names)))
+    
     @classmethod
     def search_by_content(cls, query):
         """내용으로 노트 검색"""
@@ -71,30 +202,87 @@ class Note(db.Model):
             cls.title.contains(query) | cls.content.contains(query)
         ).order_by(cls.updated_at.desc()).all()
     
+    @classmethod
+    def tag_filter(cls, tags):
+        """태그 중 하나라도 가진 노트 조건 (note_tags 인덱스 조회)
+
+        id + 0으로 rowid 조회를 막아, 태그의 노트 목록을 한 번 만든 뒤 정렬 인덱스
+        (created_at/updated_at)를 순서대로 훑으며 걸러냄 → 임시 정렬 없이 LIMIT에서 멈춤
+        (id IN (...)이면 rowid로 찾은 뒤 전체를 USE TEMP B-TREE로 정렬)
+        """
+        if isinstance(tags, str):
+            tags = [tags]
+        return (cls.id + 0).in_(
+            db.select(note_tags.c.note_id)
+            .join(Tag, Tag.id == note_tags.c.tag_id)
+            .where(Tag.name.in_(list(tags)))
+        )
+    
     @classmethod
     def search_by_tag(cls, tag):
         """태그로 노트 검색"""
-        return cls.query.filter(cls.tags.contains(f'"{tag}"')).order_by(cls.updated_at.desc()).all()
+        return cls.query.filter(cls.tag_filter(tag)).order_by(cls.updated_at.desc()).all()
     
     @classmethod
     def get_all_tags(cls):
-        """모든 노트의 태그 목록 반환"""
-        notes = cls.query.all()
-        all_tags = set()
-        
-        for note in notes:
-            all_tags.update(note.get_tags())
-        
-        return sorted(list(all_tags))
+        """노트에 연결된 태그 목록 반환 (집계 쿼리 한 번)"""
+        rows = db.session.query(Tag.name).join(note_tags, note_tags.c.tag_id == Tag.id) \
+            .group_by(Tag.id).order_by(Tag.name).all()
+        return [name for (name,) in rows]
+    
+    @classmethod
+    def get_tag_counts(cls):
+        """태그별 노트 수 (많은 순, 집계 쿼리 한 번)"""
+        count = db.func.count(note_tags.c.note_id)
+        rows = db.session.query(Tag.name, count).join(note_tags, note_tags.c.tag_id == Tag.id) \
+            .group_by(Tag.id).order_by(count.desc(), Tag.name).all()
+        return [{"name": name, "count": total} for name, total in rows]
+    
+    @classmethod
+    def get_tag_summary(cls):
+        """태그별 노트 수와 마지막 사용 시각 (많은 순, 집계 쿼리 한 번)
+
+        마지막 사용 시각은 해당 태그가 붙은 노트 중 가장 최근에 수정된 노트의 updated_at
+        """
+        count = db.func.count(note_tags.c.note_id)
+        last_used = db.func.max(cls.updated_at)
+        rows = db.session.query(Tag.name, count, last_used) \
+            .join(note_tags, note_tags.c.tag_id == Tag.id) \
+            .join(cls, cls.id == note_tags.c.note_id) \
+            .group_by(Tag.id).order_by(count.desc(), Tag.name).all()
+        return [{
+            "name": name,
+            "count": total,
+            "last_used": latest.isoformat() if latest else None
+        } for name, total, latest in rows]
     
     @classmethod
     def get_recent_notes(cls, limit=10):
         """최근 노트 목록"""
         return cls.query.order_by(cls.updated_at.desc()).limit(limit).all()
 
+@db.event.listens_for(Note.content, 'set')
+def _sync_content_summary(target, value, oldvalue, initiator):
+    """content 저장 시 미리보기/길이 갱신"""
+    target.preview = make_preview(value)
+    target.content_length = len(value) if value else 0
+
+
+# 채팅 시간별 버킷 키 형식 (ix_chat_history_created_hour 식과 같아야 인덱스를 씀)
+CHAT_HOUR_FORMAT = '%Y-%m-%d %H'
+
+
 class ChatHistory(db.Model):
     """채팅 히스토리 모델"""
     __tablename__ = 'chat_history'
+    __table_args__ = (
+        # 최신순 히스토리/커서 페이지네이션 (created_at DESC, id DESC)
+        db.Index('ix_chat_history_created_at_id', 'created_at', 'id'),
+        # 노트별 최근 채팅
+        db.Index('ix_chat_history_note_id_created_at', 'note_id', 'created_at'),
+        # 시간별 통계 버킷 (범위 조건과 GROUP BY를 같은 식으로 처리)
+        db.Index('ix_chat_history_created_hour', db.text(f"strftime('{CHAT_HOUR_FORMAT}', created_at)")),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     note_id = db.Column(db.Integer, db.ForeignKey('notes.id'), nullable=True)
@@ -123,7 +311,29 @@ class ChatHistory(db.Model):
     @classmethod
     def get_recent_chats(cls, note_id=None, limit=20):
         """최근 채팅 기록"""
+        return cls.recent_chats_query(note_id, limit).all()
+    
+    @classmethod
+    def recent_chats_query(cls, note_id=None, limit=20):
+        """최근 채팅 기록 쿼리"""
         query = cls.query
         if note_id:
             query = query.filter_by(note_id=note_id)
-        return query.order_by(cls.created_at.desc()).limit(limit).all()
\ No newline at end of file
+        return query.order_by(cls.created_at.desc()).limit(limit)
+    
+    @classmethod
+    def hourly_buckets_query(cls, since):
+        """since가 속한 시각부터 시간별(YYYY-MM-DD HH) 채팅 수와 사용자/AI 메시지 길이 합 쿼리
+
+        범위 조건도 버킷 키로 비교해 식 인덱스 하나로 범위 조회와 그룹화를 함께 처리
+        (형식을 바인드 값으로 넘기면 인덱스 식과 달라지므로 리터럴로 넣음)
+        """
+        hour = db.func.strftime(db.literal_column(f"'{CHAT_HOUR_FORMAT}'"), cls.created_at)
+        return db.session.query(
+            hour.label('hour'),
+            db.func.count(cls.id),
+            db.func.coalesce(db.func.sum(db.func.length(cls.user_message)), 0),
+            db.func.coalesce(db.func.sum(db.func.length(cls.ai_response)), 0)
+        ).filter(
+            hour >= since.strftime(CHAT_HOUR_FORMAT)
+        ).group_by('hour').order_by('hour')
\ No newline at end of file
@@ -0,0 +1,48 @@
+# backend/tests/conftest.py - pytest 공통 설정
+"""
+테스트 공통 설정
+
+설정(Config)과 전역 인스턴스는 임포트 시점에 환경변수를 읽으므로,
+백엔드 모듈을 임포트하기 전에 데이터 경로를 모두 임시 디렉터리로 돌린다.
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+from flask import Flask
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+_DATA_DIR = tempfile.mkdtemp(prefix='ai-note-tests-')
+os.environ.setdefault('RAG_ENGINE', 'lite')
+os.environ.setdefault('RAG_INDEX_PATH', os.path.join(_DATA_DIR, 'note_vectors.index'))
+os.environ.setdefault('RAG_METADATA_PATH', os.path.join(_DATA_DIR, 'notes_metadata.json'))
+os.environ.setdefault('RAG_LITE_INDEX_PATH', os.path.join(_DATA_DIR, 'note_vectors.lite.npz'))
+os.environ.setdefault('RAG_MODEL_STATE_PATH', os.path.join(_DATA_DIR, 'rag_model_state.json'))
+os.environ.setdefault('CHAT_WRITE_BEHIND_SPILL_PATH', os.path.join(_DATA_DIR, 'chat_spill.ndjson'))
+os.environ.setdefault('CHAT_ARCHIVE_DIR', os.path.join(_DATA_DIR, 'chat_archive'))
+
+
+@pytest.fixture
+def app(tmp_path):
+    """테스트마다 새 SQLite 파일을 쓰는 최소 앱 (블루프린트 없이 서비스/유틸만 사용)"""
+    from config.settings import TestingConfig
+    from config.database import init_db
+    from utils.json_provider import init_json
+    from utils.note_cache import note_cache
+
+    app = Flask(__name__)
+    app.config.from_object(TestingConfig)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'notes.db'}"
+    init_json(app)
+    init_db(app)
+
+    # 전역 캐시는 이전 테스트의 DB 내용을 들고 있을 수 있음
+    note_cache.clear()
+
+    with app.app_context():
+        yield app
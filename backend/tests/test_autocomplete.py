@@ -0,0 +1,47 @@
+# backend/tests/test_autocomplete.py - 자동완성 색인
+"""
+재구성 도중에 들어온 증분 반영이 새 색인에 남는지 확인
+"""
+
+from utils.autocomplete import NoteAutocomplete
+
+
+def rows():
+    return [
+        (1, 'Flask 정리', '["python"]', 'flask blueprint 라우팅'),
+        (2, 'Vue 컴포넌트', '["frontend"]', 'vue props emit'),
+    ]
+
+
+def test_incremental_updates_during_refresh_survive_the_swap(app):
+    autocomplete = NoteAutocomplete(refresh_seconds=0)
+    autocomplete.ensure_built(rows)
+    assert autocomplete.suggest('flask')['titles'] == ['Flask 정리']
+
+    def loader():
+        # 재구성이 노트를 다 읽은 뒤, 교체 전에 다른 요청이 쓴 변경
+        snapshot = rows()
+        yield from snapshot
+        autocomplete.upsert_note(3, 'Flask 캐시', ['python', 'cache'], 'flask cache redis')
+        autocomplete.remove_notes([2])
+        autocomplete.update_tags(1, ['python', 'web'])
+
+    autocomplete._refreshing = True
+    autocomplete._refresh(app, loader)
+
+    suggestions = autocomplete.suggest('flask', limit=5)
+    assert sorted(suggestions['titles']) == ['Flask 정리', 'Flask 캐시']
+    assert autocomplete.suggest('vue')['titles'] == []
+    assert autocomplete.suggest('#we')['tags'] == ['web']
+    assert autocomplete.suggest('ca')['tags'] == ['cache']
+    assert autocomplete.get_stats()['notes'] == 2
+    assert not autocomplete._refreshing
+
+
+def test_updates_are_ignored_until_the_first_build():
+    autocomplete = NoteAutocomplete()
+    autocomplete.upsert_note(9, '무시될 노트', [], '내용')
+    assert not autocomplete.accepts_updates
+
+    autocomplete.ensure_built(rows)
+    assert autocomplete.get_stats()['notes'] == 2
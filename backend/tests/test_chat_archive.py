@@ -0,0 +1,69 @@
+# backend/tests/test_chat_archive.py - 채팅 보관 정책 / 압축 아카이브
+"""
+아카이브로 옮긴 기록이 내보내기/검색에서 옮기기 전과 똑같이 보이는지 확인
+"""
+
+from datetime import datetime
+
+import pytest
+
+from config.database import db
+from models.note import ChatHistory
+from app.services.chat_service import ChatService
+from utils.chat_archive import chat_archive
+
+
+@pytest.fixture
+def service(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(chat_archive, 'directory', tmp_path / 'chat_archive')
+    chats = [
+        ("1월 질문 flask", datetime(2024, 1, 15, 9, 0)),
+        ("1월 질문 vue", datetime(2024, 1, 20, 9, 0)),
+        ("2월 질문 flask", datetime(2024, 2, 3, 9, 0)),
+        ("3월 질문 sqlite", datetime(2024, 3, 1, 9, 0)),
+        ("3월 질문 flask", datetime(2024, 3, 2, 9, 0)),
+    ]
+    for message, created_at in chats:
+        db.session.add(ChatHistory(user_message=message, ai_response=f"{message} 답변",
+                                   model_used='test', created_at=created_at))
+    db.session.commit()
+    return ChatService()
+
+
+def export(service, start=None, end=None):
+    result = service.export_chat_history(start, end)
+    assert result["success"], result
+    return result["data"]["chat_history"]
+
+
+def test_archived_chats_round_trip_through_export_and_search(service):
+    before_all = export(service)
+    before_range = export(service, '2024-01-18T00:00:00', '2024-02-28T00:00:00')
+    before_search = service.search_chat_history('flask', limit=10)
+
+    # 최근 2개만 DB에 남기고 나머지는 월별 아카이브로
+    report = service.archive_chat_history(max_rows=2)
+    assert report["archived"] == 3
+    assert report["months"] == ['2024-01', '2024-02']
+    assert ChatHistory.query.count() == 2
+    assert chat_archive.get_stats()["archived_records"] == 3
+
+    assert export(service) == before_all
+    assert export(service, '2024-01-18T00:00:00', '2024-02-28T00:00:00') == before_range
+    assert [chat["user_message"] for chat in before_range] == ["1월 질문 vue", "2월 질문 flask"]
+
+    after_search = service.search_chat_history('flask', limit=10)
+    assert [chat["id"] for chat in after_search] == [chat["id"] for chat in before_search]
+    assert [chat["user_message"] for chat in after_search] == ["3월 질문 flask", "2월 질문 flask", "1월 질문 flask"]
+
+
+def test_rearchived_records_are_not_duplicated_and_clear_removes_archives(service):
+    service.archive_chat_history(max_rows=2)
+    # 같은 기록이 다시 덧붙은 경우 (삭제 커밋 전에 죽은 뒤 재실행) 읽을 때 id로 걸러짐
+    chat_archive._append([ChatHistory(id=1, user_message="1월 질문 flask", ai_response="답변",
+                                      model_used='test', created_at=datetime(2024, 1, 15, 9, 0))])
+    assert len(export(service)) == 5
+
+    assert service.clear_chat_history() == 2 + 3
+    assert export(service) == []
+    assert chat_archive.months() == []
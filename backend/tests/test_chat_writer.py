@@ -0,0 +1,81 @@
+# backend/tests/test_chat_writer.py - 채팅 기록 write-behind 버퍼
+"""
+spill 파일 정리와 재시작 시 복구
+"""
+
+from datetime import datetime
+
+from config.database import db
+from models.note import ChatHistory
+from utils.chat_writer import ChatWriteBuffer
+from utils.json_provider import dumps as json_dumps
+
+
+def make_buffer(tmp_path):
+    # 테스트가 직접 flush()하도록 주기/배치 크기를 크게
+    return ChatWriteBuffer(enabled=True, spill_path=str(tmp_path / 'spill.ndjson'),
+                           batch_size=10000, interval_ms=60000)
+
+
+def spill_lines(buffer):
+    return buffer._live_path.read_text(encoding='utf-8').splitlines()
+
+
+def test_spill_keeps_only_records_still_pending_after_flush(app, tmp_path):
+    buffer = make_buffer(tmp_path)
+    buffer.start(app)
+    try:
+        for i in range(3):
+            buffer.enqueue(f"질문 {i}", f"답변 {i}", 'test')
+        assert len(spill_lines(buffer)) == 3
+
+        # 저장하는 동안 새 기록이 들어와도 spill에는 그 기록만 남아야 함
+        insert = buffer._insert
+
+        def insert_while_chatting(records):
+            buffer.enqueue("저장 중 질문", "답변", 'test')
+            insert(records)
+
+        buffer._insert = insert_while_chatting
+        assert buffer.flush() == 3
+        buffer._insert = insert
+
+        lines = spill_lines(buffer)
+        assert len(lines) == 1 and "저장 중 질문" in lines[0]
+
+        buffer.enqueue("다음 질문", "답변", 'test')
+        assert len(spill_lines(buffer)) == 2
+        assert buffer.flush() == 2
+        assert spill_lines(buffer) == []
+        assert ChatHistory.query.count() == 5
+    finally:
+        buffer.close()
+
+
+def test_recovery_skips_records_that_were_already_saved(app, tmp_path):
+    saved_at = datetime(2024, 5, 1, 12, 0, 0, 123456)
+    db.session.add(ChatHistory(user_message="저장됨", ai_response="답변", model_used='test', created_at=saved_at))
+    db.session.commit()
+
+    # 저장 직후 spill을 정리하기 전에 죽은 워커의 파일 (마지막 줄은 쓰다 잘림)
+    records = [
+        {"user_message": "저장됨", "ai_response": "답변", "model_used": 'test', "note_id": None,
+         "created_at": saved_at.isoformat()},
+        {"user_message": "유실 직전 1", "ai_response": "답변", "model_used": 'test', "note_id": None,
+         "created_at": datetime(2024, 5, 1, 12, 0, 1).isoformat()},
+        {"user_message": "유실 직전 2", "ai_response": "답변", "model_used": 'test', "note_id": None,
+         "created_at": datetime(2024, 5, 1, 12, 0, 2).isoformat()},
+    ]
+    dead_spill = tmp_path / 'spill.99999999.ndjson'
+    dead_spill.write_text(''.join(json_dumps(record) + '\n' for record in records) + '{"user_mes',
+                          encoding='utf-8')
+
+    buffer = make_buffer(tmp_path)
+    buffer.start(app)
+    try:
+        assert buffer.recovered == 2
+        assert not dead_spill.exists()
+        messages = sorted(chat.user_message for chat in ChatHistory.query.all())
+        assert messages == ["유실 직전 1", "유실 직전 2", "저장됨"]
+    finally:
+        buffer.close()
@@ -0,0 +1,66 @@
+# backend/tests/test_embedding_service.py - 공유 임베딩 서버 클라이언트
+"""
+RemoteEmbeddingClient 연결 풀 동작 (모델 없이 프로토콜만 구현한 서버 사용)
+"""
+
+import socketserver
+import threading
+
+import numpy as np
+import pytest
+
+from utils.embedding_service import (
+    RemoteEmbeddingClient, EmbeddingServiceUnavailable,
+    recv_frame, send_frame, decode_request, STATUS_OK, _MATRIX_HEADER
+)
+
+DIMENSION = 3
+
+
+@pytest.fixture
+def server(tmp_path):
+    """요청 하나에 응답하고 연결을 끊는 서버 (재시작으로 풀의 연결이 끊긴 상황)"""
+    socket_path = str(tmp_path / 'embed.sock')
+    connections = []
+
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self):
+            connections.append(self.request)
+            _, texts = decode_request(recv_frame(self.request))
+            matrix = np.ones((len(texts), DIMENSION), dtype='<f4')
+            send_frame(self.request, bytes([STATUS_OK]) + _MATRIX_HEADER.pack(*matrix.shape) + matrix.tobytes())
+
+    server = socketserver.ThreadingUnixStreamServer(socket_path, Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield socket_path, connections
+    server.shutdown()
+    server.server_close()
+
+
+def test_stale_pooled_connection_is_retried_on_a_fresh_one(server):
+    socket_path, connections = server
+    client = RemoteEmbeddingClient(socket_path, pool_size=1, timeout=2)
+
+    assert client.encode(['첫 요청']).shape == (1, DIMENSION)
+    # 풀에 남은 연결은 서버가 이미 닫음 → 새 연결로 한 번 더 보내서 성공해야 함
+    assert client.encode(['둘째', '요청']).shape == (2, DIMENSION)
+    assert len(connections) == 2
+    client.close()
+
+
+def test_unreachable_server_raises_unavailable(tmp_path):
+    client = RemoteEmbeddingClient(str(tmp_path / 'missing.sock'), timeout=0.5)
+    with pytest.raises(EmbeddingServiceUnavailable):
+        client.encode(['요청'])
+
+
+def test_large_batches_use_the_batch_timeout():
+    client = RemoteEmbeddingClient('/nonexistent.sock', timeout=5, batch_timeout=60, large_batch=4)
+    seen = []
+    client._request = lambda body, read_timeout=None: seen.append(read_timeout) or (
+        _MATRIX_HEADER.pack(0, DIMENSION))
+
+    client.encode(['a'] * 3)
+    client.encode(['a'] * 4)
+    assert seen == [5, 60]
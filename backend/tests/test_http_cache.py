@@ -0,0 +1,115 @@
+# backend/tests/test_http_cache.py - ETag 조건부 GET
+"""
+노트 단건 응답의 ETag(updated_at 기반)와 노트 캐시가 함께 맞게 동작하는지 확인
+(GET /api/notes/<id>와 같은 구성의 라우트 사용)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from flask import jsonify
+from sqlalchemy import event, text
+
+from config.database import db
+from app.services import note_service as note_service_module
+from app.services.note_service import NoteService
+from utils.http_cache import etag_conditional
+
+
+@pytest.fixture
+def client(app):
+    service = NoteService()
+
+    @app.route('/notes/<int:note_id>')
+    @etag_conditional(lambda note_id: service.get_note_version(note_id))
+    def get_note(note_id):
+        return jsonify({"note": service.get_note_data(note_id), "timestamp": datetime.now().isoformat()})
+
+    return app.test_client(), service
+
+
+def test_unchanged_note_revalidates_with_304(client):
+    client, service = client
+    note_id = service.create_note('ETag 노트', '내용').id
+
+    first = client.get(f'/notes/{note_id}')
+    assert first.status_code == 200
+    etag, weak = first.get_etag()
+    assert etag and weak  # 본문에 요청 시각이 있어 바이트가 매번 달라지므로 약한 ETag
+
+    again = client.get(f'/notes/{note_id}', headers={'If-None-Match': first.headers['ETag']})
+    assert again.status_code == 304
+    assert again.data == b''
+    assert again.get_etag() == (etag, True)
+
+
+def test_change_from_another_worker_gives_new_etag_and_fresh_body(client):
+    client, service = client
+    note_id = service.create_note('ETag 노트', '처음 내용').id
+
+    first = client.get(f'/notes/{note_id}')
+    assert first.get_json()['note']['content'] == '처음 내용'
+
+    # 이 프로세스의 노트 캐시를 무효화하지 않는 수정 (다른 워커)
+    db.session.execute(
+        text("UPDATE notes SET content = :content, updated_at = :updated_at WHERE id = :id"),
+        {"content": '다른 워커의 내용', "updated_at": datetime.utcnow() + timedelta(seconds=1), "id": note_id}
+    )
+    db.session.commit()
+
+    second = client.get(f'/notes/{note_id}', headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200
+    assert second.get_etag()[0] != first.get_etag()[0]
+    assert second.get_json()['note']['content'] == '다른 워커의 내용'
+
+
+def test_warm_cache_get_runs_only_the_version_query(client):
+    client, service = client
+    note_id = service.create_note('ETag 노트', '내용').id
+    client.get(f'/notes/{note_id}')  # 캐시 채우기
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        response = client.get(f'/notes/{note_id}')
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+
+    assert response.status_code == 200
+    assert response.get_json()['note']['content'] == '내용'
+    # ETag용 updated_at 조회 한 번 (본문은 캐시, 같은 버전을 다시 읽지 않음)
+    assert len(statements) == 1, statements
+    assert 'updated_at' in statements[0]
+
+
+def test_stats_etag_changes_when_the_utc_date_rolls_over(app, monkeypatch):
+    service = NoteService()
+
+    @app.route('/notes/stats')
+    @etag_conditional(lambda: service.get_stats_version())
+    def get_note_stats():
+        return jsonify(service.get_note_stats())
+
+    client = app.test_client()
+    service.create_note('통계 노트', '내용')
+
+    first = client.get('/notes/stats')
+    assert first.status_code == 200
+    assert client.get('/notes/stats', headers={'If-None-Match': first.headers['ETag']}).status_code == 304
+
+    # 데이터는 그대로지만 날짜가 바뀌면 최근 7일/일별 값이 달라질 수 있으므로 새 응답
+    tomorrow = datetime.utcnow() + timedelta(days=1)
+
+    class Tomorrow(datetime):
+        @classmethod
+        def utcnow(cls):
+            return tomorrow
+
+    monkeypatch.setattr(note_service_module, 'datetime', Tomorrow)
+    second = client.get('/notes/stats', headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200
+    assert second.headers['ETag'] != first.headers['ETag']
@@ -0,0 +1,41 @@
+# backend/tests/test_lite_rag_chain.py - NumPy 경량 RAG 엔진
+"""
+검색 도중 노트가 삭제되어 위치가 밀려도 점수와 노트가 어긋나지 않는지 확인
+"""
+
+import pytest
+
+from config.settings import Config
+from chains.lite_rag_chain import LiteRAGChain
+
+
+@pytest.fixture
+def chain(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'RAG_LITE_INDEX_PATH', str(tmp_path / 'lite.npz'))
+    chain = LiteRAGChain()
+    chain.add_notes([
+        {"id": 1, "title": "파이썬", "content": "파이썬 리스트 컴프리헨션 문법"},
+        {"id": 2, "title": "플라스크", "content": "flask blueprint 라우팅 정리"},
+        {"id": 3, "title": "SQLite", "content": "sqlite 인덱스와 쿼리 계획 EXPLAIN"},
+    ], save=False)
+    return chain
+
+
+def test_search_results_match_notes_after_concurrent_delete(chain):
+    score = chain._score
+
+    def score_then_delete(query):
+        result = score(query)
+        chain.remove_note(1)  # 점수 계산 직후 앞쪽 노트 삭제 → 뒤 노트들의 위치가 한 칸씩 당겨짐
+        return result
+
+    chain._score = score_then_delete
+    results = chain.search_similar_notes('sqlite 쿼리 계획', k=1, mmr=False)
+
+    assert [result['note_id'] for result in results] == [3]
+    assert chain.search_similar_notes('flask blueprint', k=1, mmr=True)[0]['note_id'] == 2
+
+
+def test_empty_index_returns_no_results(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'RAG_LITE_INDEX_PATH', str(tmp_path / 'empty.npz'))
+    assert LiteRAGChain().search_similar_notes('아무거나') == []
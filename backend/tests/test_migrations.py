@@ -0,0 +1,134 @@
+# backend/tests/test_migrations.py - 스키마 마이그레이션 / 쿼리 계획
+"""
+마이그레이션 도입 전 스키마의 DB가 인덱스/태그 연결/미리보기 컬럼까지 올라오는지,
+마이그레이션 적용 후 주요 쿼리가 새 인덱스를 쓰는지 EXPLAIN QUERY PLAN으로 확인
+(python -m config.migrations --check와 같은 기준)
+"""
+
+import json
+import sqlite3
+
+import pytest
+from flask import Flask
+from sqlalchemy import text
+
+from config.database import db
+from config.migrations import (
+    MIGRATIONS, _backfill_note_tags, explain_hot_queries, get_schema_version, run_migrations
+)
+from models.note import Note
+
+
+def test_all_migrations_applied_once(app):
+    with db.engine.connect() as connection:
+        assert get_schema_version(connection) == MIGRATIONS[-1][0]
+    assert run_migrations(db.engine) == []
+
+
+# 마이그레이션 도입 전(베이스라인) 스키마: 인덱스/연결 테이블/미리보기 컬럼/schema_migrations 없음
+PRE_SERIES_SCHEMA = """
+CREATE TABLE notes (
+    id INTEGER NOT NULL PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    content TEXT NOT NULL,
+    tags VARCHAR(500),
+    created_at DATETIME,
+    updated_at DATETIME
+);
+CREATE TABLE chat_history (
+    id INTEGER NOT NULL PRIMARY KEY,
+    note_id INTEGER REFERENCES notes (id),
+    user_message TEXT NOT NULL,
+    ai_response TEXT NOT NULL,
+    model_used VARCHAR(100),
+    created_at DATETIME
+);
+INSERT INTO notes (id, title, content, tags, created_at, updated_at) VALUES
+    (1, '첫 노트', '긴 내용 ' || printf('%.300c', 'x'), '["python", "Python", "db"]', '2024-01-01 00:00:00', '2024-01-01 00:00:00'),
+    (2, '둘째 노트', '짧은 내용', '["db"]', '2024-01-02 00:00:00', '2024-01-02 00:00:00'),
+    (3, '태그 없음', '내용', NULL, '2024-01-03 00:00:00', '2024-01-03 00:00:00');
+INSERT INTO chat_history (note_id, user_message, ai_response, model_used, created_at) VALUES
+    (1, '질문', '답변', 'Claude', '2024-01-04 00:00:00');
+"""
+
+
+def test_pre_series_database_is_upgraded(tmp_path):
+    from config.settings import TestingConfig
+    from config.database import init_db
+
+    db_path = tmp_path / 'legacy.db'
+    legacy = sqlite3.connect(db_path)
+    legacy.executescript(PRE_SERIES_SCHEMA)
+    legacy.close()
+
+    app = Flask(__name__)
+    app.config.from_object(TestingConfig)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{db_path}"
+    init_db(app)
+
+    with app.app_context():
+        with db.engine.connect() as connection:
+            assert get_schema_version(connection) == MIGRATIONS[-1][0]
+            indexes = {row[0] for row in connection.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))}
+            columns = {row[1] for row in connection.execute(text("PRAGMA table_info(notes)"))}
+
+        # v2: 기존 테이블에는 create_all이 인덱스를 만들지 않으므로 마이그레이션이 추가해야 함
+        assert {'ix_notes_created_at_id', 'ix_notes_updated_at',
+                'ix_chat_history_created_at_id', 'ix_chat_history_note_id_created_at',
+                'ix_chat_history_created_hour'} <= indexes
+
+        # v3: 미리보기/내용 길이 컬럼 추가 및 채우기
+        assert {'preview', 'content_length'} <= columns
+        first, second, untagged = (db.session.get(Note, note_id) for note_id in (1, 2, 3))
+        assert first.content_length == len(first.content)
+        assert first.preview and len(first.preview) < len(first.content)
+        assert second.preview == '짧은 내용'
+
+        # v1: JSON 태그 → tags/note_tags
+        assert sorted(tag.name for tag in first.tag_objects) == ['db', 'python']
+        assert first.get_tags() == ['python', 'db']
+        assert [tag.name for tag in second.tag_objects] == ['db']
+        assert untagged.tag_objects == []
+
+        assert run_migrations(db.engine) == []
+
+
+def test_tag_backfill_rewrites_json_to_linked_canonical_names(app):
+    with db.engine.begin() as connection:
+        connection.execute(text("INSERT INTO tags (name) VALUES ('Python')"))
+        connection.execute(text(
+            "INSERT INTO notes (title, content, tags, created_at, updated_at) VALUES "
+            "('a', '내용', :tags_a, '2024-01-01 00:00:00', '2024-01-01 00:00:00'), "
+            "('b', '내용', :tags_b, '2024-01-01 00:00:00', '2024-01-01 00:00:00')"
+        ), {"tags_a": json.dumps(["x", "X", " x "]), "tags_b": json.dumps(["python", "y"])})
+        _backfill_note_tags(connection)
+
+    notes = {note.title: note for note in Note.query.all()}
+    # 대소문자 변형은 처음 연결된 이름 하나로, 이미 있던 태그는 저장된 이름으로
+    assert notes['a'].get_tags() == ['x']
+    assert [tag.name for tag in notes['a'].tag_objects] == ['x']
+    assert notes['b'].get_tags() == ['Python', 'y']
+    assert sorted(tag.name for tag in notes['b'].tag_objects) == ['Python', 'y']
+
+
+def test_hot_queries_use_expected_index_without_temp_sort(app):
+    with db.engine.connect() as connection:
+        results = explain_hot_queries(connection)
+
+    failures = [
+        f"{result['name']}: {result['expected_index']} / {result['plan']}\n{result['sql']}"
+        for result in results
+        if not result["uses_index"] or result["full_scan"] or result["temp_sort"]
+    ]
+    assert not failures, "\n\n".join(failures)
+
+
+def test_hot_queries_are_the_compiled_repository_queries(app):
+    with db.engine.connect() as connection:
+        results = {result["name"]: result["sql"] for result in explain_hot_queries(connection)}
+
+    # find_page 키셋 조건과 LIMIT(한 개 더), 태그 필터 서브쿼리가 그대로 점검 대상
+    page = results["노트 커서 페이지"]
+    assert "(notes.created_at, notes.id) <" in page
+    assert "LIMIT 21" in page
+    assert "note_tags JOIN tags" in results["태그 필터 커서 페이지"]
@@ -0,0 +1,46 @@
+# backend/tests/test_note_cache.py - 노트 캐시 / 버전 일관성
+"""
+다른 워커가 DB를 직접 바꾼 경우(이 프로세스의 캐시는 무효화되지 않음)에도
+캐시가 오래된 본문을 돌려주지 않는지 확인
+"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from config.database import db
+from app.services.note_service import NoteService
+
+
+def update_from_other_worker(note_id, content):
+    """이 프로세스의 레포지토리를 거치지 않는 수정 (캐시 무효화 없음)"""
+    db.session.execute(
+        text("UPDATE notes SET content = :content, updated_at = :updated_at WHERE id = :id"),
+        {"content": content, "updated_at": datetime.utcnow() + timedelta(seconds=1), "id": note_id}
+    )
+    db.session.commit()
+
+
+def test_cached_note_is_dropped_when_updated_at_changes(app):
+    service = NoteService()
+    note = service.create_note('캐시 노트', '처음 내용')
+
+    assert service.get_note_data(note.id)['content'] == '처음 내용'
+    version = service.get_note_version(note.id)
+    assert service.get_note_data(note.id)['content'] == '처음 내용'  # 캐시 적중
+
+    update_from_other_worker(note.id, '다른 워커가 쓴 내용')
+
+    assert service.get_note_version(note.id) != version
+    assert service.get_note_data(note.id)['content'] == '다른 워커가 쓴 내용'
+
+
+def test_note_deleted_elsewhere_is_not_served_from_cache(app):
+    service = NoteService()
+    note_id = service.create_note('지워질 노트', '내용').id
+    service.get_note_data(note_id)
+
+    db.session.execute(text("DELETE FROM notes WHERE id = :id"), {"id": note_id})
+    db.session.commit()
+
+    assert service.repository.find_dict_by_id(note_id) is None
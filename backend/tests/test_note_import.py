@@ -0,0 +1,36 @@
+# backend/tests/test_note_import.py - 노트 일괄 가져오기
+"""
+가져오기 항목의 created_at/updated_at 처리 (DB에는 UTC naive로 저장)
+"""
+
+from datetime import datetime
+
+from config.database import db
+from models.note import Note
+from app.services.note_service import NoteService
+
+
+def test_import_converts_offsets_to_utc(app):
+    service = NoteService()
+    report = service.import_notes([
+        {"title": "서울", "content": "내용", "created_at": "2024-03-01T09:30:00+09:00"},
+        {"title": "Z 표기", "content": "내용", "created_at": "2024-03-01T00:30:00Z"},
+        {"title": "오프셋 없음", "content": "내용", "created_at": "2024-03-01T09:30:00",
+         "updated_at": "2024-03-02T12:00:00-05:00"},
+    ])
+    assert report["imported"] == 3 and report["failed"] == 0
+
+    notes = {note.title: note for note in db.session.query(Note).all()}
+    assert notes["서울"].created_at == datetime(2024, 3, 1, 0, 30)
+    assert notes["Z 표기"].created_at == datetime(2024, 3, 1, 0, 30)
+    # 오프셋이 없으면 이미 UTC로 보고 그대로 저장
+    assert notes["오프셋 없음"].created_at == datetime(2024, 3, 1, 9, 30)
+    assert notes["오프셋 없음"].updated_at == datetime(2024, 3, 2, 17, 0)
+
+
+def test_import_reports_invalid_timestamps(app):
+    report = NoteService().import_notes([
+        {"title": "잘못된 시각", "content": "내용", "created_at": "어제"},
+    ])
+    assert report["imported"] == 0 and report["failed"] == 1
+    assert "created_at" in report["errors"][0]["error"]
@@ -0,0 +1,88 @@
+# backend/tests/test_note_stats.py - 트리거 기반 노트 통계
+"""
+노트 생성/수정/삭제/일괄 작업/가져오기 후 통계 테이블(read_note_stats, read_tag_counts)이
+notes/note_tags를 직접 COUNT/GROUP BY한 결과와 같은지 확인
+"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from config.database import db
+from app.services.note_service import NoteService
+from utils import note_stats
+
+
+def _expected_stats():
+    """notes/note_tags 직접 집계 (read_note_stats와 같은 형태)"""
+    count, total_length, last_created = db.session.execute(text(
+        "SELECT COUNT(*), COALESCE(SUM(length(content)), 0), MAX(created_at) FROM notes"
+    )).one()
+    tag_count = db.session.execute(text("SELECT COUNT(DISTINCT tag_id) FROM note_tags")).scalar()
+
+    since = (datetime.utcnow() - timedelta(days=note_stats.RECENT_DAYS - 1)).date().isoformat()
+    daily = db.session.execute(text(
+        "SELECT date(created_at) AS day, COUNT(*) FROM notes WHERE date(created_at) >= :since "
+        "GROUP BY day ORDER BY day"
+    ), {"since": since}).fetchall()
+
+    last_created = note_stats._parse_datetime(last_created)
+    return {
+        "total_notes": count,
+        "total_tags": tag_count,
+        "last_created": last_created.isoformat() if last_created else None,
+        "recent_notes_count": sum(day_count for _, day_count in daily),
+        "avg_content_length": round(total_length / count, 2) if count else 0,
+        "daily_created": {day: day_count for day, day_count in daily}
+    }
+
+
+def _expected_tag_counts():
+    rows = db.session.execute(text(
+        "SELECT tags.name, COUNT(*) AS note_count FROM note_tags JOIN tags ON tags.id = note_tags.tag_id "
+        "GROUP BY tags.id ORDER BY note_count DESC, tags.name"
+    )).fetchall()
+    return [{"name": name, "count": count} for name, count in rows]
+
+
+def _assert_consistent(step):
+    assert note_stats.read_note_stats(db.session) == _expected_stats(), step
+    assert note_stats.read_tag_counts(db.session) == _expected_tag_counts(), step
+
+
+def test_stats_tables_match_direct_aggregates_after_every_write(app):
+    assert note_stats.is_available()
+    service = NoteService()
+    _assert_consistent("빈 DB")
+
+    first = service.create_note('첫 노트', '파이썬 내용', ['python', 'db']).id
+    second = service.create_note('둘째 노트', '짧음', ['python']).id
+    third = service.create_note('셋째 노트', '태그 없는 내용').id
+    _assert_consistent("생성")
+
+    service.update_note(first, content='조금 더 긴 파이썬 내용', tags=['db', 'flask'])
+    service.update_note(third, tags=['flask'])
+    _assert_consistent("수정")
+
+    service.delete_note(second)
+    _assert_consistent("삭제")
+
+    two_days_ago = (datetime.utcnow() - timedelta(days=2)).isoformat()
+    report = service.import_notes([
+        {"title": "가져온 노트", "content": "오래된 내용", "tags": ["python"], "created_at": "2020-01-01T00:00:00Z"},
+        {"title": "최근 가져온 노트", "content": "최근 내용", "tags": ["db", "go"], "created_at": two_days_ago},
+        {"title": "오늘 가져온 노트", "content": "오늘 내용"},
+    ])
+    assert report["imported"] == 3
+    _assert_consistent("가져오기")
+
+    note_ids = [row[0] for row in db.session.execute(text("SELECT id FROM notes ORDER BY id"))]
+    service.bulk_update('add_tags', note_ids, ['bulk'])
+    _assert_consistent("일괄 태그 추가")
+    service.bulk_update('remove_tags', note_ids[:2], ['bulk', 'db'])
+    _assert_consistent("일괄 태그 제거")
+    service.bulk_update('set_tags', note_ids[1:3], ['go'])
+    _assert_consistent("일괄 태그 지정")
+
+    service.bulk_update('delete', note_ids[:2])
+    _assert_consistent("일괄 삭제")
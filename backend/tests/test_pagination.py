@@ -0,0 +1,101 @@
+# backend/tests/test_pagination.py - 키셋(커서) 페이지네이션
+"""
+created_at이 같은 항목이 여러 페이지에 걸쳐도 id 보조 정렬로 중복/누락 없이 이어지는지,
+마지막 페이지의 has_more/next_cursor와 잘못된 커서의 400 응답 확인
+(블루프린트는 langchain 없이 임포트되지 않으므로 컨트롤러와 같은 방식의 라우트 사용)
+"""
+
+from datetime import datetime
+
+import pytest
+from flask import jsonify, request
+
+from config.database import db
+from models.note import ChatHistory, Note
+from app.services.chat_service import ChatService
+from app.services.note_service import NoteService
+
+SAME_TIME = datetime(2024, 5, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def client(app):
+    note_service = NoteService()
+    chat_service = ChatService()
+
+    # NoteController.get_notes / ChatController.get_chat_history와 같은 커서 처리
+    @app.route('/notes')
+    def get_notes():
+        try:
+            notes, next_cursor = note_service.get_notes_page(
+                limit=request.args.get('limit', type=int), cursor=request.args.get('cursor')
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        return jsonify({"ids": [note.id for note in notes], "next_cursor": next_cursor,
+                        "has_more": next_cursor is not None})
+
+    @app.route('/chat/history')
+    def get_chat_history():
+        try:
+            page = chat_service.get_chat_history_page(
+                limit=request.args.get('limit', 50, type=int), cursor=request.args.get('cursor')
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        return jsonify({"ids": [chat["id"] for chat in page["history"]], "next_cursor": page["next_cursor"],
+                        "has_more": page["has_more"]})
+
+    return app.test_client()
+
+
+def _collect_pages(client, path, limit):
+    """next_cursor를 따라 끝까지 읽기 → (전체 id, 페이지 목록)"""
+    ids, pages, cursor = [], [], None
+    while True:
+        response = client.get(path, query_string={"limit": limit, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        page = response.get_json()
+        pages.append(page)
+        ids.extend(page["ids"])
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            assert cursor is None
+            return ids, pages
+        assert cursor and len(page["ids"]) == limit
+
+
+def _add_rows(model, count, **fields):
+    db.session.add_all(model(created_at=SAME_TIME, **fields) for _ in range(count))
+    # 다른 시각의 행도 섞어서 (created_at, id) 순서 전체를 확인
+    db.session.add(model(created_at=datetime(2024, 4, 1), **fields))
+    db.session.add(model(created_at=datetime(2024, 6, 1), **fields))
+    db.session.commit()
+    return [row.id for row in model.query.order_by(model.created_at.desc(), model.id.desc())]
+
+
+@pytest.mark.parametrize("path, model, fields", [
+    ('/notes', Note, {"title": "같은 시각", "content": "내용"}),
+    ('/chat/history', ChatHistory, {"user_message": "질문", "ai_response": "답변", "model_used": "test"}),
+])
+def test_pages_with_equal_created_at_have_no_duplicates_or_gaps(client, path, model, fields):
+    expected = _add_rows(model, 7, **fields)
+
+    # 9개를 4개씩: 4 / 4 / 1 (마지막 페이지는 has_more=False, next_cursor 없음)
+    ids, pages = _collect_pages(client, path, limit=4)
+    assert ids == expected
+    assert [len(page["ids"]) for page in pages] == [4, 4, 1]
+
+    # 페이지 크기로 정확히 나누어떨어져도 빈 페이지를 한 번 더 요청하게 하지 않음
+    ids, pages = _collect_pages(client, path, limit=3)
+    assert ids == expected
+    assert [len(page["ids"]) for page in pages] == [3, 3, 3]
+    assert pages[-1]["has_more"] is False
+
+
+@pytest.mark.parametrize("path", ['/notes', '/chat/history'])
+@pytest.mark.parametrize("cursor", ['not-a-cursor', 'eyJjIjoxfQ', '!!!'])
+def test_invalid_cursor_returns_400(client, path, cursor):
+    response = client.get(path, query_string={"limit": 5, "cursor": cursor})
+    assert response.status_code == 400
+    assert '커서' in response.get_json()["error"]
@@ -0,0 +1,113 @@
+# backend/tests/test_rag_migration.py - 임베딩 모델 온라인 마이그레이션
+"""
+마이그레이션 도중의 삭제/수정이 새 공간에 반영되는지 확인
+
+faiss/sentence-transformers 없이 돌도록 EmbeddingSpace의 인덱스와 모델 자리에
+NumPy로 만든 가짜 객체를 넣고, RAGChain의 마이그레이션 로직은 그대로 사용한다.
+"""
+
+import sys
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from chains.rag_chain import RAGChain, EmbeddingSpace, EmbeddingMigration
+
+rag_module = sys.modules['chains.rag_chain']
+
+DIMENSION = 4
+
+
+class FakeIndex:
+    """faiss.IndexFlatIP 대역 (add / remove_ids / ntotal만)"""
+
+    def __init__(self):
+        self.vectors = np.zeros((0, DIMENSION), dtype='float32')
+
+    @property
+    def ntotal(self):
+        return len(self.vectors)
+
+    def add(self, vectors):
+        self.vectors = np.vstack([self.vectors, vectors])
+
+    def remove_ids(self, ids):
+        self.vectors = np.delete(self.vectors, ids, axis=0)
+
+
+class GatedModel:
+    """첫 encode 호출을 gate가 열릴 때까지 붙잡는 임베딩 모델"""
+
+    def __init__(self):
+        self.calls = 0
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+
+    def encode(self, texts, batch_size=None):
+        self.calls += 1
+        if self.calls == 1:
+            self.entered.set()
+            assert self.gate.wait(5)
+        return np.ones((len(texts), DIMENSION), dtype='float32')
+
+
+def make_space(tmp_path, model_name, model):
+    space = object.__new__(EmbeddingSpace)
+    space.model_name = model_name
+    space.model = model
+    space.client = None
+    space._remote_retry_at = 0.0
+    space.batcher = None
+    space.dimension = DIMENSION
+    space.index = FakeIndex()
+    space.notes_data = []
+    space.index_file = str(tmp_path / f'{model_name}.index')
+    space.metadata_file = str(tmp_path / f'{model_name}.json')
+    return space
+
+
+@pytest.fixture
+def chain(tmp_path, monkeypatch):
+    monkeypatch.setattr(rag_module, 'faiss', SimpleNamespace(write_index=lambda index, path: None), raising=False)
+
+    source = make_space(tmp_path, 'old-model', SimpleNamespace(
+        encode=lambda texts, batch_size=None: np.ones((len(texts), DIMENSION), dtype='float32')))
+    for note_id in (1, 2, 3, 4):
+        entry = {"note_id": note_id, "title": f"노트 {note_id}", "full_content": f"내용 {note_id}"}
+        source.add_embeddings(np.ones((1, DIMENSION), dtype='float32'), [entry])
+
+    chain = object.__new__(RAGChain)
+    chain.available = True
+    chain._lock = threading.RLock()
+    chain.migration = None
+    chain.space = source
+    chain.state_file = str(tmp_path / 'state.json')
+    return chain
+
+
+def test_deletes_and_updates_during_migration_are_not_resurrected(chain, tmp_path):
+    target_model = GatedModel()
+    target = make_space(tmp_path, 'new-model', target_model)
+    migration = EmbeddingMigration(chain.space, target, batch_size=2)
+    chain.migration = migration
+
+    worker = threading.Thread(target=chain._run_migration, args=(migration,))
+    worker.start()
+    # 첫 배치(노트 1, 2)를 임베딩하는 중
+    assert target_model.entered.wait(5)
+
+    chain.remove_note(1)                        # 임베딩 중인 배치의 노트 삭제
+    chain.remove_notes([4])                     # 아직 대기열에 있는 노트 삭제
+    chain.add_note(2, '노트 2', '수정된 내용')   # 임베딩 중인 노트를 dual-write로 수정
+
+    target_model.gate.set()
+    worker.join(5)
+
+    assert migration.status == 'completed'
+    assert chain.space is target
+    assert target.note_ids() == {2, 3}
+    assert [entry['full_content'] for entry in target.notes_data if entry['note_id'] == 2] == ['수정된 내용']
+    assert target.index.ntotal == len(target.notes_data)
+    assert all(entry['note_id'] != 4 for entry in migration.pending)
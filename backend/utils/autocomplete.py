@@ -0,0 +1,315 @@
+# backend/utils/autocomplete.py - 자동완성 접두사 색인
+"""
+노트 제목/태그/본문 단어 자동완성 (메모리 색인, SQLite 조회 없음)
+
+정렬된 키 배열에서 bisect로 접두사 범위를 찾고, 키마다 참조 수(같은 제목/태그/단어를 가진 노트 수)를
+두어 많이 쓰인 순으로 제안한다. 첫 요청 때 노트를 한 번 읽어 색인을 만들고,
+이후에는 NoteService가 생성/수정/삭제/일괄 작업 때 해당 노트만 증분 반영한다.
+
+- 제목: 단어 시작 위치마다 접미사를 키로 넣어 중간 단어로도 찾는다 ("flask 정리" → "정리"로 검색 가능)
+- 태그: 태그 이름
+- 단어: 본문/제목의 2~30자 단어 (문서 빈도순)
+
+다른 워커에서 쓴 변경은 AUTOCOMPLETE_REFRESH_SECONDS마다 백그라운드 재구성으로 반영된다.
+재구성은 락 밖에서 노트를 읽으므로, 그동안 들어온 증분 반영을 기록해 두었다가
+새 색인으로 교체할 때 같은 락 안에서 순서대로 다시 적용한다 (읽은 뒤 쓴 변경이 사라지지 않음).
+"""
+
+import re
+import time
+import heapq
+import bisect
+import logging
+import threading
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional
+
+from flask import current_app
+
+from utils.json_provider import loads as json_loads
+
+logger = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r'\w{2,30}')
+_TITLE_WORD_START = re.compile(r'(?:^|\s)(?=\S)')
+
+# 접두사 범위에서 순위를 매길 최대 후보 수 (짧은 접두사도 일정한 시간에 응답)
+MAX_SCAN = 256
+
+
+class PrefixIndex:
+    """정렬된 키 배열 + bisect 접두사 검색 (키별 참조 수로 증분 추가/삭제)"""
+
+    def __init__(self):
+        self._keys = []     # 정렬된 소문자 키
+        self._entries = {}  # 키 → [표시 문자열, 참조 수]
+
+    def __len__(self):
+        return len(self._keys)
+
+    def bulk_load(self, items: Iterable[tuple]):
+        """(키, 표시 문자열) 목록으로 한 번에 구성 (정렬 한 번)"""
+        self._entries = {}
+        for key, display in items:
+            entry = self._entries.get(key)
+            if entry:
+                entry[1] += 1
+            else:
+                self._entries[key] = [display, 1]
+        self._keys = sorted(self._entries)
+
+    def add(self, key: str, display: str):
+        entry = self._entries.get(key)
+        if entry:
+            entry[1] += 1
+            return
+        self._entries[key] = [display, 1]
+        bisect.insort(self._keys, key)
+
+    def remove(self, key: str):
+        entry = self._entries.get(key)
+        if not entry:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del self._entries[key]
+        position = bisect.bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    def search(self, prefix: str, limit: int) -> List[str]:
+        """접두사로 시작하는 키의 표시 문자열 (참조 수 많은 순, 같으면 사전순)"""
+        start = bisect.bisect_left(self._keys, prefix)
+        candidates = []
+        for key in islice(self._keys, start, start + MAX_SCAN):
+            if not key.startswith(prefix):
+                break
+            candidates.append(self._entries[key])
+
+        results = []
+        for display, _ in heapq.nlargest(len(candidates), candidates, key=lambda entry: entry[1]):
+            if display not in results:
+                results.append(display)
+                if len(results) >= limit:
+                    break
+        return results
+
+
+def _title_keys(title: str) -> List[str]:
+    """제목 → 단어 시작 위치별 접미사 키 (다른 제목과 겹치지 않도록 전체 제목을 붙임)"""
+    lowered = ' '.join(title.lower().split())
+    return [f"{lowered[match.start():].lstrip()}\x00{lowered}" for match in _TITLE_WORD_START.finditer(lowered)]
+
+
+def _terms(*texts: str) -> set:
+    terms = set()
+    for text in texts:
+        if text:
+            terms.update(word for word in _WORD_PATTERN.findall(text.lower()) if not word.isdigit())
+    return terms
+
+
+def _parse_tags(tags) -> List[str]:
+    if isinstance(tags, list):
+        return [str(tag) for tag in tags]
+    try:
+        return [str(tag) for tag in json_loads(tags)] if tags else []
+    except (ValueError, TypeError):
+        return []
+
+
+class NoteAutocomplete:
+    """제목/태그/단어 자동완성 색인"""
+
+    def __init__(self, refresh_seconds: float = 300.0):
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.RLock()
+        self._notes = {}  # note_id → (title, tags, terms) - 수정/삭제 시 이전 키를 빼기 위해 보관
+        self.titles = PrefixIndex()
+        self.tags = PrefixIndex()
+        self.terms = PrefixIndex()
+        self.built_at = None
+        self._refreshing = False
+        self._replay = None  # 재구성 중에 들어온 증분 반영 [(동작, note_id, 값)] (재구성 중이 아니면 None)
+
+    @property
+    def is_built(self) -> bool:
+        return self.built_at is not None
+
+    @property
+    def accepts_updates(self) -> bool:
+        """증분 반영을 받을지 여부 (색인이 있거나 구성 중)"""
+        return self.is_built or self._replay is not None
+
+    # =========================
+    # 구성 / 증분 반영
+    # =========================
+
+    def build(self, rows: Iterable[tuple]):
+        """(id, title, tags, content) 행으로 전체 재구성"""
+        started = time.perf_counter()
+        notes = {}
+        for note_id, title, tags, content in rows:
+            title = title or ''
+            notes[note_id] = (title, tuple(_parse_tags(tags)), frozenset(_terms(title, content)))
+
+        titles, tags, terms = PrefixIndex(), PrefixIndex(), PrefixIndex()
+        titles.bulk_load((key, title) for title, _, _ in notes.values() for key in _title_keys(title))
+        tags.bulk_load((tag.lower(), tag) for _, note_tags, _ in notes.values() for tag in note_tags)
+        terms.bulk_load((term, term) for _, _, note_terms in notes.values() for term in note_terms)
+
+        with self._lock:
+            self._notes, self.titles, self.tags, self.terms = notes, titles, tags, terms
+            # 노트를 읽기 시작한 뒤 들어온 변경을 새 색인에 다시 적용
+            replay, self._replay = self._replay or [], None
+            for action, note_id, value in replay:
+                self._apply_locked(action, note_id, value)
+            self.built_at = time.time()
+
+        logger.info(f"Autocomplete index built: {len(notes)} notes, {len(terms)} terms "
+                    f"in {(time.perf_counter() - started) * 1000:.1f}ms")
+
+    def _rebuild(self, loader: Callable[[], Iterable[tuple]]):
+        """loader로 전체 재구성 (노트를 읽기 전부터 증분 반영을 기록)"""
+        with self._lock:
+            self._replay = []
+        try:
+            self.build(loader())
+        finally:
+            with self._lock:
+                self._replay = None
+
+    def upsert_note(self, note_id: int, title: str, tags, content: Optional[str]):
+        """노트 하나 추가/교체 (색인이 아직 없으면 무시 - 처음 조회할 때 전체 구성)"""
+        title = title or ''
+        entry = (title, tuple(_parse_tags(tags)), frozenset(_terms(title, content)))
+        self._update('upsert', note_id, entry)
+
+    def update_tags(self, note_id: int, tags):
+        """태그만 바뀐 노트 반영 (제목/단어는 그대로)"""
+        self._update('tags', note_id, tuple(_parse_tags(tags)))
+
+    def remove_notes(self, note_ids: Iterable[int]):
+        for note_id in note_ids:
+            self._update('remove', note_id, None)
+
+    def _update(self, action: str, note_id: int, value):
+        with self._lock:
+            if self._replay is not None:
+                self._replay.append((action, note_id, value))
+            if self.is_built:
+                self._apply_locked(action, note_id, value)
+
+    def _apply_locked(self, action: str, note_id: int, value):
+        if action == 'upsert':
+            self._remove_locked(note_id)
+            self._notes[note_id] = value
+            for key in _title_keys(value[0]):
+                self.titles.add(key, value[0])
+            for tag in value[1]:
+                self.tags.add(tag.lower(), tag)
+            for term in value[2]:
+                self.terms.add(term, term)
+
+        elif action == 'tags':
+            entry = self._notes.get(note_id)
+            if entry is None:
+                return
+            for tag in entry[1]:
+                self.tags.remove(tag.lower())
+            for tag in value:
+                self.tags.add(tag.lower(), tag)
+            self._notes[note_id] = (entry[0], value, entry[2])
+
+        elif action == 'remove':
+            self._remove_locked(note_id)
+
+    def _remove_locked(self, note_id: int):
+        entry = self._notes.pop(note_id, None)
+        if entry is None:
+            return
+        title, tags, terms = entry
+        for key in _title_keys(title):
+            self.titles.remove(key)
+        for tag in tags:
+            self.tags.remove(tag.lower())
+        for term in terms:
+            self.terms.remove(term)
+
+    # =========================
+    # 조회
+    # =========================
+
+    def ensure_built(self, loader: Callable[[], Iterable[tuple]]):
+        """색인이 없으면 loader로 구성, 오래됐으면 백그라운드에서 다시 구성"""
+        if not self.is_built:
+            with self._lock:
+                if not self.is_built:
+                    self._rebuild(loader)
+            return
+
+        with self._lock:
+            if (not self.refresh_seconds or self._refreshing
+                    or time.time() - self.built_at <= self.refresh_seconds):
+                return
+            self._refreshing = True
+        app = current_app._get_current_object()
+        threading.Thread(target=self._refresh, args=(app, loader), name='autocomplete-refresh', daemon=True).start()
+
+    def _refresh(self, app, loader):
+        try:
+            with app.app_context():
+                self._rebuild(loader)
+        except Exception as e:
+            logger.warning(f"⚠️ 자동완성 색인 재구성 실패: {e}")
+            with self._lock:
+                self.built_at = time.time()  # 실패해도 다음 주기까지 재시도하지 않음
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def suggest(self, partial: str, limit: int = 5) -> Dict[str, List[str]]:
+        """접두사 자동완성 (제목/태그/단어 각각 최대 limit개)"""
+        prefix = ' '.join((partial or '').lower().split())
+        if not prefix:
+            return {"titles": [], "tags": [], "keywords": []}
+
+        # 단어 사전은 마지막 단어만으로 찾음 ("flask 캐" → "캐")
+        last_word = prefix.rsplit(' ', 1)[-1]
+        with self._lock:
+            return {
+                "titles": self.titles.search(prefix, limit),
+                "tags": self.tags.search(prefix.lstrip('#'), limit),
+                "keywords": self.terms.search(last_word, limit)
+            }
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                "built": self.is_built,
+                "built_at": self.built_at,
+                "notes": len(self._notes),
+                "title_keys": len(self.titles),
+                "tags": len(self.tags),
+                "terms": len(self.terms)
+            }
+
+
+def load_note_rows(batch_size: int = 500):
+    """색인 구성용 (id, title, tags, content) 행 (ORM 객체 없이 나눠 읽음)"""
+    from config.database import db
+    from models.note import Note
+
+    return db.session.execute(
+        db.select(Note.id, Note.title, Note.tags, Note.content).execution_options(yield_per=batch_size)
+    )
+
+
+def _create_note_autocomplete() -> NoteAutocomplete:
+    from config.settings import Config
+    return NoteAutocomplete(refresh_seconds=Config.AUTOCOMPLETE_REFRESH_SECONDS)
+
+
+# 전역 인스턴스
+note_autocomplete = _create_note_autocomplete()
@@ -0,0 +1,294 @@
+# backend/utils/chat_archive.py - 채팅 기록 보관 정책 / 압축 아카이브
+"""
+채팅 기록 보관(retention)과 월별 압축 아카이브
+
+chat_history에는 최근 기록만 남기고 오래된 기록은 월별 gzip NDJSON 파일로 옮긴다.
+- CHAT_RETENTION_DAYS보다 오래된 기록, 또는 CHAT_RETENTION_MAX_ROWS를 넘는 가장 오래된 기록이 대상
+- 오래된 순으로 CHAT_ARCHIVE_BATCH_SIZE개씩: 월별 파일(chat_YYYY-MM.ndjson.gz)에 gzip 멤버로 덧붙이고
+  fsync한 뒤 DB에서 삭제 (파일 쓰기 → 삭제 순서라 중간에 죽어도 기록이 사라지지 않음)
+- 다시 옮겨져 중복된 줄은 읽을 때 id로 걸러낸다
+- 여러 워커가 동시에 돌리지 않도록 잠금 파일 사용 (POSIX)
+
+내보내기(/api/history/export)와 검색(/api/history/search)은 아카이브도 함께 읽는다.
+아카이브는 항상 DB에 남은 기록보다 오래됐으므로 아카이브 → DB 순으로 이으면 시간순이 유지된다.
+"""
+
+import os
+import gzip
+import time
+import logging
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from config.database import db
+from models.note import ChatHistory
+from utils.json_provider import dumps as json_dumps, dumps_bytes, loads as json_loads
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+FILE_PREFIX = 'chat_'
+FILE_SUFFIX = '.ndjson.gz'
+MANIFEST_NAME = 'manifest.json'
+
+
+class ChatArchive:
+    """월별 gzip NDJSON 채팅 아카이브"""
+
+    def __init__(self, directory: str, retention_days: int = 0, max_rows: int = 0,
+                 batch_size: int = 1000, interval_hours: float = 24):
+        self.directory = Path(directory)
+        self.retention_days = retention_days
+        self.max_rows = max_rows
+        self.batch_size = max(1, batch_size)
+        self.interval_hours = interval_hours
+        self._lock = threading.Lock()
+        self._thread = None
+        self.last_report = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.retention_days > 0 or self.max_rows > 0
+
+    # =========================
+    # 파일 / 매니페스트
+    # =========================
+
+    def _month_path(self, month: str) -> Path:
+        return self.directory / f"{FILE_PREFIX}{month}{FILE_SUFFIX}"
+
+    def months(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[str]:
+        """아카이브된 월(YYYY-MM) 목록 (오래된 순, start/end가 있으면 겹치는 월만)"""
+        if not self.directory.is_dir():
+            return []
+        months = sorted(
+            path.name[len(FILE_PREFIX):-len(FILE_SUFFIX)]
+            for path in self.directory.glob(f"{FILE_PREFIX}*{FILE_SUFFIX}")
+        )
+        if start:
+            months = [month for month in months if month >= start.strftime('%Y-%m')]
+        if end:
+            months = [month for month in months if month <= end.strftime('%Y-%m')]
+        return months
+
+    def _read_manifest(self) -> Dict:
+        try:
+            return json_loads((self.directory / MANIFEST_NAME).read_bytes())
+        except (OSError, ValueError):
+            return {"months": {}, "last_run": None}
+
+    def _write_manifest(self, manifest: Dict):
+        path = self.directory / MANIFEST_NAME
+        temp = path.with_suffix('.tmp')
+        temp.write_bytes(dumps_bytes(manifest, indent=True))
+        os.replace(temp, path)
+
+    # =========================
+    # 보관 정책 적용
+    # =========================
+
+    def apply_retention(self, retention_days: Optional[int] = None, max_rows: Optional[int] = None) -> Dict:
+        """보관 기간/행 수를 넘는 오래된 채팅을 아카이브로 옮기기 (앱 컨텍스트 안에서 호출)
+
+        Args:
+            retention_days / max_rows: 이번 실행에만 쓸 값 (없으면 설정값, 0 = 해당 조건 끔)
+        """
+        retention_days = self.retention_days if retention_days is None else retention_days
+        max_rows = self.max_rows if max_rows is None else max_rows
+        started = time.perf_counter()
+        report = {"archived": 0, "months": [], "remaining": None, "skipped": None,
+                  "retention_days": retention_days, "max_rows": max_rows}
+
+        if retention_days <= 0 and max_rows <= 0:
+            report["skipped"] = "보관 정책이 설정되지 않았습니다"
+            return report
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / '.lock', 'w') as lock_file, self._lock:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    report["skipped"] = "다른 프로세스가 아카이브 중입니다"
+                    return report
+
+            # 옮길 개수: 기간이 지난 행 수와 행 수 초과분 중 큰 쪽 (둘 다 가장 오래된 행부터)
+            total = ChatHistory.query.count()
+            target = max(total - max_rows, 0) if max_rows > 0 else 0
+            if retention_days > 0:
+                cutoff = datetime.utcnow() - timedelta(days=retention_days)
+                target = max(target, ChatHistory.query.filter(ChatHistory.created_at < cutoff).count())
+
+            manifest = self._read_manifest()
+            months = set()
+            while report["archived"] < target:
+                chats = ChatHistory.query.order_by(
+                    ChatHistory.created_at.asc(), ChatHistory.id.asc()
+                ).limit(min(self.batch_size, target - report["archived"])).all()
+                if not chats:
+                    break
+                for month, count, size in self._append(chats):
+                    entry = manifest["months"].setdefault(month, {"records": 0})
+                    entry["records"] += count
+                    entry["bytes"] = size
+                    months.add(month)
+
+                ids = [chat.id for chat in chats]
+                try:
+                    ChatHistory.query.filter(ChatHistory.id.in_(ids)).delete(synchronize_session=False)
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
+                    raise
+                report["archived"] += len(ids)
+
+            manifest["last_run"] = datetime.now().isoformat()
+            self._write_manifest(manifest)
+
+        report["months"] = sorted(months)
+        report["remaining"] = total - report["archived"]
+        report["seconds"] = round(time.perf_counter() - started, 3)
+        self.last_report = report
+        if report["archived"]:
+            logger.info(f"Archived {report['archived']} chats into {len(months)} monthly files")
+        return report
+
+    def _append(self, chats: List[ChatHistory]):
+        """채팅 묶음을 월별 파일에 gzip 멤버 하나씩 덧붙이기 → [(월, 개수, 파일 크기)]"""
+        by_month = {}
+        for chat in chats:
+            month = (chat.created_at or datetime.utcnow()).strftime('%Y-%m')
+            by_month.setdefault(month, []).append(json_dumps(chat.to_dict()))
+
+        written = []
+        for month, lines in by_month.items():
+            member = gzip.compress(('\n'.join(lines) + '\n').encode('utf-8'))
+            path = self._month_path(month)
+            with open(path, 'ab') as handle:
+                handle.write(member)
+                handle.flush()
+                os.fsync(handle.fileno())
+            written.append((month, len(lines), path.stat().st_size))
+        return written
+
+    # =========================
+    # 읽기
+    # =========================
+
+    def _iter_month(self, month: str, seen: set) -> Iterator[Dict]:
+        try:
+            with gzip.open(self._month_path(month), 'rt', encoding='utf-8') as handle:
+                for line in handle:
+                    try:
+                        record = json_loads(line)
+                    except ValueError:
+                        continue
+                    if record.get("id") in seen:
+                        continue
+                    seen.add(record.get("id"))
+                    yield record
+        except (OSError, EOFError) as e:
+            # 쓰는 도중 잘린 마지막 멤버 등: 읽은 데까지만 사용
+            logger.warning(f"⚠️ 채팅 아카이브 {month} 읽기 중단: {e}")
+
+    def iter_records(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> Iterator[Dict]:
+        """아카이브된 채팅 기록 (오래된 순, created_at이 start~end인 것만)"""
+        start_key = start.isoformat() if start else None
+        end_key = end.isoformat() if end else None
+        for month in self.months(start, end):
+            for record in self._iter_month(month, set()):
+                created = record.get("created_at") or ''
+                if start_key and created < start_key:
+                    continue
+                if end_key and created > end_key:
+                    continue
+                yield record
+
+    def search(self, query: str, limit: int) -> List[Dict]:
+        """사용자 메시지/AI 응답에 검색어가 들어 있는 아카이브 기록 (최신순, 대소문자 무시)"""
+        needle = query.strip().lower()
+        results = []
+        for month in reversed(self.months()):
+            matches = [
+                record for record in self._iter_month(month, set())
+                if needle in (record.get("user_message") or '').lower()
+                or needle in (record.get("ai_response") or '').lower()
+            ]
+            matches.sort(key=lambda record: (record.get("created_at") or '', record.get("id") or 0), reverse=True)
+            results.extend(matches[:limit - len(results)])
+            if len(results) >= limit:
+                break
+        return results
+
+    def clear(self) -> int:
+        """아카이브 파일 모두 삭제 → 삭제한 기록 수 (매니페스트 기준)"""
+        manifest = self._read_manifest()
+        for month in self.months():
+            self._month_path(month).unlink(missing_ok=True)
+        (self.directory / MANIFEST_NAME).unlink(missing_ok=True)
+        return sum(entry.get("records", 0) for entry in manifest["months"].values())
+
+    def get_stats(self) -> Dict:
+        manifest = self._read_manifest()
+        months = manifest["months"]
+        return {
+            "enabled": self.enabled,
+            "retention_days": self.retention_days,
+            "max_rows": self.max_rows,
+            "directory": str(self.directory),
+            "archived_records": sum(entry.get("records", 0) for entry in months.values()),
+            "archive_bytes": sum(entry.get("bytes", 0) for entry in months.values()),
+            "months": months,
+            "last_run": manifest.get("last_run"),
+            "last_report": self.last_report
+        }
+
+    # =========================
+    # 주기 실행
+    # =========================
+
+    def start(self, app):
+        """보관 정책이 있으면 CHAT_ARCHIVE_INTERVAL_HOURS마다 백그라운드에서 적용"""
+        if not self.enabled or self.interval_hours <= 0 or self._thread is not None:
+            return
+
+        def run():
+            while True:
+                try:
+                    with app.app_context():
+                        self.apply_retention()
+                except Exception as e:
+                    logger.error(f"❌ 채팅 아카이브 실패: {e}")
+                time.sleep(self.interval_hours * 3600)
+
+        self._thread = threading.Thread(target=run, name='chat-archive', daemon=True)
+        self._thread.start()
+        print(f"✅ 채팅 보관 정책: {self.retention_days or '-'}일 / 최대 {self.max_rows or '-'}행 "
+              f"({self.interval_hours}시간마다 아카이브)")
+
+
+def init_chat_archive(app):
+    """보관 정책이 설정돼 있으면 주기적 아카이브 시작 (init_db 이후 호출)"""
+    chat_archive.start(app)
+    return chat_archive
+
+
+def _create_chat_archive() -> ChatArchive:
+    from config.settings import Config
+    return ChatArchive(
+        directory=Config.CHAT_ARCHIVE_DIR,
+        retention_days=Config.CHAT_RETENTION_DAYS,
+        max_rows=Config.CHAT_RETENTION_MAX_ROWS,
+        batch_size=Config.CHAT_ARCHIVE_BATCH_SIZE,
+        interval_hours=Config.CHAT_ARCHIVE_INTERVAL_HOURS
+    )
+
+
+# 전역 인스턴스
+chat_archive = _create_chat_archive()
@@ -0,0 +1,317 @@
+# backend/utils/chat_writer.py - 채팅 기록 지연 저장 (write-behind)
+"""
+채팅 기록 write-behind 버퍼
+
+CHAT_WRITE_BEHIND를 켜면 ChatService가 채팅마다 add + commit 하는 대신 이 버퍼에 넣고,
+백그라운드 스레드가 CHAT_WRITE_BEHIND_INTERVAL_MS마다(또는 CHAT_WRITE_BEHIND_BATCH_SIZE개가 모이면)
+한 트랜잭션으로 묶어 저장한다. SQLite 쓰기 잠금/fsync가 채팅 N개당 한 번으로 줄어든다.
+
+유실 방지:
+- 버퍼에 넣기 전에 프로세스별 추가 전용 파일(spill)에 한 줄씩 기록한다 (CHAT_WRITE_BEHIND_FSYNC면 fsync까지)
+- 저장이 끝날 때마다 파일을 아직 저장되지 않은 기록만 남도록 다시 쓴다 (계속 쓰기가 들어와도 파일이 커지지 않음).
+  임시 파일에 쓰고 잠근 뒤 교체하므로 중간에 죽어도 저장 안 된 기록은 어느 한쪽 파일에 남는다.
+  저장에 실패하면 버퍼에 되돌려 다음 주기에 다시 시도한다
+- 시작할 때 남아 있는 spill 파일(다른 프로세스가 잡고 있지 않은 것)을 DB로 옮긴다.
+  이미 저장된 줄(저장 직후 정리 전에 죽은 경우)은 created_at + 사용자 메시지로 걸러낸다 (파일당 조회 한 번)
+- 종료(atexit) 시 남은 기록을 저장한다
+
+버퍼에 있는 동안(최대 한 주기)은 히스토리 조회에 보이지 않는다.
+조회: GET /api/system/debug/chat-writer
+"""
+
+import os
+import glob
+import atexit
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from config.database import db
+from models.note import ChatHistory
+from utils.json_provider import dumps as json_dumps, loads as json_loads
+
+try:
+    import fcntl  # 여러 워커가 서로의 spill 파일을 복구하지 않도록 잠금 (POSIX)
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+def _try_lock(handle) -> bool:
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+class ChatWriteBuffer:
+    """채팅 기록 write-behind 버퍼 (spill 파일 + 주기적 일괄 저장)"""
+
+    def __init__(self, enabled: bool, spill_path: str, batch_size: int = 100,
+                 interval_ms: float = 200, fsync: bool = False):
+        self.enabled = enabled
+        self.spill_path = Path(spill_path)
+        self.batch_size = max(1, batch_size)
+        self.interval = max(interval_ms, 1) / 1000
+        self.fsync = fsync
+
+        self._app = None
+        self._lock = threading.Lock()          # 버퍼/spill 파일
+        self._flush_lock = threading.Lock()    # 저장은 한 번에 하나씩
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._spill = None
+        self._live_path = None
+        self._pending: List[Dict] = []
+        self._flush_listeners: List[Callable] = []
+
+        self.enqueued = 0
+        self.flushed = 0
+        self.batches = 0
+        self.failures = 0
+        self.recovered = 0
+        self.last_flush_ms = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def add_flush_listener(self, listener: Callable):
+        """저장이 끝날 때마다 호출할 함수 (통계 캐시 무효화 등)"""
+        self._flush_listeners.append(listener)
+
+    # =========================
+    # 시작 / 종료
+    # =========================
+
+    def start(self, app):
+        """spill 파일 복구 후 프로세스별 spill 파일을 열고 저장 스레드 시작"""
+        if not self.enabled or self.running:
+            return
+        self._app = app
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._live_path = self.spill_path.with_name(f"{self.spill_path.stem}.{os.getpid()}{self.spill_path.suffix}")
+        with app.app_context():
+            self.recovered = self._recover(exclude=self._live_path)
+
+        self._spill = open(self._live_path, 'a', encoding='utf-8')
+        _try_lock(self._spill)
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name='chat-write-behind', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+        print(f"✅ 채팅 기록 지연 저장: {self.batch_size}개 / {self.interval * 1000:.0f}ms 단위 "
+              f"(복구 {self.recovered}개)")
+
+    def close(self):
+        """저장 스레드를 멈추고 남은 기록 저장 (종료 시 atexit로 호출)"""
+        if not self.running:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        self._thread.join(timeout=10)
+        self.flush()
+        with self._lock:
+            if self._spill and not self._pending:
+                self._spill.close()
+                os.remove(self._live_path)
+                self._spill = None
+
+    # =========================
+    # 기록 / 저장
+    # =========================
+
+    def enqueue(self, user_message: str, ai_response: str, model_used: str, note_id: Optional[int] = None):
+        """채팅 기록 하나를 spill 파일에 쓰고 버퍼에 추가"""
+        record = {
+            "user_message": user_message,
+            "ai_response": ai_response,
+            "model_used": model_used,
+            "note_id": note_id,
+            "created_at": datetime.utcnow().isoformat()
+        }
+        line = json_dumps(record) + '\n'
+        with self._lock:
+            self._spill.write(line)
+            self._spill.flush()
+            if self.fsync:
+                os.fsync(self._spill.fileno())
+            self._pending.append(record)
+            self.enqueued += 1
+            if len(self._pending) >= self.batch_size:
+                self._wakeup.set()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"❌ 채팅 기록 저장 스레드 오류: {e}")
+
+    def flush(self) -> int:
+        """버퍼의 기록을 한 트랜잭션으로 저장 → 저장한 개수"""
+        if not self.enabled or self._app is None:
+            return 0
+
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+
+            started = datetime.now()
+            try:
+                with self._app.app_context():
+                    self._insert(batch)
+            except Exception as e:
+                # 다음 주기에 다시 시도 (spill 파일에도 그대로 남아 있음)
+                with self._lock:
+                    self._pending[:0] = batch
+                    self.failures += 1
+                logger.error(f"❌ 채팅 기록 {len(batch)}개 저장 실패: {e}")
+                return 0
+
+            with self._lock:
+                # spill 파일에는 저장하는 동안 새로 들어온 기록만 남김
+                if self._spill:
+                    try:
+                        self._compact_spill()
+                    except OSError as e:
+                        # 다음 저장 때 다시 정리 (이미 저장된 줄은 복구 시 걸러짐)
+                        logger.warning(f"⚠️ 채팅 spill 파일 정리 실패: {e}")
+                self.flushed += len(batch)
+                self.batches += 1
+                self.last_flush_ms = round((datetime.now() - started).total_seconds() * 1000, 2)
+
+        for listener in self._flush_listeners:
+            listener()
+        return len(batch)
+
+    def _compact_spill(self):
+        """spill 파일을 아직 버퍼에 있는 기록만으로 교체 (self._lock 안에서 호출)"""
+        if not self._pending:
+            self._spill.seek(0)
+            self._spill.truncate()
+            return
+
+        path = self._live_path
+        temp = open(path.with_name(path.name + '.tmp'), 'w', encoding='utf-8')
+        try:
+            _try_lock(temp)
+            temp.writelines(json_dumps(record) + '\n' for record in self._pending)
+            temp.flush()
+            if self.fsync:
+                os.fsync(temp.fileno())
+            os.replace(temp.name, path)
+        except OSError:
+            temp.close()
+            os.remove(temp.name)
+            raise
+
+        # 이후 enqueue는 교체된 파일 끝에 이어 쓴다
+        self._spill.close()
+        self._spill = temp
+
+    @staticmethod
+    def _insert(records: List[Dict]):
+        rows = [{**record, "created_at": datetime.fromisoformat(record["created_at"])} for record in records]
+        try:
+            db.session.execute(insert(ChatHistory), rows)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+    def _recover(self, exclude: Path) -> int:
+        """이전 실행(또는 죽은 워커)이 남긴 spill 파일을 DB로 옮기기"""
+        pattern = str(self.spill_path.with_name(f"{self.spill_path.stem}.*{self.spill_path.suffix}"))
+        recovered = 0
+        for path in sorted(glob.glob(pattern)):
+            if Path(path) == exclude:
+                continue
+            with open(path, 'r+', encoding='utf-8') as handle:
+                if not _try_lock(handle):
+                    continue  # 살아 있는 다른 워커의 파일
+
+                records = []
+                for line in handle:
+                    try:
+                        records.append(json_loads(line))
+                    except ValueError:
+                        continue  # 쓰는 도중에 죽어 잘린 마지막 줄
+
+                saved = self._saved_keys(records)
+                records = [record for record in records
+                           if (datetime.fromisoformat(record["created_at"]), record["user_message"]) not in saved]
+                if records:
+                    self._insert(records)
+                    recovered += len(records)
+                os.remove(path)
+                # 정리 도중 죽어 남은 임시 파일 (원본에 같은 기록이 모두 있었음)
+                Path(f"{path}.tmp").unlink(missing_ok=True)
+
+        if recovered:
+            logger.info(f"Recovered {recovered} buffered chat records from spill files")
+        return recovered
+
+    @staticmethod
+    def _saved_keys(records: List[Dict]) -> set:
+        """spill 기록의 시각 범위에 이미 저장된 (created_at, 사용자 메시지) - 조회 한 번"""
+        if not records:
+            return set()
+        times = [datetime.fromisoformat(record["created_at"]) for record in records]
+        rows = db.session.query(ChatHistory.created_at, ChatHistory.user_message).filter(
+            ChatHistory.created_at.between(min(times), max(times))
+        ).all()
+        return {(created_at, user_message) for created_at, user_message in rows}
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "enabled": self.enabled,
+            "running": self.running,
+            "pending": pending,
+            "enqueued": self.enqueued,
+            "flushed": self.flushed,
+            "batches": self.batches,
+            "failures": self.failures,
+            "recovered": self.recovered,
+            "last_flush_ms": self.last_flush_ms,
+            "batch_size": self.batch_size,
+            "interval_ms": self.interval * 1000,
+            "spill_file": str(self._live_path) if self._spill else None
+        }
+
+
+def init_chat_writer(app):
+    """CHAT_WRITE_BEHIND가 켜져 있으면 지연 저장 시작 (init_db 이후 호출)"""
+    chat_writer.start(app)
+    return chat_writer
+
+
+def _create_chat_writer() -> ChatWriteBuffer:
+    from config.settings import Config
+    return ChatWriteBuffer(
+        enabled=Config.CHAT_WRITE_BEHIND,
+        spill_path=Config.CHAT_WRITE_BEHIND_SPILL_PATH,
+        batch_size=Config.CHAT_WRITE_BEHIND_BATCH_SIZE,
+        interval_ms=Config.CHAT_WRITE_BEHIND_INTERVAL_MS,
+        fsync=Config.CHAT_WRITE_BEHIND_FSYNC
+    )
+
+
+# 전역 인스턴스
+chat_writer = _create_chat_writer()
@@ -3,7 +3,7 @@
 날짜/시간 관련 유틸리티 함수들
 """
 
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Optional, List, Dict
 import re
 
@@ -159,27 +159,8 @@ def group_by_date(items: List[Dict], date_field: str = 'created_at') -> Dict[str
 
 
 def get_activity_stats(notes: List[Dict]) -> Dict:
-    """노트 작성 활동 통계"""
-    if not notes:
-        return {
-            "total_notes": 0,
-            "notes_today": 0,
-            "notes_this_week": 0,
-            "notes_this_month": 0,
-            "daily_average": 0,
-            "most_active_day": None
-        }
-    
-    now = datetime.now()
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    week_start, _ = get_date_range('this_week')
-    month_start, _ = get_date_range('this_month')
-    
-    notes_today = 0
-    notes_this_week = 0
-    notes_this_month = 0
+    """노트 작성 활동 통계 (노트 목록 → 일별 생성 수로 모은 뒤 summarize_daily_counts)"""
     daily_counts = {}
-    
     for note in notes:
         created_at = note.get('created_at')
         if isinstance(created_at, str):
@@ -188,23 +169,38 @@ def get_activity_stats(notes: List[Dict]) -> Dict:
         if not isinstance(created_at, datetime):
             continue
         
-        # 오늘 작성된 노트
-        if created_at >= today_start:
-            notes_today += 1
-        
-        # 이번 주 작성된 노트
-        if created_at >= week_start:
-            notes_this_week += 1
-        
-        # 이번 달 작성된 노트
-        if created_at >= month_start:
-            notes_this_month += 1
-        
-        # 일별 카운트
         date_key = created_at.strftime('%Y-%m-%d')
         daily_counts[date_key] = daily_counts.get(date_key, 0) + 1
     
-    # 가장 활발했던 날
+    return summarize_daily_counts(daily_counts)
+
+
+def summarize_daily_counts(daily_counts: Dict[str, int], today: Optional[date] = None) -> Dict:
+    """일별 생성 수({YYYY-MM-DD: 개수}) → 활동 통계
+
+    날짜 키는 ISO 형식이라 문자열 비교만으로 기간을 나눈다 (날짜 파싱 없음).
+    일별 버킷은 UTC 날짜이므로 오늘/이번 주/이번 달도 UTC 기준으로 센다.
+    daily_average는 최근 30일 중 노트를 쓴 날의 하루 평균이다.
+    """
+    today = today or datetime.utcnow().date()
+    today_key = today.isoformat()
+    week_key = (today - timedelta(days=today.weekday())).isoformat()
+    month_key = today.replace(day=1).isoformat()
+    recent_key = (today - timedelta(days=30)).isoformat()
+    
+    notes_today = notes_this_week = notes_this_month = 0
+    recent_total = recent_days = 0
+    for day, count in daily_counts.items():
+        if day >= today_key:
+            notes_today += count
+        if day >= week_key:
+            notes_this_week += count
+        if day >= month_key:
+            notes_this_month += count
+        if day >= recent_key:
+            recent_total += count
+            recent_days += 1
+    
     most_active_day = None
     if daily_counts:
         most_active_date = max(daily_counts, key=daily_counts.get)
@@ -213,22 +209,46 @@ def get_activity_stats(notes: List[Dict]) -> Dict:
             "count": daily_counts[most_active_date]
         }
     
-    # 일평균 계산 (최근 30일 기준)
-    recent_days = len([d for d in daily_counts.keys() 
-                      if parse_date_string(d) and parse_date_string(d) >= now - timedelta(days=30)])
-    daily_average = round(sum(daily_counts.values()) / max(recent_days, 1), 1)
-    
     return {
-        "total_notes": len(notes),
+        "total_notes": sum(daily_counts.values()),
         "notes_today": notes_today,
         "notes_this_week": notes_this_week,
         "notes_this_month": notes_this_month,
-        "daily_average": daily_average,
+        "daily_average": round(recent_total / max(recent_days, 1), 1),
         "most_active_day": most_active_day,
         "daily_counts": daily_counts
     }
 
 
+def build_heatmap(daily_counts: Dict[str, int], start: date, end: date) -> Dict:
+    """달력 히트맵 데이터 (start~end 하루 한 칸의 개수 배열)
+
+    counts[i]는 start + i일의 개수, first_weekday는 start의 요일(월=0)이라
+    클라이언트가 주 단위 열로 바로 배치할 수 있다.
+    thresholds는 노트를 쓴 날 개수의 사분위수(1~4단계 색 구분용)이다.
+    """
+    days = (end - start).days + 1
+    counts = [0] * max(days, 0)
+    for day, count in daily_counts.items():
+        offset = (date.fromisoformat(day) - start).days
+        if 0 <= offset < days:
+            counts[offset] = count
+    
+    active = sorted(count for count in counts if count > 0)
+    thresholds = [active[len(active) * q // 4] for q in (1, 2, 3)] if active else []
+    
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "first_weekday": start.weekday(),
+        "counts": counts,
+        "total": sum(counts),
+        "max": active[-1] if active else 0,
+        "active_days": len(active),
+        "thresholds": thresholds
+    }
+
+
 def validate_date_range(start_date: str, end_date: str) -> tuple:
     """날짜 범위 유효성 검사"""
     start_dt = parse_date_string(start_date)
@@ -0,0 +1,112 @@
+# backend/utils/embedding_batcher.py - 임베딩 마이크로 배치 스케줄러
+"""
+동시 임베딩 요청 배치 처리
+
+RAGChain(워커 프로세스 내부)과 임베딩 서버(별도 프로세스)가 함께 사용
+"""
+
+import time
+import queue
+import threading
+import numpy as np
+from concurrent.futures import Future
+from typing import List, Dict
+
+
+class EmbeddingBatcher:
+    """동시 임베딩 요청을 모아 한 번의 배치 추론으로 처리하는 스케줄러
+
+    요청이 들어오면 최대 max_wait_ms 동안 또는 max_batch_size개가 찰 때까지
+    다른 요청을 기다렸다가 한 번에 encode하고, 결과를 각 호출자에게 나눠준다.
+    """
+
+    def __init__(self, encode_fn, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        self._encode_fn = encode_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self._inflight = 0  # 결과를 기다리는 호출자 수
+
+        self.total_requests = 0
+        self.total_batches = 0
+        self.largest_batch = 0
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """배치에 합류해서 임베딩 결과를 기다림"""
+        future = Future()
+        self._ensure_worker()
+
+        with self._worker_lock:
+            self._inflight += 1
+        try:
+            self._queue.put((list(texts), future))
+            return future.result()
+        finally:
+            with self._worker_lock:
+                self._inflight -= 1
+
+    def _ensure_worker(self):
+        """워커 스레드는 첫 요청 시점에 시작 (fork 이후 프로세스에서도 동작)"""
+        if self._worker and self._worker.is_alive():
+            return
+
+        with self._worker_lock:
+            if self._worker and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._run, name='rag-embedding-batcher', daemon=True)
+            self._worker.start()
+
+    def _collect_batch(self) -> List:
+        """첫 요청 이후 대기 시간/배치 크기 한도까지 요청 수집"""
+        pending = [self._queue.get()]
+        count = len(pending[0][0])
+        deadline = time.monotonic() + self.max_wait
+
+        # 기다리는 호출자가 모두 모였으면 대기 없이 바로 처리 (단독 요청은 지연 없음)
+        while count < self.max_batch_size and len(pending) < self._inflight:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            pending.append(item)
+            count += len(item[0])
+
+        return pending
+
+    def _run(self):
+        while True:
+            pending = self._collect_batch()
+            texts = [text for item_texts, _ in pending for text in item_texts]
+
+            try:
+                embeddings = self._encode_fn(texts)
+            except Exception as e:
+                for _, future in pending:
+                    future.set_exception(e)
+                continue
+
+            self.total_requests += len(pending)
+            self.total_batches += 1
+            self.largest_batch = max(self.largest_batch, len(texts))
+
+            offset = 0
+            for item_texts, future in pending:
+                future.set_result(embeddings[offset:offset + len(item_texts)])
+                offset += len(item_texts)
+
+    def get_stats(self) -> Dict:
+        """배치 처리 통계"""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000.0,
+            "requests": self.total_requests,
+            "batches": self.total_batches,
+            "avg_batch_size": round(self.total_requests / self.total_batches, 2) if self.total_batches else 0,
+            "largest_batch": self.largest_batch
+        }
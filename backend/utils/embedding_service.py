@@ -0,0 +1,295 @@
+# backend/utils/embedding_service.py - 공유 임베딩 서버
+"""
+프로세스 외부 임베딩 서비스 (Unix 소켓)
+
+WSGI 워커마다 SentenceTransformer/torch를 올리는 대신, 별도 프로세스 하나가
+모델을 소유하고 모든 워커의 요청을 배치로 처리한다.
+
+실행: cd backend && python -m utils.embedding_service --socket /tmp/ai-note-embed.sock
+
+프로토콜 (모든 메시지는 길이 접두 프레임: !I 본문 길이 + 본문)
+- 요청 본문: !B op, !I 개수, 이후 각 텍스트마다 !I 길이 + UTF-8 바이트
+- 응답 본문: !B 상태 (0=성공, 1=오류) + 내용
+  - OP_ENCODE 성공: !I 행 수, !I 차원 + float32(리틀엔디안) 행렬
+  - OP_INFO 성공: !I 차원 + UTF-8 모델 이름
+  - 오류: UTF-8 오류 메시지
+"""
+
+import os
+import socket
+import struct
+import argparse
+import threading
+import socketserver
+import numpy as np
+from typing import List, Dict, Optional
+
+from utils.embedding_batcher import EmbeddingBatcher
+
+OP_ENCODE = 1
+OP_INFO = 2
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+_FRAME_HEADER = struct.Struct('!I')
+_REQUEST_HEADER = struct.Struct('!BI')
+_MATRIX_HEADER = struct.Struct('!II')
+_MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+
+class EmbeddingServiceUnavailable(ConnectionError):
+    """임베딩 서버에 연결할 수 없거나 응답이 올바르지 않음"""
+
+
+# =========================
+# 프레임 입출력
+# =========================
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """정확히 size 바이트 수신"""
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(remaining)
+        if not chunk:
+            raise EOFError("연결이 종료되었습니다")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_frame(sock: socket.socket) -> bytes:
+    """길이 접두 프레임 하나 수신"""
+    (length,) = _FRAME_HEADER.unpack(_recv_exact(sock, _FRAME_HEADER.size))
+    if length > _MAX_FRAME_SIZE:
+        raise ValueError(f"프레임 크기 초과: {length} bytes")
+    return _recv_exact(sock, length)
+
+
+def send_frame(sock: socket.socket, body: bytes):
+    """길이 접두 프레임 하나 전송"""
+    sock.sendall(_FRAME_HEADER.pack(len(body)) + body)
+
+
+def encode_request(op: int, texts: List[str] = ()) -> bytes:
+    """요청 본문 직렬화"""
+    parts = [_REQUEST_HEADER.pack(op, len(texts))]
+    for text in texts:
+        data = text.encode('utf-8')
+        parts.append(_FRAME_HEADER.pack(len(data)))
+        parts.append(data)
+    return b''.join(parts)
+
+
+def decode_request(body: bytes) -> tuple:
+    """요청 본문 역직렬화 → (op, texts)"""
+    op, count = _REQUEST_HEADER.unpack_from(body, 0)
+    offset = _REQUEST_HEADER.size
+    texts = []
+    for _ in range(count):
+        (length,) = _FRAME_HEADER.unpack_from(body, offset)
+        offset += _FRAME_HEADER.size
+        texts.append(body[offset:offset + length].decode('utf-8'))
+        offset += length
+    return op, texts
+
+
+# =========================
+# 서버
+# =========================
+
+class EmbeddingServer:
+    """모델을 소유하고 모든 워커의 임베딩 요청을 배치 처리하는 서버"""
+
+    def __init__(self, socket_path: str, model_name: str, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        from sentence_transformers import SentenceTransformer
+
+        self.socket_path = socket_path
+        self.model_name = model_name
+        self.model = SentenceTransformer(model_name)
+        self.dimension = self.model.get_sentence_embedding_dimension()
+
+        # 여러 워커에서 동시에 들어온 요청을 한 번의 forward pass로 처리
+        self.batcher = EmbeddingBatcher(
+            lambda texts: np.asarray(self.model.encode(texts, batch_size=max(len(texts), 1)), dtype='float32'),
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms
+        )
+        self._server = None
+
+    def handle(self, body: bytes) -> bytes:
+        """요청 본문 하나 처리 → 응답 본문"""
+        try:
+            op, texts = decode_request(body)
+
+            if op == OP_ENCODE:
+                embeddings = self.batcher.encode(texts) if texts else np.zeros((0, self.dimension), dtype='float32')
+                embeddings = np.ascontiguousarray(embeddings, dtype='<f4')
+                rows, dim = embeddings.shape
+                return bytes([STATUS_OK]) + _MATRIX_HEADER.pack(rows, dim) + embeddings.tobytes()
+
+            if op == OP_INFO:
+                return bytes([STATUS_OK]) + _FRAME_HEADER.pack(self.dimension) + self.model_name.encode('utf-8')
+
+            raise ValueError(f"알 수 없는 op: {op}")
+
+        except Exception as e:
+            return bytes([STATUS_ERROR]) + str(e).encode('utf-8')
+
+    def serve_forever(self):
+        """Unix 소켓에서 요청 대기 (연결마다 스레드, 연결은 재사용됨)"""
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+        server = self
+
+        class _Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                while True:
+                    try:
+                        body = recv_frame(self.request)
+                    except (EOFError, ConnectionError, ValueError):
+                        return
+                    send_frame(self.request, server.handle(body))
+
+        self._server = socketserver.ThreadingUnixStreamServer(self.socket_path, _Handler)
+        self._server.daemon_threads = True
+        os.chmod(self.socket_path, 0o660)
+
+        print(f"✅ 임베딩 서버 시작: {self.socket_path} (모델: {self.model_name}, 차원: {self.dimension})")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    def shutdown(self):
+        """서버 종료"""
+        if self._server:
+            self._server.shutdown()
+
+
+# =========================
+# 클라이언트 (연결 풀)
+# =========================
+
+class RemoteEmbeddingClient:
+    """임베딩 서버 클라이언트 - 연결을 풀에 보관해서 재사용
+
+    풀에 있던 연결이 서버 재시작 등으로 끊겨 있으면 닫고 새 연결로 한 번만 다시 보낸다.
+    large_batch개 이상을 임베딩하는 요청(마이그레이션/일괄 색인)은 batch_timeout으로 응답을 기다린다.
+    """
+
+    def __init__(self, socket_path: str, pool_size: int = 4, timeout: float = 5.0,
+                 batch_timeout: float = 60.0, large_batch: int = 32):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.batch_timeout = max(batch_timeout, timeout)
+        self.large_batch = max(1, large_batch)
+        self._slots = threading.BoundedSemaphore(max(1, pool_size))
+        self._idle = []
+        self._idle_lock = threading.Lock()
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _request(self, body: bytes, read_timeout: Optional[float] = None) -> bytes:
+        """요청 하나를 보내고 응답 본문(상태 바이트 제외) 반환"""
+        if not self._slots.acquire(timeout=self.timeout):
+            raise EmbeddingServiceUnavailable("임베딩 서버 연결 풀 대기 시간 초과")
+
+        try:
+            with self._idle_lock:
+                sock = self._idle.pop() if self._idle else None
+
+            try:
+                response = self._exchange(sock, body, read_timeout)
+            except (OSError, EOFError) as e:
+                # 풀에서 꺼낸 연결이 끊겨 있던 경우만 새 연결로 한 번 재시도
+                # (시간 초과는 서버가 느린 것이라 다시 보내도 같으므로 제외)
+                if sock is None or isinstance(e, socket.timeout):
+                    raise
+                response = self._exchange(None, body, read_timeout)
+
+        except (OSError, EOFError, ValueError, struct.error) as e:
+            raise EmbeddingServiceUnavailable(f"임베딩 서버 통신 실패: {e}") from e
+        finally:
+            self._slots.release()
+
+        if not response:
+            raise EmbeddingServiceUnavailable("임베딩 서버 응답이 비어있습니다")
+        if response[0] != STATUS_OK:
+            raise RuntimeError(f"임베딩 서버 오류: {response[1:].decode('utf-8', 'replace')}")
+        return response[1:]
+
+    def _exchange(self, sock: Optional[socket.socket], body: bytes, read_timeout: Optional[float]) -> bytes:
+        """연결(없으면 새로 연결) 하나로 요청/응답 한 번, 성공하면 연결을 풀에 반납하고 실패하면 닫음"""
+        try:
+            if sock is None:
+                sock = self._connect()
+            sock.settimeout(read_timeout or self.timeout)
+            send_frame(sock, body)
+            response = recv_frame(sock)
+            sock.settimeout(self.timeout)
+        except BaseException:
+            if sock is not None:
+                sock.close()
+            raise
+
+        with self._idle_lock:
+            self._idle.append(sock)
+        return response
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """텍스트 목록 임베딩 (정규화 전 float32 행렬)"""
+        read_timeout = self.batch_timeout if len(texts) >= self.large_batch else self.timeout
+        payload = self._request(encode_request(OP_ENCODE, list(texts)), read_timeout)
+        rows, dim = _MATRIX_HEADER.unpack_from(payload, 0)
+        matrix = np.frombuffer(payload, dtype='<f4', offset=_MATRIX_HEADER.size, count=rows * dim)
+        return matrix.reshape(rows, dim).astype('float32')
+
+    def info(self) -> Dict:
+        """서버가 로드한 모델 정보"""
+        payload = self._request(encode_request(OP_INFO))
+        (dimension,) = _FRAME_HEADER.unpack_from(payload, 0)
+        return {
+            "model": payload[_FRAME_HEADER.size:].decode('utf-8'),
+            "dimension": dimension
+        }
+
+    def close(self):
+        """풀에 남은 연결 종료"""
+        with self._idle_lock:
+            idle, self._idle = self._idle, []
+        for sock in idle:
+            sock.close()
+
+
+def main():
+    from config.settings import Config
+
+    parser = argparse.ArgumentParser(description="AI Note System 공유 임베딩 서버")
+    parser.add_argument('--socket', default=Config.RAG_EMBEDDING_SOCKET, help="Unix 소켓 경로")
+    parser.add_argument('--model', default=Config.RAG_EMBEDDING_MODEL, help="SentenceTransformer 모델 이름")
+    parser.add_argument('--max-batch', type=int, default=Config.RAG_BATCH_MAX_SIZE, help="최대 배치 크기")
+    parser.add_argument('--max-wait-ms', type=float, default=Config.RAG_BATCH_MAX_WAIT_MS, help="배치 최대 대기 시간(ms)")
+    args = parser.parse_args()
+
+    server = EmbeddingServer(args.socket, args.model, args.max_batch, args.max_wait_ms)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 임베딩 서버 종료")
+
+
+if __name__ == "__main__":
+    main()
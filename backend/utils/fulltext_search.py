@@ -0,0 +1,154 @@
+# backend/utils/fulltext_search.py - SQLite FTS5 전문 검색
+"""
+노트 전문 검색 (SQLite FTS5)
+
+notes 테이블을 원본으로 하는 external content FTS5 테이블(notes_fts)을 만들고
+INSERT/UPDATE/DELETE 트리거로 동기화한다.
+한국어는 띄어쓰기 단위가 아닌 부분 문자열로 검색되어야 하므로 trigram 토크나이저를 쓰고,
+trigram을 지원하지 않는 SQLite(3.34 미만)에서는 unicode61로 대체한다.
+
+검색은 MATCH + bm25 정렬 + highlight()/snippet()을 쿼리 한 번으로 처리한다.
+trigram은 3글자 미만 검색어를 찾을 수 없으므로 그런 경우 호출자가 LIKE 경로를 사용한다.
+"""
+
+import logging
+from typing import List, Optional
+
+from sqlalchemy import text, table, column, literal_column, bindparam
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = 'notes_fts'
+
+# bm25 열 가중치 (제목, 내용) - 제목 매치를 더 높게
+TITLE_WEIGHT = 5.0
+CONTENT_WEIGHT = 1.0
+
+HIGHLIGHT_OPEN = '<mark>'
+HIGHLIGHT_CLOSE = '</mark>'
+
+FTS_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON notes BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON notes BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, content ON notes BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END""",
+]
+
+# ORM 쿼리에서 조인용으로만 쓰는 경량 테이블 (metadata에 등록하지 않음 → create_all 대상 아님)
+notes_fts = table(FTS_TABLE, column('rowid'))
+
+# setup_fulltext_search()가 결정 (None이면 FTS 사용 불가)
+_tokenizer = None
+
+
+def create_table_sql(tokenizer: str) -> str:
+    """FTS5 가상 테이블 DDL"""
+    return (f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            f"title, content, content='notes', content_rowid='id', tokenize='{tokenizer}')")
+
+
+def setup_fulltext_search(connection) -> Optional[str]:
+    """FTS5 테이블과 동기화 트리거 생성 (새로 만들었으면 기존 노트로 인덱스 구성)
+
+    Args:
+        connection: SQLAlchemy Connection (트랜잭션 안에서 호출)
+
+    Returns:
+        사용 중인 토크나이저 이름, FTS5를 쓸 수 없으면 None
+    """
+    global _tokenizer
+
+    if connection.dialect.name != 'sqlite':
+        _tokenizer = None
+        return None
+
+    existing = connection.execute(
+        text("SELECT sql FROM sqlite_master WHERE type='table' AND name=:name"), {"name": FTS_TABLE}
+    ).scalar()
+
+    if existing:
+        _tokenizer = 'trigram' if 'trigram' in existing else 'unicode61'
+    else:
+        for tokenizer in ('trigram', 'unicode61'):
+            try:
+                connection.execute(text(create_table_sql(tokenizer)))
+                _tokenizer = tokenizer
+                break
+            except Exception as e:
+                logger.warning(f"FTS5 토크나이저 {tokenizer} 사용 불가: {e}")
+        else:
+            _tokenizer = None
+            return None
+
+    for trigger in FTS_TRIGGERS:
+        connection.execute(text(trigger))
+
+    if not existing:
+        # 기존 노트로 인덱스 구성 (external content 테이블 전체 재색인)
+        connection.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+
+    return _tokenizer
+
+
+def is_available() -> bool:
+    """FTS5 검색 사용 가능 여부"""
+    return _tokenizer is not None
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """검색어 → FTS5 MATCH 식 (단어별 구문 검색, AND 결합)
+
+    FTS 문법 문자가 해석되지 않도록 단어마다 큰따옴표로 감싼다.
+    trigram에서 찾을 수 없는 3글자 미만 단어가 있으면 None (LIKE 경로 사용)
+    """
+    if not is_available() or not query:
+        return None
+
+    terms = query.split()
+    if not terms:
+        return None
+    if _tokenizer == 'trigram' and any(len(term) < 3 for term in terms):
+        return None
+
+    return ' '.join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def search_query(session, model, query: str, snippet_tokens: int = 16):
+    """MATCH + bm25 + highlight/snippet을 한 번에 가져오는 ORM 쿼리
+
+    결과 행: (노트, score, title_highlight, snippet) - score가 낮을수록 관련도 높음.
+    검색어를 FTS로 처리할 수 없으면 None
+    """
+    match = build_match_query(query)
+    if match is None:
+        return None
+
+    score = literal_column(f"bm25({FTS_TABLE}, {TITLE_WEIGHT}, {CONTENT_WEIGHT})")
+    title_highlight = literal_column(
+        f"highlight({FTS_TABLE}, 0, '{HIGHLIGHT_OPEN}', '{HIGHLIGHT_CLOSE}')")
+    snippet = literal_column(
+        f"snippet({FTS_TABLE}, 1, '{HIGHLIGHT_OPEN}', '{HIGHLIGHT_CLOSE}', '…', {int(snippet_tokens)})")
+
+    return (
+        session.query(model, score.label('score'), title_highlight.label('title_highlight'), snippet.label('snippet'))
+        .join(notes_fts, notes_fts.c.rowid == model.id)
+        .filter(literal_column(FTS_TABLE).op('MATCH')(bindparam('fts_match', match)))
+        .order_by(score)
+    )
+
+
+def attach_search_meta(rows) -> List:
+    """search_query 결과 행 → 노트 목록 (검색 점수/하이라이트를 노트 속성으로 붙임)"""
+    notes = []
+    for note, score, title_highlight, snippet in rows:
+        note.search_score = round(-float(score), 4)  # bm25는 낮을수록 좋으므로 부호 반전
+        note.search_title_highlight = title_highlight
+        note.search_snippet = snippet
+        notes.append(note)
+    return notes
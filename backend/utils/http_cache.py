@@ -0,0 +1,71 @@
+# backend/utils/http_cache.py - HTTP 조건부 요청 (ETag / If-None-Match)
+"""
+ETag 기반 조건부 GET
+
+라우트에 @etag_conditional(버전 함수)를 붙이면:
+1. 버전 함수로 값싼 버전(변경 카운터, updated_at 등)만 읽어서 ETag를 만들고
+2. If-None-Match가 일치하면 조회/직렬화 없이 바로 304 (본문 없음)
+3. 아니면 원래 뷰를 실행하고 200 응답에 ETag를 붙인다
+
+버전을 먼저 읽고 데이터를 나중에 읽으므로, 그 사이에 쓰기가 끼어들어도
+ETag는 응답보다 오래된 값이 될 뿐이라 다음 요청에서 전체 응답을 받는다 (잘못된 304는 없음).
+
+응답 본문에는 요청마다 달라지는 timestamp가 들어 있어 같은 버전이라도 바이트가 같지 않으므로
+약한 ETag(W/"...")를 쓰고, If-None-Match도 약한 비교로 확인한다.
+"""
+
+import hashlib
+import logging
+from functools import wraps
+
+from flask import request, current_app
+
+logger = logging.getLogger(__name__)
+
+# 브라우저가 저장은 하되 매번 재검증(If-None-Match)하도록
+CACHE_CONTROL = 'no-cache'
+
+
+def make_etag(*parts) -> str:
+    """버전 구성 요소 → ETag 값 (따옴표/W/ 없이, set_etag가 붙임)"""
+    raw = '|'.join(str(part) for part in parts)
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=12).hexdigest()
+
+
+def etag_conditional(version_fn):
+    """조건부 GET 데코레이터
+
+    Args:
+        version_fn: 뷰와 같은 인자를 받아 버전 값(문자열/숫자/튜플)을 돌려주는 함수.
+                    None을 돌려주면 ETag 없이 원래 뷰만 실행한다.
+                    요청 경로, 쿼리 문자열, Accept 헤더는 자동으로 ETag에 포함된다.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            etag = None
+            try:
+                version = version_fn(*args, **kwargs)
+                if version is not None:
+                    # 같은 URL도 Accept에 따라 JSON/NDJSON 표현이 달라짐
+                    etag = make_etag(request.path, request.query_string.decode('latin-1'),
+                                     request.headers.get('Accept', ''), version)
+            except Exception as e:
+                logger.warning(f"⚠️ ETag 버전 조회 실패 ({request.path}): {e}")
+
+            if etag and request.if_none_match.contains_weak(etag):
+                response = current_app.response_class(status=304)
+                response.set_etag(etag, weak=True)
+                response.headers['Cache-Control'] = CACHE_CONTROL
+                response.vary.add('Accept')
+                return response
+
+            response = current_app.make_response(view(*args, **kwargs))
+            if etag and response.status_code == 200:
+                response.set_etag(etag, weak=True)
+                response.headers['Cache-Control'] = CACHE_CONTROL
+                response.vary.add('Accept')
+            return response
+
+        return wrapper
+    return decorator
@@ -0,0 +1,105 @@
+# backend/utils/json_provider.py - 빠른 JSON 직렬화
+"""
+API 응답 JSON 직렬화 (orjson 우선, 없으면 표준 json)
+
+- FastJSONProvider: Flask 앱의 JSON 프로바이더 (jsonify, request.get_json, 테스트 클라이언트 get_json이 모두 사용)
+- dumps/loads: Flask 밖(NDJSON 스트리밍, 태그 JSON 파싱 등)에서 같은 인코더를 쓰기 위한 함수
+
+orjson은 C 구현이라 큰 목록 직렬화가 수 배 빠르고 datetime을 ISO 8601 문자열로 바로 쓴다.
+표준 json으로 동작할 때도 datetime은 같은 ISO 형식으로 맞춘다 (Flask 기본값은 HTTP 날짜 형식).
+orjson은 requirements.txt에 들어 있지만, 설치되지 않은 환경에서도 표준 json으로 그대로 동작한다.
+"""
+
+import json
+import uuid
+import decimal
+import dataclasses
+from datetime import date, datetime
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj):
+    """기본 인코더가 처리하지 못하는 값 변환 (orjson/표준 json 공통)"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    # numpy 스칼라 등 (RAG 점수)
+    if hasattr(obj, 'item'):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """객체 → UTF-8 JSON 바이트 (기본은 압축 형식, indent=True면 2칸 들여쓰기)"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(obj, ensure_ascii=False, default=_default, sort_keys=sort_keys,
+                      indent=2 if indent else None,
+                      separators=(',', ': ') if indent else (',', ':')).encode('utf-8')
+
+
+def dumps(obj, sort_keys: bool = False) -> str:
+    """객체 → JSON 문자열 (압축 형식)"""
+    return dumps_bytes(obj, sort_keys=sort_keys).decode('utf-8')
+
+
+def loads(data):
+    """JSON 문자열/바이트 → 객체"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """orjson 기반 Flask JSON 프로바이더 (orjson이 없거나 json 인자가 주어지면 기본 동작)"""
+
+    default = staticmethod(_default)
+
+    def dumps(self, obj, **kwargs) -> str:
+        if not ORJSON_AVAILABLE or kwargs:
+            kwargs.setdefault('default', _default)
+            return super().dumps(obj, **kwargs)
+        return dumps(obj, sort_keys=self.sort_keys)
+
+    def loads(self, s, **kwargs):
+        if not ORJSON_AVAILABLE or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """jsonify 응답 (orjson 바이트를 문자열로 되돌리지 않고 그대로 본문에 사용)"""
+        obj = self._prepare_response_obj(args, kwargs)
+        # 기본 프로바이더와 같이 디버그 모드에서는 들여쓰기 출력
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        body = dumps_bytes(obj, sort_keys=self.sort_keys, indent=indent)
+        return self._app.response_class(body + b"\n" if indent else body, mimetype=self.mimetype)
+
+
+def init_json(app: Flask):
+    """앱의 JSON 프로바이더를 FastJSONProvider로 교체"""
+    app.json_provider_class = FastJSONProvider
+    app.json = FastJSONProvider(app)
+    engine = 'orjson' if ORJSON_AVAILABLE else 'json'
+    print(f"✅ JSON 직렬화: {engine}")
+    return app.json
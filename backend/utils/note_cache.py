@@ -0,0 +1,245 @@
+# backend/utils/note_cache.py - 노트 단건 조회 캐시
+"""
+노트 read-through 캐시 (ID → {"version": updated_at, "note": 직렬화된 노트 dict})
+
+세션에 묶인 ORM 객체가 아니라 to_dict() 결과를 저장하므로 요청/스레드 간에 안전하게 공유된다.
+NoteRepository가 수정/삭제 시 무효화하고, 조회 경로(GET /api/notes/<id>)만 캐시를 읽는다.
+꺼낼 때 저장된 version을 DB의 현재 updated_at과 비교하므로, 다른 워커의 수정으로
+이 프로세스의 LRU가 무효화되지 않았더라도 오래된 본문이 새 ETag로 나가지 않는다.
+
+- 기본: 프로세스 내부 LRU (NOTE_CACHE_SIZE개, 0 = 끔)
+- NOTE_CACHE_URL(redis://...)을 지정하면 여러 워커가 같은 캐시를 공유 (redis 패키지 필요)
+  공유 캐시를 쓸 때는 워커별 로컬 사본을 두지 않아 다른 워커의 무효화가 바로 보인다.
+조회: GET /api/system/debug/note-cache
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+from utils.json_provider import dumps as json_dumps, loads as json_loads
+
+logger = logging.getLogger(__name__)
+
+
+class LocalLRUBackend:
+    """프로세스 내부 LRU 저장소"""
+
+    name = 'local'
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0  # 무효화 횟수 (조회 중 무효화가 끼어들었는지 확인용)
+        self.evictions = 0
+
+    def get(self, key: int) -> Optional[Dict]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def set(self, key: int, value: Dict, generation: int):
+        with self._lock:
+            # 값을 읽는 동안 무효화가 있었다면 오래된 값일 수 있으므로 저장하지 않음
+            if generation != self.generation:
+                return
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def delete_many(self, keys: Iterable[int]):
+        with self._lock:
+            self.generation += 1
+            for key in keys:
+                self._items.pop(key, None)
+
+    def current_generation(self) -> int:
+        return self.generation
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._items.clear()
+
+    def size(self) -> int:
+        return len(self._items)
+
+
+class RedisBackend:
+    """여러 워커가 공유하는 Redis 저장소 (항목마다 TTL, 크기 제한은 Redis maxmemory 정책에 맡김)"""
+
+    name = 'redis'
+
+    def __init__(self, url: str, ttl: int, prefix: str = 'notes:cache:'):
+        import redis  # 선택 의존성
+
+        self.client = redis.Redis.from_url(url)
+        self.client.ping()
+        self.ttl = ttl
+        self.prefix = prefix
+        self.generation_key = prefix + 'generation'
+        self.evictions = 0
+
+    def _key(self, key: int) -> str:
+        return f"{self.prefix}{key}"
+
+    def get(self, key: int) -> Optional[Dict]:
+        raw = self.client.get(self._key(key))
+        return json_loads(raw) if raw else None
+
+    def set(self, key: int, value: Dict, generation: int):
+        if generation != self.current_generation():
+            return
+        self.client.set(self._key(key), json_dumps(value), ex=self.ttl or None)
+
+    def delete_many(self, keys: Iterable[int]):
+        pipeline = self.client.pipeline()
+        pipeline.incr(self.generation_key)
+        keys = [self._key(key) for key in keys]
+        if keys:
+            pipeline.delete(*keys)
+        pipeline.execute()
+
+    def current_generation(self) -> int:
+        return int(self.client.get(self.generation_key) or 0)
+
+    def clear(self):
+        pipeline = self.client.pipeline()
+        pipeline.incr(self.generation_key)
+        for key in self.client.scan_iter(match=self.prefix + '[0-9]*'):
+            pipeline.delete(key)
+        pipeline.execute()
+
+    def size(self) -> int:
+        return sum(1 for _ in self.client.scan_iter(match=self.prefix + '[0-9]*'))
+
+
+class NoteCache:
+    """노트 캐시 (저장소 + 적중/실패 집계)"""
+
+    def __init__(self, backend=None):
+        self.backend = backend
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def generation(self) -> int:
+        """DB에서 읽기 전에 받아 두고 set()에 넘기는 무효화 세대"""
+        if not self.enabled:
+            return 0
+        try:
+            return self.backend.current_generation()
+        except Exception as e:
+            self._record_error(e)
+            return -1
+
+    def get(self, note_id: int) -> Optional[Dict]:
+        if not self.enabled:
+            return None
+        try:
+            value = self.backend.get(note_id)
+        except Exception as e:
+            self._record_error(e)
+            value = None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, note_id: int, value: Dict, generation: int):
+        if not self.enabled or generation < 0:
+            return
+        try:
+            self.backend.set(note_id, value, generation)
+        except Exception as e:
+            self._record_error(e)
+
+    def invalidate(self, note_id: int):
+        self.invalidate_many([note_id])
+
+    def invalidate_many(self, note_ids: Iterable[int]):
+        if not self.enabled:
+            return
+        note_ids = list(note_ids)
+        try:
+            self.backend.delete_many(note_ids)
+        except Exception as e:
+            self._record_error(e)
+        with self._lock:
+            self.invalidations += len(note_ids)
+
+    def clear(self):
+        if self.enabled:
+            try:
+                self.backend.clear()
+            except Exception as e:
+                self._record_error(e)
+
+    def _record_error(self, error: Exception):
+        # 캐시 장애는 조회 실패로 번지지 않도록 기록만 하고 DB 경로로 진행
+        with self._lock:
+            self.errors += 1
+        logger.warning(f"⚠️ 노트 캐시 오류: {error}")
+
+    def get_stats(self) -> Dict:
+        """적중률 등 캐시 지표"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                'enabled': self.enabled,
+                'backend': self.backend.name if self.enabled else None,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+                'invalidations': self.invalidations,
+                'errors': self.errors,
+            }
+        if self.enabled:
+            try:
+                stats['size'] = self.backend.size()
+            except Exception:
+                stats['size'] = None
+            stats['evictions'] = self.backend.evictions
+            stats['max_size'] = getattr(self.backend, 'max_size', None)
+        return stats
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = self.invalidations = self.errors = 0
+
+
+def _create_note_cache() -> NoteCache:
+    from config.settings import Config
+
+    if Config.NOTE_CACHE_URL:
+        try:
+            backend = RedisBackend(Config.NOTE_CACHE_URL, Config.NOTE_CACHE_TTL)
+            print("✅ 노트 캐시: 공유 저장소(redis) 사용")
+            return NoteCache(backend)
+        except ImportError:
+            print("⚠️ redis 패키지가 없어 로컬 노트 캐시를 사용합니다 (pip install redis)")
+        except Exception as e:
+            print(f"⚠️ 공유 노트 캐시 연결 실패, 로컬 캐시 사용: {e}")
+
+    if Config.NOTE_CACHE_SIZE <= 0:
+        return NoteCache(None)
+    return NoteCache(LocalLRUBackend(Config.NOTE_CACHE_SIZE))
+
+
+# 전역 인스턴스
+note_cache = _create_note_cache()
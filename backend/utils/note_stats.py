@@ -0,0 +1,224 @@
+# backend/utils/note_stats.py - 트리거로 유지하는 노트 통계
+"""
+노트 통계 (증분 유지)
+
+노트 수, 내용 길이 합계, 사용 중인 태그 수, 마지막 생성 시각, 일별 생성 수, 태그별 노트 수를
+notes/note_tags 트리거로 쓰기와 같은 트랜잭션 안에서 갱신한다.
+SQLite는 쓰기를 직렬화하므로 동시 쓰기에서도 집계가 어긋나지 않고,
+/api/notes/stats는 한 행 + 최근 일별 버킷 몇 개만 읽는다.
+
+통계 테이블을 새로 만들 때(기존 DB 포함)는 현재 데이터로 한 번 재계산한다.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+STATS_TABLE = 'note_stats'
+DAILY_TABLE = 'note_daily_stats'
+TAG_TABLE = 'note_tag_stats'
+
+# 최근 생성 수를 셀 기간 (오늘 포함 일수, UTC 기준 일별 버킷)
+RECENT_DAYS = 7
+
+STATS_TABLES = [
+    # 전체 집계는 id=1 한 행
+    f"""CREATE TABLE IF NOT EXISTS {STATS_TABLE} (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        note_count INTEGER NOT NULL DEFAULT 0,
+        total_content_length INTEGER NOT NULL DEFAULT 0,
+        tag_count INTEGER NOT NULL DEFAULT 0,
+        last_created_at DATETIME
+    )""",
+    f"""CREATE TABLE IF NOT EXISTS {DAILY_TABLE} (
+        day DATE PRIMARY KEY,
+        created_count INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID""",
+    f"""CREATE TABLE IF NOT EXISTS {TAG_TABLE} (
+        tag_id INTEGER PRIMARY KEY,
+        note_count INTEGER NOT NULL DEFAULT 0
+    )""",
+    f"CREATE INDEX IF NOT EXISTS ix_{TAG_TABLE}_note_count ON {TAG_TABLE} (note_count)",
+]
+
+# created_at이 비어 있는 행은 삽입 시각 기준 버킷으로 센다
+_NEW_CREATED = "COALESCE(new.created_at, CURRENT_TIMESTAMP)"
+
+STATS_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS {STATS_TABLE}_ai AFTER INSERT ON notes BEGIN
+        UPDATE {STATS_TABLE} SET
+            note_count = note_count + 1,
+            total_content_length = total_content_length + COALESCE(length(new.content), 0),
+            last_created_at = CASE WHEN last_created_at IS NULL OR {_NEW_CREATED} > last_created_at
+                                   THEN {_NEW_CREATED} ELSE last_created_at END
+        WHERE id = 1;
+        INSERT INTO {DAILY_TABLE} (day, created_count) VALUES (date({_NEW_CREATED}), 1)
+            ON CONFLICT(day) DO UPDATE SET created_count = created_count + 1;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {STATS_TABLE}_ad AFTER DELETE ON notes BEGIN
+        UPDATE {STATS_TABLE} SET
+            note_count = note_count - 1,
+            total_content_length = total_content_length - COALESCE(length(old.content), 0),
+            last_created_at = CASE WHEN old.created_at >= last_created_at
+                                   THEN (SELECT MAX(created_at) FROM notes) ELSE last_created_at END
+        WHERE id = 1;
+        UPDATE {DAILY_TABLE} SET created_count = created_count - 1 WHERE day = date(old.created_at);
+        -- ORM 삭제는 연결 행을 먼저 지우지만, SQL로 직접 지운 노트도 태그 수에서 빠지도록 정리
+        DELETE FROM note_tags WHERE note_id = old.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {STATS_TABLE}_au AFTER UPDATE OF content, created_at ON notes BEGIN
+        UPDATE {STATS_TABLE} SET
+            total_content_length = total_content_length
+                - COALESCE(length(old.content), 0) + COALESCE(length(new.content), 0),
+            last_created_at = CASE WHEN new.created_at IS NOT old.created_at
+                                   THEN (SELECT MAX(created_at) FROM notes) ELSE last_created_at END
+        WHERE id = 1;
+        UPDATE {DAILY_TABLE} SET created_count = created_count - 1
+            WHERE day = date(old.created_at) AND date(new.created_at) IS NOT date(old.created_at);
+        INSERT INTO {DAILY_TABLE} (day, created_count)
+            SELECT date(new.created_at), 1 WHERE date(new.created_at) IS NOT date(old.created_at)
+            ON CONFLICT(day) DO UPDATE SET created_count = created_count + 1;
+    END""",
+    # 태그별 노트 수 (0 → 1, 1 → 0으로 바뀔 때 사용 중인 태그 수도 함께 갱신)
+    f"""CREATE TRIGGER IF NOT EXISTS {STATS_TABLE}_tag_ai AFTER INSERT ON note_tags BEGIN
+        UPDATE {STATS_TABLE} SET tag_count = tag_count + 1
+            WHERE id = 1 AND COALESCE((SELECT note_count FROM {TAG_TABLE} WHERE tag_id = new.tag_id), 0) = 0;
+        INSERT INTO {TAG_TABLE} (tag_id, note_count) VALUES (new.tag_id, 1)
+            ON CONFLICT(tag_id) DO UPDATE SET note_count = note_count + 1;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {STATS_TABLE}_tag_ad AFTER DELETE ON note_tags BEGIN
+        UPDATE {TAG_TABLE} SET note_count = note_count - 1 WHERE tag_id = old.tag_id;
+        UPDATE {STATS_TABLE} SET tag_count = tag_count - 1
+            WHERE id = 1 AND (SELECT note_count FROM {TAG_TABLE} WHERE tag_id = old.tag_id) = 0;
+    END""",
+]
+
+# setup_note_stats()가 결정
+_available = False
+
+
+def setup_note_stats(connection) -> bool:
+    """통계 테이블과 트리거 생성 (새로 만들었으면 현재 데이터로 재계산)
+
+    Args:
+        connection: SQLAlchemy Connection (트랜잭션 안에서 호출)
+
+    Returns:
+        트리거 기반 통계 사용 가능 여부
+    """
+    global _available
+
+    if connection.dialect.name != 'sqlite':
+        _available = False
+        return False
+
+    existing = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type='table' AND name=:name"), {"name": STATS_TABLE}
+    ).scalar()
+
+    for statement in STATS_TABLES + STATS_TRIGGERS:
+        connection.execute(text(statement))
+
+    if not existing:
+        rebuild_note_stats(connection)
+
+    _available = True
+    return True
+
+
+def rebuild_note_stats(connection):
+    """현재 notes/note_tags로 통계 전체 재계산 (최초 생성/복구용)"""
+    connection.execute(text(f"DELETE FROM {DAILY_TABLE}"))
+    connection.execute(text(f"DELETE FROM {TAG_TABLE}"))
+
+    # 삭제된 노트의 연결 행이 남아 있을 수 있으므로 notes와 조인해서 센다
+    connection.execute(text(
+        f"INSERT INTO {TAG_TABLE} (tag_id, note_count) "
+        "SELECT note_tags.tag_id, COUNT(*) FROM note_tags JOIN notes ON notes.id = note_tags.note_id "
+        "GROUP BY note_tags.tag_id"
+    ))
+    connection.execute(text(
+        f"INSERT OR REPLACE INTO {STATS_TABLE} (id, note_count, total_content_length, tag_count, last_created_at) "
+        f"SELECT 1, COUNT(*), COALESCE(SUM(length(content)), 0), (SELECT COUNT(*) FROM {TAG_TABLE}), MAX(created_at) "
+        "FROM notes"
+    ))
+    connection.execute(text(
+        f"INSERT INTO {DAILY_TABLE} (day, created_count) "
+        "SELECT date(created_at), COUNT(*) FROM notes WHERE created_at IS NOT NULL GROUP BY date(created_at)"
+    ))
+
+
+def is_available() -> bool:
+    """트리거 기반 통계 사용 가능 여부"""
+    return _available
+
+
+def _parse_datetime(value) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value))
+
+
+def read_note_stats(session, days: int = RECENT_DAYS) -> Dict:
+    """집계 한 행 + 최근 일별 버킷으로 노트 통계 구성
+
+    Args:
+        session: SQLAlchemy Session 또는 Connection (같은 트랜잭션의 쓰기도 반영)
+        days: 최근 생성 수를 셀 기간 (오늘 포함)
+    """
+    row = session.execute(text(
+        f"SELECT note_count, total_content_length, tag_count, last_created_at FROM {STATS_TABLE} WHERE id = 1"
+    )).first()
+    note_count, total_length, tag_count, last_created = row if row else (0, 0, 0, None)
+
+    since = (datetime.utcnow() - timedelta(days=days - 1)).date().isoformat()
+    daily = session.execute(
+        text(f"SELECT day, created_count FROM {DAILY_TABLE} WHERE day >= :since AND created_count > 0 ORDER BY day"),
+        {"since": since}
+    ).fetchall()
+
+    last_created = _parse_datetime(last_created)
+    return {
+        "total_notes": note_count,
+        "total_tags": tag_count,
+        "last_created": last_created.isoformat() if last_created else None,
+        "recent_notes_count": sum(count for _, count in daily),
+        "avg_content_length": round(total_length / note_count, 2) if note_count else 0,
+        "daily_created": {str(day): count for day, count in daily}
+    }
+
+
+def read_tag_counts(session, limit: Optional[int] = None) -> List[Dict]:
+    """태그별 노트 수 (많은 순) - 통계 테이블에서 바로 읽음"""
+    sql = (f"SELECT tags.name, {TAG_TABLE}.note_count FROM {TAG_TABLE} "
+           f"JOIN tags ON tags.id = {TAG_TABLE}.tag_id WHERE {TAG_TABLE}.note_count > 0 "
+           f"ORDER BY {TAG_TABLE}.note_count DESC, tags.name")
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+    return [{"name": name, "count": count} for name, count in session.execute(text(sql)).fetchall()]
+
+
+def read_daily_counts(session, since: Optional[str] = None, until: Optional[str] = None) -> List[tuple]:
+    """일별 생성 수 [(YYYY-MM-DD, 개수), ...] (날짜순, 생성이 없는 날은 빠짐)
+
+    트리거 통계가 있으면 일별 버킷 테이블만 읽고, 없으면 notes에서 GROUP BY date(created_at)로 센다.
+    어느 쪽이든 비용은 노트 수가 아니라 날짜 수에 비례한다 (집계 경로는 created_at 인덱스 사용).
+
+    Args:
+        since / until: 포함 범위 (YYYY-MM-DD, UTC 날짜)
+    """
+    params = {"since": since, "until": until}
+    if _available:
+        sql = (f"SELECT day, created_count FROM {DAILY_TABLE} WHERE created_count > 0 "
+               "AND (:since IS NULL OR day >= :since) AND (:until IS NULL OR day <= :until) ORDER BY day")
+    else:
+        # 범위 조건은 인덱스를 타도록 날짜가 아니라 created_at에 건다
+        sql = ("SELECT date(created_at) AS day, COUNT(*) FROM notes WHERE created_at IS NOT NULL "
+               "AND (:since IS NULL OR created_at >= :since) "
+               "AND (:until IS NULL OR created_at < date(:until, '+1 day')) "
+               "GROUP BY day ORDER BY day")
+    return [(str(day), count) for day, count in session.execute(text(sql), params).fetchall()]
@@ -0,0 +1,86 @@
+# backend/utils/note_versions.py - 노트 변경 카운터
+"""
+노트 데이터 변경 카운터 (HTTP 조건부 요청용)
+
+notes/note_tags/tags가 바뀔 때마다 트리거가 한 행짜리 카운터를 1씩 올린다.
+쓰기와 같은 트랜잭션에서 올라가므로 여러 워커가 있어도 값이 같고,
+목록/통계/태그 응답의 ETag는 이 값(기본키 조회 한 번)으로 만든다.
+노트 단건은 notes.updated_at을 버전으로 사용한다.
+"""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+VERSION_TABLE = 'note_version'
+
+VERSION_TABLES = [
+    f"""CREATE TABLE IF NOT EXISTS {VERSION_TABLE} (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL DEFAULT 0
+    )""",
+    f"INSERT OR IGNORE INTO {VERSION_TABLE} (id, version) VALUES (1, 0)",
+]
+
+_BUMP = f"UPDATE {VERSION_TABLE} SET version = version + 1 WHERE id = 1;"
+
+VERSION_TRIGGERS = [
+    f"CREATE TRIGGER IF NOT EXISTS {VERSION_TABLE}_{name} AFTER {event} ON {table} BEGIN {_BUMP} END"
+    for name, event, table in [
+        ('notes_ai', 'INSERT', 'notes'),
+        ('notes_au', 'UPDATE', 'notes'),
+        ('notes_ad', 'DELETE', 'notes'),
+        ('note_tags_ai', 'INSERT', 'note_tags'),
+        ('note_tags_ad', 'DELETE', 'note_tags'),
+        # 태그 이름이 바뀌면 태그 목록 응답도 바뀜
+        ('tags_au', 'UPDATE OF name', 'tags'),
+    ]
+]
+
+# setup_note_versions()가 결정
+_available = False
+
+
+def setup_note_versions(connection) -> bool:
+    """카운터 테이블과 트리거 생성
+
+    Args:
+        connection: SQLAlchemy Connection (트랜잭션 안에서 호출)
+
+    Returns:
+        변경 카운터 사용 가능 여부
+    """
+    global _available
+
+    if connection.dialect.name != 'sqlite':
+        _available = False
+        return False
+
+    for statement in VERSION_TABLES + VERSION_TRIGGERS:
+        connection.execute(text(statement))
+
+    _available = True
+    return True
+
+
+def is_available() -> bool:
+    """변경 카운터 사용 가능 여부"""
+    return _available
+
+
+def read_version(session) -> Optional[int]:
+    """현재 노트 데이터 버전 (사용 불가하면 None)"""
+    if not _available:
+        return None
+    return session.execute(text(f"SELECT version FROM {VERSION_TABLE} WHERE id = 1")).scalar()
+
+
+def read_note_version(session, note_id: int) -> Optional[str]:
+    """노트 단건 버전 (notes.updated_at, 노트가 없으면 None)"""
+    value = session.execute(
+        text("SELECT updated_at FROM notes WHERE id = :note_id"), {"note_id": note_id}
+    ).scalar()
+    return str(value) if value is not None else None
@@ -0,0 +1,41 @@
+# backend/utils/pagination.py - 커서 페이지네이션 헬퍼
+"""
+키셋(커서) 페이지네이션용 커서 토큰
+
+커서는 마지막으로 받은 항목의 (created_at, id)를 담은 불투명 문자열이다.
+다음 페이지는 OFFSET 없이 "(created_at, id) < 커서" 조건으로 인덱스에서 바로 이어 읽으므로
+몇 번째 페이지든 첫 페이지와 비용이 같다.
+"""
+
+import json
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """(created_at, id) → URL에 그대로 쓸 수 있는 커서 문자열"""
+    payload = json.dumps({"c": created_at.isoformat(), "i": item_id}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 문자열 → (created_at, id)
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 커서
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except Exception:
+        raise ValueError("유효하지 않은 커서입니다")
+
+
+def next_cursor_for(items: list, has_more: bool) -> Optional[str]:
+    """페이지 마지막 항목으로 다음 커서 생성 (더 없으면 None)"""
+    if not has_more or not items:
+        return None
+    last = items[-1]
+    return encode_cursor(last.created_at, last.id)
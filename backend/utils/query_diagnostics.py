@@ -0,0 +1,141 @@
+# backend/utils/query_diagnostics.py - 샘플링 기반 쿼리 진단
+"""
+DB 쿼리 진단 (opt-in, 샘플링)
+
+레포지토리 메서드를 track()으로 감싸면, 샘플링된 호출에 한해
+SQLAlchemy 엔진 이벤트로 실행된 쿼리 수와 시간을 기록한다.
+샘플링되지 않은 호출은 난수 하나만 뽑고 지나가므로 운영 경로에 부담이 없다.
+
+설정: DB_DIAGNOSTICS_SAMPLE_RATE (0.0 = 끔, 1.0 = 모든 호출 기록)
+조회: GET /api/system/debug/queries
+"""
+
+import time
+import random
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+
+class QueryDiagnostics:
+    """작업(operation)별 쿼리 수/시간 집계기"""
+
+    def __init__(self, sample_rate: float = 0.0, slow_query_ms: float = 100.0):
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        self.slow_query_ms = slow_query_ms
+
+        self._local = threading.local()  # 현재 스레드에서 기록 중인 작업
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._installed_engines = set()
+
+    # =========================
+    # 엔진 연결
+    # =========================
+
+    def install(self, engine):
+        """엔진에 커서 실행 이벤트 리스너 등록 (엔진당 한 번)"""
+        if id(engine) in self._installed_engines:
+            return
+
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+        self._installed_engines.add(id(engine))
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        span = getattr(self._local, 'span', None)
+        if span is not None:
+            span['query_started'] = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        span = getattr(self._local, 'span', None)
+        if span is None or span.get('query_started') is None:
+            return
+
+        elapsed_ms = (time.perf_counter() - span.pop('query_started')) * 1000
+        span['queries'] += 1
+        span['query_ms'] += elapsed_ms
+
+        if elapsed_ms >= self.slow_query_ms:
+            logger.warning(f"🐢 느린 쿼리 ({span['name']}, {elapsed_ms:.1f}ms): {statement[:200]}")
+
+    # =========================
+    # 기록
+    # =========================
+
+    @contextmanager
+    def track(self, name: str):
+        """작업 하나를 (샘플링되면) 기록"""
+        if self.sample_rate <= 0 or getattr(self._local, 'span', None) is not None \
+                or random.random() >= self.sample_rate:
+            yield
+            return
+
+        span = {'name': name, 'queries': 0, 'query_ms': 0.0}
+        self._local.span = span
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._local.span = None
+            self._record(span, (time.perf_counter() - started) * 1000)
+
+    def _record(self, span: Dict, wall_ms: float):
+        with self._lock:
+            stats = self._stats.setdefault(span['name'], {
+                'samples': 0,
+                'queries': 0,
+                'max_queries': 0,
+                'query_ms': 0.0,
+                'wall_ms': 0.0,
+                'max_wall_ms': 0.0
+            })
+            stats['samples'] += 1
+            stats['queries'] += span['queries']
+            stats['max_queries'] = max(stats['max_queries'], span['queries'])
+            stats['query_ms'] += span['query_ms']
+            stats['wall_ms'] += wall_ms
+            stats['max_wall_ms'] = max(stats['max_wall_ms'], wall_ms)
+
+        logger.debug(f"📊 {span['name']}: 쿼리 {span['queries']}개, "
+                     f"DB {span['query_ms']:.2f}ms / 전체 {wall_ms:.2f}ms")
+
+    def get_stats(self) -> Dict:
+        """작업별 집계 (평균 포함)"""
+        with self._lock:
+            operations = {}
+            for name, stats in self._stats.items():
+                samples = stats['samples']
+                operations[name] = {
+                    **{key: round(value, 3) if isinstance(value, float) else value
+                       for key, value in stats.items()},
+                    'avg_queries': round(stats['queries'] / samples, 2),
+                    'avg_query_ms': round(stats['query_ms'] / samples, 3),
+                    'avg_wall_ms': round(stats['wall_ms'] / samples, 3)
+                }
+
+        return {
+            'enabled': self.sample_rate > 0,
+            'sample_rate': self.sample_rate,
+            'slow_query_ms': self.slow_query_ms,
+            'operations': operations
+        }
+
+    def reset(self):
+        """집계 초기화"""
+        with self._lock:
+            self._stats = {}
+
+
+def _create_query_diagnostics() -> QueryDiagnostics:
+    from config.settings import Config
+    return QueryDiagnostics(Config.DB_DIAGNOSTICS_SAMPLE_RATE, Config.DB_DIAGNOSTICS_SLOW_MS)
+
+
+# 전역 인스턴스
+query_diagnostics = _create_query_diagnostics()
@@ -5,9 +5,15 @@ API 응답 표준화 유틸리티
 과제용 심플 버전
 """
 
-from flask import jsonify
+from flask import jsonify, Response, stream_with_context
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import logging
+from utils.json_provider import dumps as json_dumps
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
 
 
 def success_response(data: Any = None, message: str = "성공", status_code: int = 200) -> tuple:
@@ -74,6 +80,45 @@ def search_response(query: str, results: List[Any], total: int = None, filters:
     return success_response(data, message)
 
 
+def ndjson_response(records: Iterable[Any], serialize: Optional[Callable] = None,
+                    filename: str = None, lines_per_chunk: int = 100) -> Response:
+    """NDJSON 스트리밍 응답 (한 줄에 레코드 하나)
+
+    records는 DB 커서를 나눠 읽는 제너레이터를 넘긴다. 응답 본문을 만들면서 하나씩 꺼내
+    lines_per_chunk줄씩 내보내므로 결과 크기와 무관하게 메모리 사용량이 일정하다.
+    요청 컨텍스트(세션)를 스트리밍이 끝날 때까지 유지한다.
+    """
+    def generate():
+        lines = []
+        try:
+            for record in records:
+                if serialize is not None:
+                    record = serialize(record)
+                lines.append(json_dumps(record))
+                if len(lines) >= lines_per_chunk:
+                    yield "\n".join(lines) + "\n"
+                    lines = []
+        except Exception as e:
+            # 상태 코드는 이미 전송됐으므로 마지막 줄에 오류를 남긴다
+            logger.error(f"NDJSON streaming failed: {e}")
+            lines.append(json_dumps({"success": False, "error": str(e)}))
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+    response = Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+    if filename:
+        response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+def wants_ndjson(request) -> bool:
+    """NDJSON 스트리밍 응답 요청 여부 (?format=ndjson 또는 Accept: application/x-ndjson)"""
+    if request.args.get('format') == 'ndjson':
+        return True
+    # Accept: */* 처럼 둘 다 허용하면 기존 JSON 응답
+    return request.accept_mimetypes[NDJSON_MIMETYPE] > request.accept_mimetypes['application/json']
+
+
 def validate_required_fields(data: Dict, required_fields: List[str]) -> Optional[str]:
     """필수 필드 검증"""
     missing_fields = []
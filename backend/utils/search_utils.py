@@ -6,6 +6,9 @@
 import re
 from typing import List, Dict, Any
 from models.note import Note
+from config.database import db
+from utils import fulltext_search
+from utils.autocomplete import note_autocomplete, load_note_rows
 from utils.markdown_utils import markdown_processor
 
 
@@ -16,12 +19,19 @@ class NoteSearcher:
         self.processor = markdown_processor
     
     def search_notes(self, query: str, filters: Dict = None) -> List[Note]:
-        """통합 노트 검색"""
+        """통합 노트 검색 (FTS5 bm25 순, 짧은 검색어는 LIKE + 관련도 정렬)"""
         if not query or len(query.strip()) < 2:
             return []
         
         query = query.strip()
         
+        # 전문 검색: 매치/정렬/하이라이트를 쿼리 한 번으로
+        fts_query = fulltext_search.search_query(db.session, Note, query)
+        if fts_query is not None:
+            if filters:
+                fts_query = self._apply_filters(fts_query, filters)
+            return fulltext_search.attach_search_meta(fts_query.all())
+        
         # 기본 쿼리 구성
         search_query = Note.query
         
@@ -45,7 +55,7 @@ class NoteSearcher:
         # 태그 필터
         if 'tags' in filters and filters['tags']:
             for tag in filters['tags']:
-                query = query.filter(Note.tags.ilike(f'%"{tag}"%'))
+                query = query.filter(Note.tag_filter(tag))
         
         # 날짜 필터
         if 'date_from' in filters and filters['date_from']:
@@ -59,6 +69,8 @@ class NoteSearcher:
     def _sort_by_relevance(self, notes: List[Note], query: str) -> List[Note]:
         """관련도순 정렬"""
         query_lower = query.lower()
+        # 최신성 기준 시각 (노트마다 DB를 다시 조회하지 않도록 한 번만 계산)
+        reference_time = Note.query.first().updated_at if notes else None
         
         def calculate_score(note):
             score = 0
@@ -82,8 +94,8 @@ class NoteSearcher:
                     score += 20
             
             # 최신 노트 약간 우대
-            if note.updated_at:
-                days_old = (Note.query.first().updated_at - note.updated_at).days
+            if note.updated_at and reference_time:
+                days_old = (reference_time - note.updated_at).days
                 score += max(0, 10 - days_old)
             
             return score
@@ -98,7 +110,7 @@ class NoteSearcher:
         query = Note.query
         
         for tag in tags:
-            query = query.filter(Note.tags.ilike(f'%"{tag}"%'))
+            query = query.filter(Note.tag_filter(tag))
         
         return query.order_by(Note.updated_at.desc()).all()
     
@@ -110,8 +122,9 @@ class NoteSearcher:
         if not note_tags:
             return []
         
-        # 같은 태그를 가진 노트들 찾기
+        # 같은 태그를 가진 노트들만 후보로 조회 (note_tags 인덱스)
         candidates = Note.query.filter(
+            Note.tag_filter(list(note_tags)),
             Note.id != note.id  # 자기 자신 제외
         ).all()
         
@@ -131,47 +144,12 @@ class NoteSearcher:
         return [note for note, score in scored_notes[:limit]]
     
     def get_search_suggestions(self, partial_query: str) -> Dict[str, List[str]]:
-        """검색 자동완성 제안"""
+        """검색 자동완성 제안 (제목/태그/본문 단어 접두사, 메모리 색인 사용)"""
         if len(partial_query) < 2:
             return {"titles": [], "tags": [], "keywords": []}
         
-        partial_lower = partial_query.lower()
-        
-        # 노트 제목 제안
-        title_suggestions = []
-        notes = Note.query.limit(100).all()  # 최신 100개만
-        
-        for note in notes:
-            if partial_lower in note.title.lower():
-                title_suggestions.append(note.title)
-        
-        # 태그 제안
-        tag_suggestions = []
-        all_tags = Note.get_all_tags()
-        
-        for tag in all_tags:
-            if partial_lower in tag.lower():
-                tag_suggestions.append(tag)
-        
-        # 키워드 제안 (자주 사용되는 단어들)
-        keyword_suggestions = self._extract_common_keywords(partial_lower)
-        
-        return {
-            "titles": title_suggestions[:5],
-            "tags": tag_suggestions[:5], 
-            "keywords": keyword_suggestions[:5]
-        }
-    
-    def _extract_common_keywords(self, partial_query: str) -> List[str]:
-        """자주 사용되는 키워드 추출"""
-        common_keywords = [
-            "python", "javascript", "vue", "react", "flask", "django",
-            "html", "css", "api", "database", "sql", "ai", "ml",
-            "langchain", "claude", "openai", "markdown", "git",
-            "학습", "정리", "프로젝트", "아이디어", "메모", "계획"
-        ]
-        
-        return [kw for kw in common_keywords if partial_query in kw.lower()]
+        note_autocomplete.ensure_built(load_note_rows)
+        return note_autocomplete.suggest(partial_query, limit=5)
     
     def highlight_search_results(self, notes: List[Note], query: str) -> List[Dict]:
         """검색 결과에 하이라이트 적용"""
@@ -179,17 +157,22 @@ class NoteSearcher:
         search_terms = query.split()
         
         for note in notes:
-            # 제목 하이라이트
-            highlighted_title = note.title
-            for term in search_terms:
-                highlighted_title = self.processor.highlight_search_terms(
-                    highlighted_title, [term]
-                )
-            
-            # 내용 미리보기 하이라이트
-            preview = self.processor.create_preview(note.content, 200)
-            for term in search_terms:
-                preview = self.processor.highlight_search_terms(preview, [term])
+            if getattr(note, 'search_snippet', None) is not None:
+                # FTS5 검색 결과는 highlight()/snippet()으로 이미 만들어져 있음
+                highlighted_title = note.search_title_highlight
+                preview = note.search_snippet
+            else:
+                # 제목 하이라이트
+                highlighted_title = note.title
+                for term in search_terms:
+                    highlighted_title = self.processor.highlight_search_terms(
+                        highlighted_title, [term]
+                    )
+                
+                # 내용 미리보기 하이라이트
+                preview = self.processor.create_preview(note.content, 200)
+                for term in search_terms:
+                    preview = self.processor.highlight_search_terms(preview, [term])
             
             highlighted_notes.append({
                 "id": note.id,